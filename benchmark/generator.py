@@ -0,0 +1,137 @@
+"""
+Erzeugt synthetische Instanzen für Benchmarks im Eingabedaten-Format
+(wie MainWindow.sammle_eingabedaten), als JSON-Datei reproduzierbar abgelegt.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmark.generator --standard [--ordner benchmark/instanzen]
+    python -m benchmark.generator --kandidaten 200 --korrektoren 25 --muster zufall --slots 16
+"""
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+STANDARD_ORDNER = Path(__file__).parent / "instanzen"
+
+# Verfügbarkeitsmuster der Korrektoren
+MUSTER = ("voll", "zufall", "getrennt")
+
+# Das Modell kennt genau zwei Prüfungstage (siehe Instanz.aus_eingabedaten)
+TAGE = (2,)
+
+# Standard-Suite: (Kandidaten, Korrektoren, Muster, Slots je Tag)
+# (je Tag mindestens so viele Slots wie Prüfungen, sonst lehnt die Vorprüfung ab)
+STANDARD_SUITE = [
+    (16, 3, "voll", 8),
+    (16, 5, "voll", 8),
+    (16, 5, "zufall", 10),
+    (40, 8, "zufall", 20),
+    (60, 12, "getrennt", 32),
+    (100, 15, "zufall", 50),
+    (200, 25, "zufall", 100),
+    (500, 40, "getrennt", 250),
+    (1000, 60, "zufall", 500),
+]
+
+
+def zeitslots(anzahl, beginn="08:00", schritt_min=None):
+    """anzahl Uhrzeiten ab beginn; ohne Schrittweite passen sie in einen 12-Stunden-Tag."""
+    schritt_min = schritt_min or max(1, min(60, 12 * 60 // max(anzahl, 1)))
+    h, m = map(int, beginn.split(":"))
+    start = h * 60 + m
+    slots = []
+    for i in range(anzahl):
+        minuten = start + i * schritt_min
+        if minuten >= 24 * 60:
+            break
+        slots.append(f"{minuten // 60:02d}:{minuten % 60:02d}")
+    return slots
+
+
+def verfuegbarkeiten(korrektoren, tage, muster, rng, quote=0.7):
+    """
+    voll:     alle Korrektoren an allen Tagen
+    zufall:   jeder Tag mit Wahrscheinlichkeit quote (mindestens ein Tag je Korrektor)
+    getrennt: je ein Drittel nur am ersten, nur am letzten bzw. an allen Tagen
+    An jedem Tag sind mindestens drei Korrektoren anwesend (Nebenbedingung des Modells).
+    """
+    if muster not in MUSTER:
+        raise ValueError(f"unbekanntes Muster {muster!r} (erlaubt: {', '.join(MUSTER)})")
+
+    plan = {}
+    for i, name in enumerate(korrektoren):
+        if muster == "voll":
+            plan[name] = list(tage)
+        elif muster == "zufall":
+            plan[name] = [t for t in tage if rng.random() < quote] or [rng.choice(tage)]
+        else:
+            plan[name] = [[tage[0]], [tage[-1]], list(tage)][i % 3]
+
+    for t in tage:
+        anwesend = [k for k in korrektoren if t in plan[k]]
+        fehlend = [k for k in korrektoren if t not in plan[k]]
+        rng.shuffle(fehlend)
+        for k in fehlend[:max(0, 3 - len(anwesend))]:
+            plan[k] = [d for d in tage if d in plan[k] or d == t]
+    return plan
+
+
+def erzeuge_instanz(kandidaten, korrektoren, tage=2, muster="voll", slots=8, seed=0) -> dict:
+    if tage not in TAGE:
+        raise ValueError(f"{tage} Prüfungstage werden nicht unterstützt (nur {', '.join(map(str, TAGE))})")
+    rng = random.Random(seed)
+    beginn = date(2030, 1, 7)
+    pruefungstage = [(beginn + timedelta(days=7 * i)).isoformat() for i in range(tage)]
+    namen = [f"Korrektor {i + 1}" for i in range(korrektoren)]
+
+    return {
+        "verfügbarkeiten": verfuegbarkeiten(namen, pruefungstage, muster, rng),
+        "kandidaten": {i + 1: f"Prüfling {i + 1}" for i in range(kandidaten)},
+        "pruefungstage": pruefungstage,
+        "anzahl_korrektoren_pro_klausur": 2,
+        "zeitslots": [zeitslots(slots) for _ in range(tage)]
+    }
+
+
+def dateiname(kandidaten, korrektoren, tage, muster, slots, seed) -> str:
+    return f"k{kandidaten}_p{korrektoren}_t{tage}_{muster}_s{slots}_seed{seed}.json"
+
+
+def speichere_instanz(eingabedaten, pfad):
+    pfad = Path(pfad)
+    pfad.parent.mkdir(parents=True, exist_ok=True)
+    with open(pfad, "w", encoding="utf-8") as f:
+        json.dump(eingabedaten, f, indent=2, ensure_ascii=False)
+    return pfad
+
+
+def lade_instanz(pfad) -> dict:
+    with open(pfad, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetische Benchmark-Instanzen erzeugen.")
+    parser.add_argument("--standard", action="store_true", help="die Standard-Suite erzeugen")
+    parser.add_argument("--kandidaten", type=int, default=16)
+    parser.add_argument("--korrektoren", type=int, default=5)
+    parser.add_argument("--tage", type=int, choices=TAGE, default=2, help="Prüfungstage (das Modell kennt nur 2)")
+    parser.add_argument("--muster", choices=MUSTER, default="voll")
+    parser.add_argument("--slots", type=int, default=8, help="Zeitslots je Tag")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ordner", type=Path, default=STANDARD_ORDNER)
+    args = parser.parse_args(argv)
+
+    if args.standard:
+        auftraege = [(k, p, 2, m, s, args.seed) for k, p, m, s in STANDARD_SUITE]
+    else:
+        auftraege = [(args.kandidaten, args.korrektoren, args.tage, args.muster, args.slots, args.seed)]
+
+    for k, p, t, m, s, seed in auftraege:
+        pfad = speichere_instanz(erzeuge_instanz(k, p, t, m, s, seed), args.ordner / dateiname(k, p, t, m, s, seed))
+        print(pfad)
+
+
+if __name__ == "__main__":
+    main()
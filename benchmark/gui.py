@@ -0,0 +1,153 @@
+"""
+GUI-Benchmark ohne Bildschirm (Qt-Plattform 'offscreen'): misst für wachsende Anzahl
+Prüflinge N den Fensteraufbau, das Übernehmen einer Prüflingsliste, das Füllen der
+Ergebnistabellen und das Laden einer Sitzung, jeweils mit Perzentilen.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmark.gui
+    python -m benchmark.gui --n 16 --n 1000 --n 10000 --wiederholungen 50 --ausgabe gui.jsonl
+"""
+import os
+
+# Vor dem ersten Qt-Import setzen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from benchmark.generator import erzeuge_instanz
+from modell import Ergebnis, Instanz, berechne_statistik
+
+STANDARD_N = [16, 100, 1000, 5000]
+
+
+def synthetisches_ergebnis(n, korrektoren=10) -> Ergebnis:
+    """
+    Ergebnis mit n Prüflingen ohne Solver: reihum zwei Korrektoren, Tage abwechselnd.
+    Mehr Prüflinge als Zeitslots (höchstens eine Minute je Slot) bleiben ohne Termin.
+    """
+    instanz = Instanz.aus_eingabedaten(erzeuge_instanz(n, korrektoren, slots=(n + 1) // 2))
+    k = np.arange(n)
+    matrix = np.zeros((n, korrektoren), dtype=np.uint8)
+    matrix[k, k % korrektoren] = 1
+    matrix[k, (k + 1) % korrektoren] = 1
+    tag = (k % 2).astype(np.int8)
+    slot = np.where(k // 2 < len(instanz.zeitslots[0]), k // 2, -1).astype(np.int16)
+    return Ergebnis(
+        instanz=instanz,
+        zuordnung=array("B", matrix.tobytes()),
+        tag=array("b", tag.tobytes()),
+        slot=array("h", slot.tobytes()),
+        status="Optimal",
+        statistik=berechne_statistik(matrix, tag, 2)
+    )
+
+
+def session_datei(n, ordner) -> Path:
+    pfad = Path(ordner) / f"session_{n}.json"
+    korrektoren = [{"name": f"Korrektor {i + 1}", "checked": i < 5} for i in range(10)]
+    with open(pfad, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": 2,
+            "geometry": {"x": 0, "y": 0, "width": 1000, "height": 700},
+            "prueflinge": [f"Prüfling {i + 1}" for i in range(n)],
+            "korrektoren_tag1": korrektoren,
+            "korrektoren_tag2": korrektoren,
+            "datum1": "2030-01-07",
+            "datum2": "2030-01-14"
+        }, f)
+    return pfad
+
+
+def messen(app, aktion, wiederholungen, vorbereitung=None):
+    """Zeiten in ms; jede Messung schließt die anstehenden Qt-Events (Layout, Zeichnen) ein."""
+    zeiten = []
+    for _ in range(wiederholungen):
+        if vorbereitung:
+            vorbereitung()
+        app.processEvents()
+        start = time.perf_counter()
+        aktion()
+        app.processEvents()
+        zeiten.append((time.perf_counter() - start) * 1000)
+    return zeiten
+
+
+def perzentile(zeiten) -> dict:
+    if len(zeiten) < 2:
+        return {"p50": zeiten[0], "p90": zeiten[0], "p99": zeiten[0], "max": zeiten[0]}
+    q = statistics.quantiles(zeiten, n=100, method="inclusive")
+    return {"p50": statistics.median(zeiten), "p90": q[89], "p99": q[98], "max": max(zeiten)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI-Latenzen ohne Bildschirm messen.")
+    parser.add_argument("--n", type=int, action="append", help=f"Anzahl Prüflinge (Standard: {STANDARD_N})")
+    parser.add_argument("--wiederholungen", type=int, default=20)
+    parser.add_argument("--ausgabe", type=Path, help="Ergebnisse zusätzlich als JSON-Zeilen")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    import pvihk
+
+    fenster = []
+
+    def fenster_bauen():
+        w = pvihk.MainWindow()
+        w.show()
+        fenster.append(w)
+
+    def fenster_schliessen():
+        while fenster:
+            w = fenster.pop()
+            w.hide()
+            w.deleteLater()
+
+    zeilen = [{"szenario": "fenster", "n": None,
+               **perzentile(messen(app, fenster_bauen, args.wiederholungen, fenster_schliessen))}]
+    fenster_schliessen()
+
+    w = pvihk.MainWindow()
+    w.show()
+
+    with tempfile.TemporaryDirectory() as ordner:
+        for n in args.n or STANDARD_N:
+            namen = [f"Prüfling {i + 1}" for i in range(n)]
+            ergebnis = synthetisches_ergebnis(n)
+            session = session_datei(n, ordner)
+
+            zeiten = messen(app, lambda: w.kandidaten_uebernehmen(namen), args.wiederholungen)
+            zeilen.append({"szenario": "liste", "n": n, "angezeigt": w.kandidaten_modell.rowCount(), **perzentile(zeiten)})
+
+            zeiten = messen(app, lambda: w.verarbeite_ergebnis(ergebnis), args.wiederholungen)
+            zeilen.append({"szenario": "tabellen", "n": n,
+                           "angezeigt": sum(m.rowCount() for m in w.ergebnis_modelle), **perzentile(zeiten)})
+
+            zeiten = messen(app, lambda: w.session_laden(session), args.wiederholungen)
+            zeilen.append({"szenario": "sitzung", "n": n, "angezeigt": w.kandidaten_modell.rowCount(), **perzentile(zeiten)})
+
+    print(f"{'Szenario':<10} {'N':>6} {'angezeigt':>9} {'p50[ms]':>9} {'p90[ms]':>9} {'p99[ms]':>9} {'max[ms]':>9}")
+    for z in zeilen:
+        n = z["n"] if z["n"] is not None else "-"
+        angezeigt = z.get("angezeigt", "-")
+        print(f"{z['szenario']:<10} {n:>6} {angezeigt:>9} {z['p50']:9.1f} {z['p90']:9.1f} {z['p99']:9.1f} {z['max']:9.1f}")
+
+    if args.ausgabe:
+        with open(args.ausgabe, "a", encoding="utf-8") as f:
+            for z in zeilen:
+                f.write(json.dumps(z, ensure_ascii=False) + "\n")
+
+    w.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark-Läufer: löst Instanzen (JSON im Eingabedaten-Format) mit jeder Engine und
+Konfiguration und schreibt Modellaufbau-/Solverzeit, Status, Zielwert und Gap.
+
+Jeder Lauf bekommt einen frischen Prozess (saubere Zeit- und Speicherwerte).
+Kein Fenster nötig, läuft also auch auf einem Server.
+
+Aufruf (aus dem Projektordner):
+    python -m benchmark.lauf benchmark/instanzen
+    python -m benchmark.lauf benchmark/instanzen --konfig zeitlimit=5 --konfig zeitlimit=30 --wiederholungen 3
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from benchmark.generator import lade_instanz
+from optimierung import ENGINES
+
+ERGEBNIS_ORDNER = Path(__file__).parent / "ergebnisse"
+
+
+def parse_konfig(text) -> dict:
+    """'zeitlimit=5,profil=false' -> {'zeitlimit': 5, 'profil': False}"""
+    konfig = {}
+    for teil in filter(None, text.split(",")):
+        schluessel, _, wert = teil.partition("=")
+        try:
+            konfig[schluessel.strip()] = json.loads(wert)
+        except json.JSONDecodeError:
+            konfig[schluessel.strip()] = wert.strip()
+    return konfig
+
+
+def konfig_name(konfig) -> str:
+    return ",".join(f"{k}={v}" for k, v in sorted(konfig.items())) or "standard"
+
+
+def ein_lauf(pfad, engine, konfig) -> dict:
+    """Läuft im Kindprozess: eine Instanz mit einer Engine/Konfiguration lösen."""
+    eingabedaten = lade_instanz(pfad)
+    zeile = {
+        "instanz": Path(pfad).name,
+        "kandidaten": len(eingabedaten["kandidaten"]),
+        "korrektoren": len(eingabedaten["verfügbarkeiten"]),
+        "engine": engine,
+        "konfig": konfig_name(konfig),
+    }
+    try:
+        ergebnis = ENGINES[engine](eingabedaten, **konfig)
+    except Exception as e:
+        zeile["status"] = f"Fehler: {e}"
+        return zeile
+
+    messung = ergebnis.messung
+    phasen = messung.get("phasen", {})
+    solver = messung.get("solver", {})
+    zeile.update({
+        "status": ergebnis.status,
+        "modellaufbau_s": phasen.get("modellaufbau", {}).get("wand"),
+        "solver_s": phasen.get("solver", {}).get("wand"),
+        "extraktion_s": phasen.get("extraktion", {}).get("wand"),
+        "zielwert": solver.get("zielwert"),
+        "gap": solver.get("gap"),
+        **messung.get("modell", {}),
+        "speicher_mb": messung.get("speicher_mb"),
+        "speicher_solver_mb": messung.get("speicher_solver_mb"),
+    })
+    return zeile
+
+
+def finde_instanzen(pfade):
+    dateien = []
+    for pfad in map(Path, pfade):
+        dateien += sorted(pfad.glob("*.json")) if pfad.is_dir() else [pfad]
+    return dateien
+
+
+def zusammenfassen(zeilen):
+    """Mittelwerte über Wiederholungen je (Instanz, Engine, Konfiguration)."""
+    gruppen = {}
+    for z in zeilen:
+        gruppen.setdefault((z["instanz"], z["engine"], z["konfig"]), []).append(z)
+
+    zusammen = []
+    for (instanz, engine, konfig), gruppe in gruppen.items():
+        def mittel(feld):
+            werte = [z[feld] for z in gruppe if z.get(feld) is not None]
+            return statistics.fmean(werte) if werte else None
+        zusammen.append({
+            "instanz": instanz, "engine": engine, "konfig": konfig,
+            "kandidaten": gruppe[0]["kandidaten"], "korrektoren": gruppe[0]["korrektoren"],
+            "status": gruppe[-1]["status"], "laeufe": len(gruppe),
+            "modellaufbau_s": mittel("modellaufbau_s"), "solver_s": mittel("solver_s"),
+            "zielwert": mittel("zielwert"), "gap": mittel("gap"),
+        })
+    return zusammen
+
+
+def vergleichstabelle(zusammen) -> str:
+    def zahl(wert, format_):
+        breite = int(format_.split(".")[0])
+        return format(wert, format_) if wert is not None else "-".rjust(breite)
+
+    kopf = f"{'Instanz':<40} {'Engine/Konfig':<24} {'Aufbau[s]':>10} {'Solver[s]':>10} {'Zielwert':>10} {'Gap':>8}  Status"
+    zeilen = [kopf, "-" * len(kopf)]
+    for z in sorted(zusammen, key=lambda z: (z["kandidaten"], z["korrektoren"], z["instanz"], z["engine"], z["konfig"])):
+        zeilen.append(
+            f"{z['instanz'][:40]:<40} {(z['engine'] + '/' + z['konfig'])[:24]:<24} "
+            f"{zahl(z['modellaufbau_s'], '10.3f')} {zahl(z['solver_s'], '10.3f')} "
+            f"{zahl(z['zielwert'], '10.2f')} {zahl(z['gap'], '8.2%')}  {z['status']}"
+        )
+    return "\n".join(zeilen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimierer auf Benchmark-Instanzen messen.")
+    parser.add_argument("instanzen", nargs="+", help="JSON-Dateien oder Ordner mit JSON-Dateien")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="Engine(s), Standard: alle")
+    parser.add_argument("--konfig", action="append", type=parse_konfig,
+                        help="Konfiguration als schluessel=wert[,...], mehrfach angebbar")
+    parser.add_argument("--wiederholungen", type=int, default=1)
+    parser.add_argument("--ausgabe", type=Path, help="JSON-Lines-Datei für alle Einzelläufe")
+    parser.add_argument("--csv", type=Path, help="Vergleichstabelle zusätzlich als CSV")
+    args = parser.parse_args(argv)
+
+    dateien = finde_instanzen(args.instanzen)
+    if not dateien:
+        parser.error("keine Instanzen gefunden")
+    engines = args.engine or sorted(ENGINES)
+    konfigs = args.konfig or [{}]
+    ausgabe = args.ausgabe or ERGEBNIS_ORDNER / f"lauf_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+    ausgabe.parent.mkdir(parents=True, exist_ok=True)
+
+    zeilen = []
+    ctx = multiprocessing.get_context("spawn")
+    with open(ausgabe, "w", encoding="utf-8") as f:
+        for pfad in dateien:
+            for engine in engines:
+                for konfig in konfigs:
+                    for wiederholung in range(args.wiederholungen):
+                        # Nacheinander, damit sich die Läufe die CPU nicht teilen
+                        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                            zeile = pool.submit(ein_lauf, str(pfad), engine, konfig).result()
+                        zeile["wiederholung"] = wiederholung
+                        zeilen.append(zeile)
+                        f.write(json.dumps(zeile, ensure_ascii=False) + "\n")
+                        f.flush()
+                        print(f"{zeile['instanz']} {engine}/{zeile['konfig']}: {zeile['status']} "
+                              f"({zeile.get('solver_s') or 0:.2f} s)", file=sys.stderr)
+
+    zusammen = zusammenfassen(zeilen)
+    print(vergleichstabelle(zusammen))
+    print(f"\nEinzelläufe: {ausgabe}", file=sys.stderr)
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            schreiber = csv.DictWriter(f, fieldnames=list(zusammen[0]), delimiter=";")
+            schreiber.writeheader()
+            schreiber.writerows(zusammen)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,159 @@
+"""
+Differenzieller Qualitätsvergleich: zufällige Instanzen laufen parallel durch jede Engine,
+jeder Plan wird gegen die Regeln geprüft (validierung.pruefe_plan) und mit derselben
+Zielfunktion bewertet. Der Gap bezieht sich auf die exakte Referenz (MILP mit langem Zeitlimit).
+
+Aufruf (aus dem Projektordner):
+    python -m benchmark.qualitaet --anzahl 5
+    python -m benchmark.qualitaet --engine milp:zeitlimit=2 --referenz milp:zeitlimit=120 --prozesse 1
+
+Mit mehreren Prozessen teilen sich die Läufe die CPU; für saubere Zeiten --prozesse 1.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from benchmark.generator import MUSTER, erzeuge_instanz
+from benchmark.lauf import ENGINES, konfig_name, parse_konfig
+from validierung import bewerte_plan, pruefe_plan
+
+# Größenklassen (Kandidaten, Korrektoren)
+KLASSEN = [(16, 5), (40, 8), (100, 15), (200, 25)]
+
+
+def parse_engine(text):
+    """'milp:zeitlimit=2' -> ('milp', {'zeitlimit': 2})"""
+    name, _, konfig = text.partition(":")
+    if name not in ENGINES:
+        raise argparse.ArgumentTypeError(f"unbekannte Engine {name!r} (bekannt: {', '.join(sorted(ENGINES))})")
+    return name, parse_konfig(konfig)
+
+
+def zufallsinstanzen(anzahl, klassen, seed):
+    rng = random.Random(seed)
+    instanzen = []
+    for kandidaten, korrektoren in klassen:
+        for _ in range(anzahl):
+            muster = rng.choice(MUSTER)
+            slots = rng.randint((kandidaten + 1) // 2, kandidaten // 2 + 4)
+            instanz_seed = rng.randrange(1 << 30)
+            instanzen.append((
+                f"k{kandidaten}_p{korrektoren}",
+                f"{muster}_s{slots}_seed{instanz_seed}",
+                erzeuge_instanz(kandidaten, korrektoren, 2, muster, slots, instanz_seed)
+            ))
+    return instanzen
+
+
+def pruefe_lauf(klasse, instanz, eingabedaten, engine, konfig) -> dict:
+    """Läuft im Kindprozess: lösen, prüfen, bewerten."""
+    zeile = {"klasse": klasse, "instanz": instanz, "engine": f"{engine}/{konfig_name(konfig)}"}
+    try:
+        ergebnis = ENGINES[engine](eingabedaten, **konfig)
+    except Exception as e:
+        zeile.update(status=f"Fehler: {e}", verstoesse=[], zielwert=None, zeit=None, optimal=False)
+        return zeile
+    phasen = ergebnis.messung.get("phasen", {})
+    zeile.update(
+        status=ergebnis.status,
+        optimal=ergebnis.status == "Optimal",
+        zeit=sum(p["wand"] for p in phasen.values()),
+        verstoesse=pruefe_plan(ergebnis),
+        zielwert=bewerte_plan(ergebnis)
+    )
+    return zeile
+
+
+def gaps_berechnen(zeilen, referenz):
+    """Gap je Lauf relativ zur Referenz auf derselben Instanz."""
+    ref = {z["instanz"]: z for z in zeilen if z["engine"] == referenz}
+    for z in zeilen:
+        r = ref.get(z["instanz"])
+        if r is None or r["zielwert"] is None or z["zielwert"] is None:
+            z["gap"] = None
+        else:
+            z["gap"] = (z["zielwert"] - r["zielwert"]) / max(abs(r["zielwert"]), 1e-9)
+            z["referenz_optimal"] = r["optimal"]
+
+
+def bericht(zeilen) -> str:
+    def fmt(wert, format_):
+        breite = int(format_.split(".")[0])
+        return format(wert, format_) if wert is not None else "-".rjust(breite)
+
+    kopf = (f"{'Klasse':<12} {'Engine':<26} {'n':>3} {'Zeit Ø[s]':>10} {'Zeit med':>9} "
+            f"{'Gap Ø':>8} {'Gap max':>8} {'ungültig':>9} {'Fehler':>7}")
+    ausgabe = [kopf, "-" * len(kopf)]
+    gruppen = {}
+    for z in zeilen:
+        gruppen.setdefault((z["klasse"], z["engine"]), []).append(z)
+
+    def klassen_schluessel(item):
+        (klasse, engine), _ = item
+        kandidaten, korrektoren = klasse[1:].split("_p")
+        return int(kandidaten), int(korrektoren), engine
+
+    for (klasse, engine), gruppe in sorted(gruppen.items(), key=klassen_schluessel):
+        zeiten = [z["zeit"] for z in gruppe if z["zeit"] is not None]
+        gaps = [z["gap"] for z in gruppe if z.get("gap") is not None]
+        ausgabe.append(
+            f"{klasse:<12} {engine[:26]:<26} {len(gruppe):>3} "
+            f"{fmt(statistics.fmean(zeiten) if zeiten else None, '10.3f')} "
+            f"{fmt(statistics.median(zeiten) if zeiten else None, '9.3f')} "
+            f"{fmt(statistics.fmean(gaps) if gaps else None, '8.2%')} "
+            f"{fmt(max(gaps) if gaps else None, '8.2%')} "
+            f"{sum(1 for z in gruppe if z['verstoesse']):>9} "
+            f"{sum(1 for z in gruppe if z['status'].startswith('Fehler')):>7}"
+        )
+
+    nicht_optimal = sum(1 for z in zeilen if z.get("referenz_optimal") is False)
+    if nicht_optimal:
+        ausgabe.append(f"\nAchtung: bei {nicht_optimal} Läufen war die Referenz selbst nicht optimal "
+                       f"(Gap dann nur eine Schätzung).")
+    for z in zeilen:
+        for verstoss in z["verstoesse"][:3]:
+            ausgabe.append(f"{z['engine']} {z['klasse']} {z['instanz']}: {verstoss}")
+    return "\n".join(ausgabe)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Planqualität schneller Engines gegen das exakte MILP vergleichen.")
+    parser.add_argument("--engine", action="append", type=parse_engine, metavar="NAME[:KONFIG]",
+                        help="zu prüfende Engine, mehrfach angebbar (Standard: milp:zeitlimit=2)")
+    parser.add_argument("--referenz", type=parse_engine, default=("milp", {"zeitlimit": 60}), metavar="NAME[:KONFIG]",
+                        help="exakte Referenz (Standard: milp:zeitlimit=60)")
+    parser.add_argument("--anzahl", type=int, default=3, help="Instanzen je Größenklasse")
+    parser.add_argument("--klasse", action="append", metavar="KANDIDATEN:KORREKTOREN",
+                        type=lambda t: tuple(map(int, t.split(":"))), help="Größenklasse, mehrfach angebbar")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--prozesse", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    engines = [args.referenz] + (args.engine or [("milp", {"zeitlimit": 2})])
+    referenz = f"{args.referenz[0]}/{konfig_name(args.referenz[1])}"
+    instanzen = zufallsinstanzen(args.anzahl, args.klasse or KLASSEN, args.seed)
+
+    zeilen = []
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.prozesse, mp_context=ctx) as pool:
+        auftraege = [
+            pool.submit(pruefe_lauf, klasse, name, eingabedaten, engine, konfig)
+            for klasse, name, eingabedaten in instanzen
+            for engine, konfig in engines
+        ]
+        for nummer, auftrag in enumerate(as_completed(auftraege), start=1):
+            zeilen.append(auftrag.result())
+            print(f"\r{nummer}/{len(auftraege)} Läufe", end="", flush=True)
+    print()
+
+    gaps_berechnen(zeilen, referenz)
+    print(bericht(zeilen))
+    return 1 if any(z["verstoesse"] for z in zeilen) else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    raise SystemExit(main())
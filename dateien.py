@@ -0,0 +1,225 @@
+import codecs
+import csv
+import itertools
+import os
+import tempfile
+
+
+KANDIDATEN_ENDUNGEN = (".txt", ".csv", ".xlsx")
+BLOCKGROESSE = 2000     # Prüflinge je Block beim Einlesen
+
+# Spaltenüberschriften in Exporten (klein geschrieben)
+SPALTE_NAME = {"name", "prüfling", "pruefling", "teilnehmer", "kandidat"}
+SPALTE_NACHNAME = {"nachname", "familienname"}
+SPALTE_VORNAME = {"vorname"}
+SPALTE_NUMMER = {"nummer", "nr", "id", "prüflingsnummer", "prueflingsnummer", "teilnehmernummer", "pnr"}
+
+
+def lese_kandidatendatei(dateiname) -> list[str]:
+    """
+    Liest eine Prüflingsliste (eine Zeile je Prüfling, z.B. prueflinge.txt, oder CSV/XLSX).
+    Leerzeilen bleiben erhalten, damit die Liste 1:1 in die GUI übernommen werden kann.
+    """
+    return [name for block, _ in lese_kandidaten_bloecke(dateiname) for name in block]
+
+
+def erkenne_kodierung(rohdaten: bytes) -> str:
+    """BOM, sonst UTF-8 falls der Anfang gültig ist, sonst Windows-1252 (Excel-Exporte)."""
+    if rohdaten.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if rohdaten.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # final=False: ein am Ende abgeschnittenes Zeichen ist kein Fehler
+        codecs.getincrementaldecoder("utf-8")().decode(rohdaten, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def erkenne_trennzeichen(beispiel: str) -> str:
+    try:
+        return csv.Sniffer().sniff(beispiel, delimiters=";,\t|").delimiter
+    except csv.Error:
+        return ";"
+
+
+def _spalte(kopf, namen):
+    return next((i for i, text in enumerate(kopf) if text in namen), None)
+
+
+def _zeilen_zu_namen(zeilen):
+    """
+    Macht aus Tabellenzeilen (CSV/XLSX) Prüflingsnamen. Mit Kopfzeile werden Name bzw.
+    Nachname/Vorname und Nummer wie in prueflinge.txt zusammengesetzt ('Nachname, Vorname (Nummer)'),
+    ohne Kopfzeile werden alle Spalten mit ', ' verbunden.
+    """
+    zeilen = iter(zeilen)
+    erste = next(zeilen, None)
+    if erste is None:
+        return
+    kopf = [str(zelle or "").strip().casefold() for zelle in erste]
+    name, nachname = _spalte(kopf, SPALTE_NAME), _spalte(kopf, SPALTE_NACHNAME)
+    vorname, nummer = _spalte(kopf, SPALTE_VORNAME), _spalte(kopf, SPALTE_NUMMER)
+    if nachname is None and vorname is not None:
+        nachname, name = name, None   # 'Name' neben 'Vorname' ist der Nachname
+    if name is None and nachname is None:
+        for zeile in itertools.chain([erste], zeilen):
+            yield ", ".join(text for text in (str(zelle or "").strip() for zelle in zeile) if text)
+        return
+
+    def zelle(zeile, i):
+        if i is None or i >= len(zeile) or zeile[i] is None:
+            return ""
+        wert = zeile[i]
+        # Excel liefert Nummern als float
+        if isinstance(wert, float) and wert.is_integer():
+            wert = int(wert)
+        return str(wert).strip()
+
+    for zeile in zeilen:
+        if name is not None:
+            text = zelle(zeile, name)
+        else:
+            text = ", ".join(teil for teil in (zelle(zeile, nachname), zelle(zeile, vorname)) if teil)
+        if text and nummer is not None and zelle(zeile, nummer):
+            text += f" ({zelle(zeile, nummer)})"
+        yield text
+
+
+def _bloecke(namen, blockgroesse, position):
+    block = []
+    for name in namen:
+        block.append(name)
+        if len(block) >= blockgroesse:
+            yield block, position()
+            block = []
+    if block:
+        yield block, position()
+
+
+def lese_kandidaten_bloecke(dateiname, blockgroesse=BLOCKGROESSE):
+    """
+    Liest eine Prüflingsliste (.txt, .csv oder .xlsx) stückweise: liefert (Namen, Anteil gelesen 0..1)
+    je Block, damit große Exporte ohne Wartezeit angezeigt werden können.
+    Kodierung und Trennzeichen werden erkannt; für .xlsx wird openpyxl benötigt (ValueError sonst).
+    """
+    endung = os.path.splitext(dateiname)[1].lower()
+
+    if endung == ".xlsx":
+        try:
+            import openpyxl
+        except ImportError:
+            raise ValueError("Excel-Dateien (.xlsx) können nur mit installiertem openpyxl gelesen werden")
+        mappe = openpyxl.load_workbook(dateiname, read_only=True, data_only=True)
+        try:
+            blatt = mappe.active
+            gesamt = max(1, blatt.max_row or 1)
+            zeilen = blatt.iter_rows(values_only=True)
+            gelesen = 0
+
+            def gezaehlt():
+                nonlocal gelesen
+                for zeile in zeilen:
+                    gelesen += 1
+                    yield zeile
+
+            yield from _bloecke(_zeilen_zu_namen(gezaehlt()), blockgroesse, lambda: min(1.0, gelesen / gesamt))
+        finally:
+            mappe.close()
+        return
+
+    groesse = max(1, os.path.getsize(dateiname))
+    with open(dateiname, "rb") as f:
+        kodierung = erkenne_kodierung(f.read(64 * 1024))
+
+    with open(dateiname, "r", encoding=kodierung, errors="replace", newline="") as f:
+        def position():
+            return min(1.0, f.buffer.tell() / groesse)
+
+        if endung == ".csv":
+            trennzeichen = erkenne_trennzeichen(f.read(64 * 1024))
+            f.seek(0)
+            namen = _zeilen_zu_namen(csv.reader(f, delimiter=trennzeichen))
+        else:
+            namen = (line.strip() for line in f)
+        yield from _bloecke(namen, blockgroesse, position)
+
+
+KORREKTOREN_VERSION = 3
+
+
+def lese_korrektorendatei(dateiname, anzahl_tage=2) -> list[tuple[str, list[bool]]]:
+    """
+    Liest eine Korrektorenliste:
+        '# version=3' mit Zeilen 'Name;0|1;0|1' (ein Feld je Prüfungstag)
+        '# version=2' mit Zeilen 'Name;0|1' (gilt für alle Tage)
+    Liefert (Name, [anwesend je Tag]); wirft ValueError bei inkompatibler Version.
+    """
+    with open(dateiname, "r", encoding="utf-8") as f:
+        zeilen = [line.strip() for line in f if line.strip()]
+
+    version = 1
+    if zeilen and zeilen[0].startswith("# version="):
+        try:
+            version = int(zeilen[0].split("=")[1])
+        except ValueError:
+            version = 0  # ungültige Versionsangabe
+        zeilen.pop(0)  # Entferne die Versionszeile
+
+    if version not in (2, 3):
+        raise ValueError(f"inkompatible Version {version} (erwartet: 2 oder 3)")
+
+    korrektoren = []
+    for zeile in zeilen:
+        parts = [teil.strip() for teil in zeile.split(";")]
+        if version == 2:
+            tage = [len(parts) > 1 and parts[1] == "1"] * anzahl_tage
+        else:
+            tage = [len(parts) > 1 + t and parts[1 + t] == "1" for t in range(anzahl_tage)]
+        korrektoren.append((parts[0], tage))
+    return korrektoren
+
+
+def schreibe_korrektorendatei(dateiname, korrektoren) -> None:
+    """Schreibt (Name, [anwesend je Tag]) im Format '# version=3'."""
+    with open(dateiname, "w", encoding="utf-8") as f:
+        f.write(f"# version={KORREKTOREN_VERSION}\n")
+        for name, tage in korrektoren:
+            f.write(";".join([name] + ["1" if da else "0" for da in tage]) + "\n")
+
+
+def ist_korrektorendatei(dateiname) -> bool:
+    """Korrektorenlisten erkennt man an der Versionszeile in der ersten Zeile."""
+    try:
+        with open(dateiname, "r", encoding="utf-8") as f:
+            return f.readline().startswith("# version=")
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def schreibe_atomar(dateiname, daten: bytes) -> None:
+    """
+    Schreibt erst in eine temporäre Datei im Zielordner und benennt sie dann um.
+    Leser sehen so immer entweder die alte oder die vollständige neue Datei.
+    """
+    ordner = os.path.dirname(os.path.abspath(dateiname))
+    fd, tmp_pfad = tempfile.mkstemp(dir=ordner, prefix=".pvihk_", suffix=".tmp")
+    try:
+        # mkstemp legt die Datei nur für den Besitzer lesbar an
+        try:
+            modus = os.stat(dateiname).st_mode & 0o777
+        except FileNotFoundError:
+            modus = 0o644
+        os.chmod(tmp_pfad, modus)
+        with os.fdopen(fd, "wb") as f:
+            f.write(daten)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_pfad, dateiname)
+    except BaseException:
+        try:
+            os.remove(tmp_pfad)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,25 @@
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QPlainTextEdit, QVBoxLayout
+
+from messung import messung_als_text
+
+
+class DiagnoseDialog(QDialog):
+    """Zeigt die Messwerte (Laufzeiten je Phase, Modellgröße, Speicher) des letzten Laufs."""
+
+    def __init__(self, messung: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnose")
+        self.resize(640, 420)
+
+        text = QPlainTextEdit(self)
+        text.setReadOnly(True)
+        text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        text.setPlainText(messung_als_text(messung) if messung else "Noch keine Messwerte vorhanden.")
+
+        knoepfe = QDialogButtonBox(QDialogButtonBox.Close, self)
+        knoepfe.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(text)
+        layout.addWidget(knoepfe)
@@ -0,0 +1,106 @@
+"""
+Einstellungen (~/.preferences.json) an einer Stelle: einmal lesen, Werte im Speicher halten,
+Änderungen per Signal melden und gesammelt, atomar zurückschreiben.
+Hauptfenster und Einstellungsdialog arbeiten auf demselben Objekt, es gibt nur einen Schreiber.
+"""
+import json
+import logging
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from dateien import schreibe_atomar
+
+logger = logging.getLogger(__name__)
+
+PREFERENCES_FILE = Path.home() / ".preferences.json"
+VERSION = 2
+SPEICHERN_NACH_MS = 500    # Änderungen innerhalb dieser Zeit landen in einem Schreibvorgang
+
+STANDARD_ZEITSLOTS = [
+    ["09:00", "10:00", "11:00", "12:00", "14:00", "15:00", "16:00", "17:00"],
+    ["09:00", "10:00", "11:00", "12:00", "14:00", "15:00", "16:00", "17:00"]
+]
+
+STANDARD = {
+    "begin1": "09:00",
+    "begin2": "14:00",
+    "dauer1": 60,
+    "dauer2": 60,
+    "zeitslots": STANDARD_ZEITSLOTS
+}
+
+
+def gueltige_zeitslots(zeitslots) -> bool:
+    return isinstance(zeitslots, list) and all(isinstance(z, list) for z in zeitslots)
+
+
+def lese_einstellungen(pfad=PREFERENCES_FILE) -> dict:
+    """Gespeicherte Einstellungen über den Standardwerten; unlesbare oder fremde Versionen ergeben die Standardwerte."""
+    daten = dict(STANDARD)
+    try:
+        with open(pfad, "r", encoding="utf-8") as f:
+            gelesen = json.load(f)
+    except FileNotFoundError:
+        return daten
+    except Exception as e:
+        logger.exception("Fehler beim Laden der Einstellungen: %s", e)
+        return daten
+
+    version = gelesen.get("version", 1)
+    if version != VERSION:
+        logger.warning("Einstellungen nicht geladen: inkompatible Version %s (erwartet: %s)", version, VERSION)
+        return daten
+    if not gueltige_zeitslots(gelesen.get("zeitslots", STANDARD_ZEITSLOTS)):
+        logger.warning("Ungültige Zeitslots in den Einstellungen, Standardwerte werden verwendet")
+        del gelesen["zeitslots"]
+    daten.update(gelesen)
+    return daten
+
+
+class Einstellungen(QObject):
+    """
+    Einstellungen im Speicher. setzen() meldet jede geänderte Einstellung über 'geaendert'
+    (Schlüssel, neuer Wert) und schreibt nach SPEICHERN_NACH_MS; sichern() schreibt sofort.
+    """
+    geaendert = Signal(str, object)
+
+    def __init__(self, pfad=PREFERENCES_FILE, parent=None):
+        super().__init__(parent)
+        self.pfad = Path(pfad)
+        self._daten = lese_einstellungen(self.pfad)
+        self._ausstehend = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SPEICHERN_NACH_MS)
+        self._timer.timeout.connect(self.sichern)
+
+    def wert(self, schluessel, standard=None):
+        return self._daten.get(schluessel, standard)
+
+    def zeitslots(self) -> list[list[str]]:
+        return self._daten["zeitslots"]
+
+    def setzen(self, **werte) -> None:
+        geaendert = {k: v for k, v in werte.items() if self._daten.get(k) != v}
+        if not geaendert:
+            return
+        self._daten.update(geaendert)
+        self._ausstehend = True
+        self._timer.start()
+        for schluessel, wert in geaendert.items():
+            self.geaendert.emit(schluessel, wert)
+
+    def sichern(self) -> None:
+        """Schreibt ausstehende Änderungen sofort."""
+        self._timer.stop()
+        if not self._ausstehend:
+            return
+        self._ausstehend = False
+        try:
+            daten = {**self._daten, "version": VERSION}
+            schreibe_atomar(self.pfad, json.dumps(daten, indent=2, ensure_ascii=False).encode("utf-8"))
+            logger.info("Einstellungen gespeichert in %s", self.pfad)
+        except Exception as e:
+            logger.exception("Fehler beim Speichern der Einstellungen: %s", e)
@@ -0,0 +1,124 @@
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+from modell import Ergebnis
+
+SPALTEN = ["Zeit", "Prüfling", "Korrektoren"]
+HERVORHEBUNG = QColor(255, 236, 150)
+
+
+class ErgebnisModell(QAbstractTableModel):
+    """
+    Termine eines Prüfungstags aus einem Ergebnis (Zeit, Prüfling, Korrektoren).
+    Das Ergebnis wird mit setze_ergebnis in einem Reset übernommen; die Zeilen sind nur
+    Kandidatenindizes, Texte entstehen erst beim Anzeigen der sichtbaren Zellen.
+    Sortieren, Filtern und Hervorheben nach Korrektor arbeiten auf diesen Indizes.
+    """
+
+    def __init__(self, tag, parent=None):
+        super().__init__(parent)
+        self.tag = tag
+        self._ergebnis = None
+        self._matrix = None
+        self._slot = None
+        self._alle = np.empty(0, dtype=np.intp)   # Kandidaten des Tages, nach Slot
+        self._zeilen = self._alle                   # nach Filter und Sortierung
+        self._filter_name = None          # Korrektornamen, überdauern neue Ergebnisse
+        self._hervorheben_name = None
+        self._filter = None               # dieselben als Index ins aktuelle Ergebnis
+        self._hervorheben = None
+        self._sortierung = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._zeilen)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SPALTEN)
+
+    def headerData(self, abschnitt, orientierung, role=Qt.DisplayRole):
+        if orientierung == Qt.Horizontal and role == Qt.DisplayRole:
+            return SPALTEN[abschnitt]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        k = int(self._zeilen[index.row()])
+        if role == Qt.DisplayRole:
+            return self._text(k, index.column())
+        if role == Qt.BackgroundRole and self._hervorheben is not None and self._matrix[k, self._hervorheben]:
+            return QBrush(HERVORHEBUNG)
+        return None
+
+    def _text(self, k, spalte):
+        instanz = self._ergebnis.instanz
+        if spalte == 0:
+            return instanz.zeitslots[self.tag][self._slot[k]]
+        if spalte == 1:
+            return instanz.kandidaten[k]
+        return ", ".join(instanz.korrektoren[p] for p in np.flatnonzero(self._matrix[k]))
+
+    def setze_ergebnis(self, ergebnis: Ergebnis | None):
+        """Übernimmt den ganzen Plan in einem Schritt (None = leeren); Filter und Sortierung bleiben."""
+        self.beginResetModel()
+        self._ergebnis = ergebnis
+        if ergebnis is None:
+            self._matrix = self._slot = None
+            self._alle = np.empty(0, dtype=np.intp)
+        else:
+            self._matrix = ergebnis.matrix()
+            self._slot = np.frombuffer(ergebnis.slot, dtype=np.int16)
+            tag = np.frombuffer(ergebnis.tag, dtype=np.int8)
+            kandidaten = np.flatnonzero((tag == self.tag) & (self._slot >= 0))
+            self._alle = kandidaten[np.argsort(self._slot[kandidaten], kind="stable")]
+        self._filter = self.korrektor_index(self._filter_name)
+        self._hervorheben = self.korrektor_index(self._hervorheben_name)
+        self._zeilen_berechnen()
+        self.endResetModel()
+
+    def leeren(self):
+        self.setze_ergebnis(None)
+
+    def korrektor_index(self, name):
+        if self._ergebnis is None or name not in self._ergebnis.instanz.korrektoren:
+            return None
+        return self._ergebnis.instanz.korrektoren.index(name)
+
+    def filtern(self, korrektor: str | None):
+        """Nur Prüfungen dieses Korrektors zeigen (None = alle)."""
+        self.beginResetModel()
+        self._filter_name = korrektor
+        self._filter = self.korrektor_index(korrektor)
+        self._zeilen_berechnen()
+        self.endResetModel()
+
+    def hervorheben(self, korrektor: str | None):
+        """Prüfungen dieses Korrektors farbig hinterlegen (None = keine)."""
+        self._hervorheben_name = korrektor
+        self._hervorheben = self.korrektor_index(korrektor)
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, len(SPALTEN) - 1),
+                                  [Qt.BackgroundRole])
+
+    def sort(self, spalte, reihenfolge=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sortierung = (spalte, reihenfolge)
+        self._zeilen_berechnen()
+        self.layoutChanged.emit()
+
+    def _zeilen_berechnen(self):
+        zeilen = self._alle
+        if self._filter is not None:
+            zeilen = zeilen[self._matrix[zeilen, self._filter] > 0]
+        if self._sortierung is not None and len(zeilen):
+            spalte, reihenfolge = self._sortierung
+            if spalte == 0:
+                # Nach Slot, nicht nach Uhrzeit-Text
+                schluessel = self._slot[zeilen]
+            else:
+                schluessel = np.array([self._text(int(k), spalte).casefold() for k in zeilen])
+            zeilen = zeilen[np.argsort(schluessel, kind="stable")]
+            if reihenfolge == Qt.DescendingOrder:
+                zeilen = zeilen[::-1]
+        self._zeilen = zeilen
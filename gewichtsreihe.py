@@ -0,0 +1,78 @@
+"""
+Gewichtsreihe: dasselbe Modell mit verschiedenen Gewichtungen von Anwesenheit gegen
+Gleichverteilung lösen und nur die Pareto-optimalen Pläne behalten (weniger Anwesenheitstage
+gegen gleichmäßigere Belastung), damit man einen Kompromiss auswählen kann.
+
+Die Verhältnisse werden in zusammenhängende Abschnitte geteilt, die parallel in eigenen
+Prozessen laufen (siehe MainWindow.gewichtsreihe_starten). Innerhalb eines Abschnitts startet
+jeder Lauf von der Lösung des vorigen, benachbarte Gewichtungen haben meist ähnliche Pläne.
+"""
+import logging
+
+from modell import Ergebnis
+from optimierung import ENGINES, ZEITLIMIT
+from validierung import NichtLoesbar, kennzahlen
+
+logger = logging.getLogger(__name__)
+
+# Gewicht eines Anwesenheitstags je Einheit Abweichung (Standard im Modell: 0.1)
+VERHAELTNISSE = (0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0)
+
+
+def abschnitte(verhaeltnisse, anzahl) -> list[list[float]]:
+    """Aufsteigende Verhältnisse in höchstens anzahl zusammenhängende, etwa gleich lange Abschnitte."""
+    verhaeltnisse = sorted(verhaeltnisse)
+    anzahl = max(1, min(anzahl, len(verhaeltnisse)))
+    basis, rest = divmod(len(verhaeltnisse), anzahl)
+    teile, beginn = [], 0
+    for i in range(anzahl):
+        ende = beginn + basis + (i < rest)
+        teile.append(verhaeltnisse[beginn:ende])
+        beginn = ende
+    return teile
+
+
+def loese_abschnitt(instanz, engine, verhaeltnisse, zeitlimit=ZEITLIMIT, startloesung=None,
+                    fortschritt=None) -> list[Ergebnis]:
+    """
+    Löst die Verhältnisse eines Abschnitts nacheinander, jeden Lauf mit der Lösung des vorigen
+    (der erste mit startloesung) als Start. Findet CBC für ein Verhältnis im Zeitlimit keinen Plan,
+    fehlt nur dieses. Läuft im Rechenprozess; die Verhältnisse stehen in Ergebnis.messung["gewichtsreihe"].
+    """
+    ergebnisse = []
+    vorher = startloesung
+    for verhaeltnis in verhaeltnisse:
+        try:
+            ergebnis = ENGINES[engine](instanz, zeitlimit=zeitlimit, gewichte=(1.0, verhaeltnis), startloesung=vorher)
+        except NichtLoesbar:
+            raise
+        except ValueError as e:
+            logger.warning("Gewichtung 1 : %g ohne Plan: %s", verhaeltnis, e)
+            continue
+        abweichung, anwesenheit = kennzahlen(ergebnis)
+        ergebnis.messung["gewichtsreihe"] = {
+            "verhaeltnis": verhaeltnis, "abweichung": abweichung, "anwesenheit": anwesenheit
+        }
+        ergebnisse.append(ergebnis)
+        vorher = ergebnis
+        if fortschritt is not None:
+            fortschritt(f"Gewichtung 1 : {verhaeltnis:g} gelöst ({anwesenheit} Anwesenheitstage, "
+                        f"Abweichung {abweichung:.1f})")
+    return ergebnisse
+
+
+def pareto_front(ergebnisse) -> list[Ergebnis]:
+    """
+    Pläne, die kein anderer in beiden Kennzahlen (Anwesenheitstage, Abweichung) schlägt,
+    nach Anwesenheitstagen aufsteigend; bei gleichen Kennzahlen bleibt nur einer.
+    """
+    def schluessel(ergebnis):
+        werte = ergebnis.messung["gewichtsreihe"]
+        return werte["anwesenheit"], round(werte["abweichung"], 6)
+
+    front = []
+    for ergebnis in sorted(ergebnisse, key=schluessel):
+        if not front or schluessel(ergebnis)[1] < schluessel(front[-1])[1]:
+            front.append(ergebnis)
+    return front
+
@@ -0,0 +1,68 @@
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView, QDialog, QDialogButtonBox, QHeaderView, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+
+SPALTEN = ["Anwesenheitstage", "Abweichung", "Belastung", "Gewicht Anwesenheit", "Status"]
+
+
+class GewichtsreiheDialog(QDialog):
+    """
+    Pareto-optimale Pläne der Gewichtsreihe (siehe gewichtsreihe.pareto_front), von wenigen
+    Anwesenheitstagen bis zur gleichmäßigsten Belastung. 'Plan übernehmen' zeigt den gewählten Plan an.
+    """
+    plan_gewaehlt = Signal(int)
+
+    def __init__(self, front, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Gewichtungen vergleichen")
+        self.resize(640, 320)
+
+        hinweis = QLabel("Weniger Anwesenheitstage der Korrektoren gegen gleichmäßigere Belastung "
+                         "(Abweichung = Summe der Abweichungen vom Mittelwert).", self)
+        hinweis.setWordWrap(True)
+
+        self.tabelle = QTableWidget(len(front), len(SPALTEN), self)
+        self.tabelle.setHorizontalHeaderLabels(SPALTEN)
+        self.tabelle.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tabelle.horizontalHeader().setStretchLastSection(True)
+        self.tabelle.verticalHeader().hide()
+        self.tabelle.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabelle.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tabelle.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabelle.doubleClicked.connect(self.ausgewaehlt)
+
+        for zeile, ergebnis in enumerate(front):
+            werte = ergebnis.messung["gewichtsreihe"]
+            belastung = ergebnis.statistik["belastung"]
+            for spalte, text in enumerate([
+                str(werte["anwesenheit"]),
+                f"{werte['abweichung']:.1f}",
+                f"{belastung.min()}–{belastung.max()}",
+                f"{werte['verhaeltnis']:g}",
+                ergebnis.status
+            ]):
+                item = QTableWidgetItem(text)
+                if spalte < 4:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.tabelle.setItem(zeile, spalte, item)
+        if front:
+            self.tabelle.selectRow(0)
+
+        knoepfe = QDialogButtonBox(QDialogButtonBox.Close, self)
+        uebernehmen = QPushButton("Plan übernehmen")
+        knoepfe.addButton(uebernehmen, QDialogButtonBox.ActionRole)
+        uebernehmen.clicked.connect(self.ausgewaehlt)
+        knoepfe.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(hinweis)
+        layout.addWidget(self.tabelle)
+        layout.addWidget(knoepfe)
+
+    def ausgewaehlt(self):
+        zeile = self.tabelle.currentRow()
+        if zeile >= 0:
+            self.plan_gewaehlt.emit(zeile)
+            self.accept()
@@ -0,0 +1,130 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PySide6.QtWidgets import QListView
+
+
+class KandidatenModell(QAbstractListModel):
+    """
+    Prüflingsliste als Modell über einer einfachen Namensliste (keine Item-Objekte je Eintrag).
+    Große Listen werden mit setze_namen in einem Schritt übernommen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._namen = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._namen)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._namen[index.row()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._namen[index.row()] = str(value).strip()
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._namen[row:row] = [""] * count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if row < 0 or row + count > len(self._namen):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._namen[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def setze_namen(self, namen):
+        """Ersetzt die ganze Liste (ein Reset statt einer Einfügung je Zeile)."""
+        self.beginResetModel()
+        self._namen = [str(name).strip() for name in namen]
+        self.endResetModel()
+
+    def anhaengen(self, namen):
+        namen = [str(name).strip() for name in namen]
+        if not namen:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._namen), len(self._namen) + len(namen) - 1)
+        self._namen.extend(namen)
+        self.endInsertRows()
+
+    def namen(self) -> list[str]:
+        return list(self._namen)
+
+    def leeren(self):
+        self.setze_namen([])
+
+
+class KandidatenListe(QListView):
+    """
+    Ansicht der Prüflingsliste: Doppelklick auf eine freie Stelle legt einen Eintrag an,
+    Return springt zum nächsten (bzw. neuen) Eintrag, ein leerer Eintrag wird gelöscht.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setModel(KandidatenModell(self))
+        # Alle Zeilen gleich hoch: Qt muss nur die sichtbaren Zeilen vermessen
+        self.setUniformItemSizes(True)
+        # Layout in Etappen, große Importe blockieren das Fenster sonst für einen ganzen Durchlauf
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(2000)
+
+        self.return_pressed = False
+        self.itemDelegate().commitData.connect(self.handle_commit)
+
+    def count(self):
+        return self.model().rowCount()
+
+    def mouseDoubleClickEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+
+        if index.isValid():
+            self.edit(index)
+        else:
+            self.fuege_und_editiere_neues_item_ein()
+        event.accept() # keine weiteren Aktionen
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            self.return_pressed = True
+        else:
+            super().keyPressEvent(event)
+
+    def handle_commit(self, editor):
+        if not self.return_pressed:
+            return
+        self.return_pressed = False
+
+        current = self.currentIndex()
+        if current.isValid():
+            row = current.row()
+            if current.data() == "":
+                self.model().removeRows(row, 1)  # löscht den leeren Eintrag
+                return
+
+            if row + 1 < self.count():
+                naechster = self.model().index(row + 1)
+                self.setCurrentIndex(naechster)
+                QTimer.singleShot(0, lambda: self.edit(naechster))
+            else:
+                self.fuege_und_editiere_neues_item_ein()
+
+    def fuege_und_editiere_neues_item_ein(self):
+        row = self.count()
+        self.model().insertRows(row, 1)
+        neu = self.model().index(row)
+        self.setCurrentIndex(neu)
+        QTimer.singleShot(0, lambda: self.edit(neu))
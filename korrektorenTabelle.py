@@ -0,0 +1,145 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+STANDARD_KORREKTOREN = [f"Korrektor {i + 1}" for i in range(10)]
+
+
+class KorrektorenModell(QAbstractTableModel):
+    """
+    Korrektoren x Prüfungstage: Spalte 0 ist der Name, Spalte 1 + t das Häkchen für Tag t.
+    Die Verfügbarkeit steht je Korrektor als Bitmaske (wie Instanz.verfuegbarkeit).
+    Die letzte Zeile ist immer leer; wer dort einen Namen einträgt, legt einen Korrektor an.
+    """
+
+    def __init__(self, anzahl_tage=2, parent=None):
+        super().__init__(parent)
+        self.anzahl_tage = anzahl_tage
+        self._namen = [""]
+        self._masken = [0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._namen)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1 + self.anzahl_tage
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        zeile, spalte = index.row(), index.column()
+        if spalte == 0:
+            return self._namen[zeile] if role in (Qt.DisplayRole, Qt.EditRole) else None
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._masken[zeile] >> (spalte - 1) & 1 else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        zeile, spalte = index.row(), index.column()
+        if spalte == 0 and role == Qt.EditRole:
+            self._namen[zeile] = str(value).strip()
+        elif spalte > 0 and role == Qt.CheckStateRole:
+            bit = 1 << (spalte - 1)
+            if Qt.CheckState(value) == Qt.Checked:
+                self._masken[zeile] |= bit
+            else:
+                self._masken[zeile] &= ~bit
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+
+        # Leere Zeile am Ende nachschieben
+        if zeile == len(self._namen) - 1 and self._namen[zeile]:
+            self.beginInsertRows(QModelIndex(), zeile + 1, zeile + 1)
+            self._namen.append("")
+            self._masken.append(0)
+            self.endInsertRows()
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def headerData(self, abschnitt, orientierung, role=Qt.DisplayRole):
+        if orientierung == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Name" if abschnitt == 0 else f"Tag {abschnitt}"
+        return None
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        # Die leere letzte Zeile bleibt stehen
+        count = min(count, len(self._namen) - 1 - row)
+        if row < 0 or count <= 0:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._namen[row:row + count]
+        del self._masken[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def setze_korrektoren(self, korrektoren):
+        """Ersetzt alle Korrektoren durch (Name, Tage)-Paare, Tage als Liste von bool je Tag."""
+        self.beginResetModel()
+        self._namen = []
+        self._masken = []
+        for name, tage in korrektoren:
+            self._namen.append(str(name).strip())
+            self._masken.append(sum(1 << t for t, da in enumerate(tage) if da))
+        self._namen.append("")
+        self._masken.append(0)
+        self.endResetModel()
+
+    def korrektoren(self) -> list[tuple[str, list[bool]]]:
+        """(Name, Tage) aller Zeilen mit Namen, in Tabellenreihenfolge."""
+        return [
+            (name, [bool(maske >> t & 1) for t in range(self.anzahl_tage)])
+            for name, maske in zip(self._namen, self._masken) if name
+        ]
+
+    def verfuegbarkeiten(self, pruefungstage) -> dict[str, list[str]]:
+        """Name -> Prüfungstage (wie eingabedaten["verfügbarkeiten"]); ohne Häkchen fällt der Korrektor weg."""
+        verfuegbarkeiten = {}
+        for name, maske in zip(self._namen, self._masken):
+            tage = [datum for t, datum in enumerate(pruefungstage) if maske >> t & 1]
+            if name and tage:
+                verfuegbarkeiten.setdefault(name, [])
+                verfuegbarkeiten[name] += [datum for datum in tage if datum not in verfuegbarkeiten[name]]
+        return verfuegbarkeiten
+
+
+class KorrektorenTabelle(QTableView):
+    """
+    Ansicht eines Prüfungstags auf das gemeinsame KorrektorenModell: Name und Häkchen dieses Tages.
+    Entf löscht den markierten Korrektor (an beiden Tagen).
+    """
+
+    def __init__(self, modell, tag, parent=None):
+        super().__init__(parent)
+        self.setModel(modell)
+        for spalte in range(1, modell.columnCount()):
+            self.setColumnHidden(spalte, spalte != 1 + tag)
+
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 8)
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.horizontalHeader().setSectionResizeMode(1 + tag, QHeaderView.ResizeToContents)
+        # Häkchen links vom Namen
+        self.horizontalHeader().moveSection(1 + tag, 0)
+        self.setShowGrid(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+                             | QAbstractItemView.AnyKeyPressed)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Delete and self.state() != QAbstractItemView.EditingState:
+            zeile = self.currentIndex().row()
+            if zeile >= 0:
+                self.model().removeRows(zeile, 1)
+            return
+        super().keyPressEvent(event)
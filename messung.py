@@ -0,0 +1,129 @@
+"""
+Messung der Laufzeit je Phase (Wand- und CPU-Zeit), der Modellgröße und des Speicherbedarfs.
+
+    messung = Messung()
+    with messung.phase("modellaufbau"):
+        ...
+    messung.als_dict()
+
+Mit profil=True laufen zusätzlich cProfile und tracemalloc mit (deutlich langsamer,
+nur zur Diagnose gedacht).
+"""
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+MESSWERTE_DATEI = Path.home() / ".pvihk_messwerte.jsonl"
+
+# Reihenfolge der Phasen in Anzeige und Protokoll
+PHASEN = ["eingabe", "prozessstart", "instanz", "vorpruefung", "modellaufbau", "solver", "erklaerung", "extraktion", "tabellen", "pdf"]
+
+
+def speicher_spitze_mb(kindprozesse=False):
+    """Höchster Speicherbedarf (RSS) in MB, unter Windows nicht verfügbar (None)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    wer = resource.RUSAGE_CHILDREN if kindprozesse else resource.RUSAGE_SELF
+    rss = resource.getrusage(wer).ru_maxrss
+    # Linux liefert KB, macOS Bytes
+    return round(rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+class Messung:
+    def __init__(self, profil=False):
+        self.phasen = {}    # Name -> {"wand": s, "cpu": s}
+        self.werte = {}     # sonstige Kennzahlen (Modellgröße, Speicher, Profil)
+        self.profil = profil
+
+    @contextmanager
+    def phase(self, name):
+        wand, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.eintragen(name, time.perf_counter() - wand, time.process_time() - cpu)
+
+    def eintragen(self, name, wand, cpu=None):
+        """Trägt eine anderswo gemessene Phase ein (mehrfach aufgerufen wird addiert)."""
+        eintrag = self.phasen.setdefault(name, {"wand": 0.0, "cpu": None})
+        eintrag["wand"] += wand
+        if cpu is not None:
+            eintrag["cpu"] = (eintrag["cpu"] or 0.0) + cpu
+
+    @contextmanager
+    def profiliert(self):
+        """cProfile und tracemalloc um den Block, nur wenn profil=True."""
+        if not self.profil:
+            yield
+            return
+        profiler = cProfile.Profile()
+        tracemalloc_lief = tracemalloc.is_tracing()
+        if not tracemalloc_lief:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _, spitze = tracemalloc.get_traced_memory()
+            if not tracemalloc_lief:
+                tracemalloc.stop()
+            text = io.StringIO()
+            pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(25)
+            self.werte["profil"] = text.getvalue()
+            self.werte["python_speicher_spitze_mb"] = round(spitze / (1024 * 1024), 1)
+
+    def als_dict(self) -> dict:
+        return {"phasen": self.phasen, **self.werte}
+
+
+def messung_als_text(messung: dict) -> str:
+    """Lesbare Übersicht für den Diagnosedialog."""
+    zeilen = [f"{'Phase':<14}{'Wand [ms]':>12}{'CPU [ms]':>12}"]
+    phasen = messung.get("phasen", {})
+    for name in PHASEN + sorted(set(phasen) - set(PHASEN)):
+        if name not in phasen:
+            continue
+        wand, cpu = phasen[name]["wand"], phasen[name]["cpu"]
+        cpu_text = f"{cpu * 1000:12.1f}" if cpu is not None else f"{'-':>12}"
+        zeilen.append(f"{name:<14}{wand * 1000:12.1f}{cpu_text}")
+    if messung.get("gesamt") is not None:
+        zeilen.append(f"{'gesamt':<14}{messung['gesamt'] * 1000:12.1f}{'-':>12}")
+
+    modell = messung.get("modell")
+    if modell:
+        zeilen.append("")
+        zeilen.append(
+            f"Modell: {modell['variablen']} Variablen, {modell['nebenbedingungen']} Nebenbedingungen, "
+            f"{modell['nichtnullen']} Nicht-Nullen"
+        )
+    for schluessel, text in [("speicher_mb", "Speicherspitze Rechenprozess"),
+                             ("speicher_solver_mb", "Speicherspitze Solver (CBC)"),
+                             ("python_speicher_spitze_mb", "Python-Allokationen (tracemalloc)")]:
+        if messung.get(schluessel) is not None:
+            zeilen.append(f"{text}: {messung[schluessel]} MB")
+    if messung.get("solver_log"):
+        zeilen.append(f"Solver-Protokoll: {messung['solver_log']}")
+
+    if messung.get("profil"):
+        zeilen.append("")
+        zeilen.append(messung["profil"])
+    return "\n".join(zeilen)
+
+
+def schreibe_messwerte(eintrag: dict, pfad=MESSWERTE_DATEI):
+    """Hängt einen Eintrag als JSON-Zeile an die Messwertdatei an."""
+    eintrag = {"zeit": datetime.now().isoformat(timespec="seconds"), **eintrag}
+    eintrag.pop("profil", None)  # Profiltext gehört nicht ins Protokoll
+    with open(pfad, "a", encoding="utf-8") as f:
+        f.write(json.dumps(eintrag, ensure_ascii=False) + "\n")
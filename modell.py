@@ -0,0 +1,279 @@
+import hashlib
+import json
+import re
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+
+
+# 'Nachname, Vorname (Prüflingsnummer)' wie in prueflinge.txt
+KANDIDAT_MUSTER = re.compile(r"(?P<nachname>[^,()]+?)\s*,\s*(?P<vorname>[^,()]+?)\s*\((?P<nummer>[^()\s]+)\)")
+
+
+@dataclass(frozen=True, slots=True)
+class Kandidat:
+    """Eine Zeile der Prüflingsliste; nummer ist None, wenn die Zeile nicht dem Muster entspricht."""
+    text: str
+    nachname: str = ""
+    vorname: str = ""
+    nummer: str | None = None
+
+    @classmethod
+    def aus_zeile(cls, zeile: str) -> "Kandidat":
+        text = zeile.strip()
+        treffer = KANDIDAT_MUSTER.fullmatch(text)
+        if treffer is None:
+            return cls(text)
+        return cls(text, treffer["nachname"], treffer["vorname"], treffer["nummer"])
+
+
+@dataclass(slots=True)
+class KandidatenIndex:
+    """
+    Prüflingsliste mit Hash-Index über die Prüflingsnummer, in einem Durchlauf aufgebaut.
+    Leerzeilen zählen nicht als Kandidat, Zeilennummern beziehen sich aber auf die ganze Liste (ab 1).
+    """
+    kandidaten: list[Kandidat] = field(default_factory=list)
+    zeilen: list[int] = field(default_factory=list)             # Zeilennummer je Kandidat
+    nach_nummer: dict[str, int] = field(default_factory=dict)   # Prüflingsnummer -> erster Kandidat
+    doppelt: dict[str, list[int]] = field(default_factory=dict) # Prüflingsnummer -> alle Zeilen
+    ohne_nummer: list[int] = field(default_factory=list)        # Zeilen ohne erkennbare Nummer
+
+    @classmethod
+    def aus_zeilen(cls, zeilen) -> "KandidatenIndex":
+        index = cls()
+        for zeile, text in enumerate(zeilen, start=1):
+            kandidat = Kandidat.aus_zeile(text)
+            if not kandidat.text:
+                continue
+            k = len(index.kandidaten)
+            index.kandidaten.append(kandidat)
+            index.zeilen.append(zeile)
+            if kandidat.nummer is None:
+                index.ohne_nummer.append(zeile)
+            elif kandidat.nummer in index.nach_nummer:
+                erste = index.zeilen[index.nach_nummer[kandidat.nummer]]
+                index.doppelt.setdefault(kandidat.nummer, [erste]).append(zeile)
+            else:
+                index.nach_nummer[kandidat.nummer] = k
+        return index
+
+    def ids(self) -> list[str]:
+        """
+        Schlüssel je Kandidat: die Prüflingsnummer, sonst (und für Wiederholungen einer Nummer)
+        'Zeile N', damit jeder Kandidat einen eindeutigen Schlüssel hat.
+        """
+        return [
+            kandidat.nummer if kandidat.nummer is not None and self.nach_nummer[kandidat.nummer] == k
+            else f"Zeile {zeile}"
+            for k, (kandidat, zeile) in enumerate(zip(self.kandidaten, self.zeilen))
+        ]
+
+    def als_eingabedaten(self) -> dict[str, str]:
+        """Wie eingabedaten["kandidaten"]: Schlüssel -> Zeilentext."""
+        return dict(zip(self.ids(), (kandidat.text for kandidat in self.kandidaten)))
+
+
+@dataclass(frozen=True, slots=True)
+class Instanz:
+    """
+    Eingabe der Optimierung mit Integer-Indizes statt String-Schlüsseln.
+
+    verfuegbarkeit[p] ist eine Bitmaske über die Prüfungstage:
+    Bit t gesetzt = Korrektor p ist an Tag t anwesend.
+    kandidaten_ids[k] ist der Schlüssel aus eingabedaten["kandidaten"] (Prüflingsnummer,
+    sonst fortlaufend); Pläne und Vergleiche arbeiten damit statt mit der Listenposition.
+    """
+    korrektoren: tuple[str, ...]
+    kandidaten: tuple[str, ...]
+    tage: tuple[str, ...]
+    verfuegbarkeit: tuple[int, ...]
+    zeitslots: tuple[tuple[str, ...], ...]
+    anzahl_korrektoren_pro_klausur: int = 2
+    kandidaten_ids: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        if not self.kandidaten_ids:
+            object.__setattr__(self, "kandidaten_ids", tuple(str(k + 1) for k in range(len(self.kandidaten))))
+        elif len(self.kandidaten_ids) != len(self.kandidaten):
+            raise ValueError("kandidaten_ids und kandidaten müssen gleich lang sein.")
+
+    @classmethod
+    def aus_eingabedaten(cls, eingabedaten: dict) -> "Instanz":
+        """Übersetzt das Eingabedaten-Dictionary (siehe MainWindow.sammle_eingabedaten)."""
+        zeitslots = eingabedaten.get("zeitslots")
+        if not isinstance(zeitslots, list) or len(zeitslots) != 2 or not all(isinstance(t, list) for t in zeitslots):
+            raise ValueError("zeitslots müssen eine Liste mit zwei Listen sein (je Tag).")
+
+        tage = tuple(eingabedaten["pruefungstage"])
+        tag_index = {datum: t for t, datum in enumerate(tage)}
+
+        korrektoren = tuple(eingabedaten["verfügbarkeiten"].keys())
+        verfuegbarkeit = []
+        for p in korrektoren:
+            maske = 0
+            for datum in eingabedaten["verfügbarkeiten"][p]:
+                maske |= 1 << tag_index[datum]
+            verfuegbarkeit.append(maske)
+
+        return cls(
+            korrektoren=korrektoren,
+            kandidaten=tuple(eingabedaten["kandidaten"].values()),
+            tage=tage,
+            verfuegbarkeit=tuple(verfuegbarkeit),
+            # Uhrzeiten prüfen und einheitlich als HH:MM ablegen
+            zeitslots=tuple(
+                tuple(datetime.strptime(z, "%H:%M").strftime("%H:%M") for z in slots)
+                for slots in zeitslots
+            ),
+            anzahl_korrektoren_pro_klausur=eingabedaten.get("anzahl_korrektoren_pro_klausur", 2),
+            kandidaten_ids=tuple(str(schluessel) for schluessel in eingabedaten["kandidaten"])
+        )
+
+    def als_eingabedaten(self) -> dict:
+        """Rückrichtung ins Dictionary-Format (z.B. für JSON-Dateien)."""
+        return {
+            "verfügbarkeiten": {
+                p: [datum for t, datum in enumerate(self.tage) if self.verfuegbar(i, t)]
+                for i, p in enumerate(self.korrektoren)
+            },
+            "kandidaten": dict(zip(self.kandidaten_ids, self.kandidaten)),
+            "pruefungstage": list(self.tage),
+            "anzahl_korrektoren_pro_klausur": self.anzahl_korrektoren_pro_klausur,
+            "zeitslots": [list(slots) for slots in self.zeitslots]
+        }
+
+    def verfuegbar(self, p: int, t: int) -> bool:
+        return bool(self.verfuegbarkeit[p] >> t & 1)
+
+    def korrektoren_an_tag(self, t: int) -> list[int]:
+        return [p for p in range(len(self.korrektoren)) if self.verfuegbar(p, t)]
+
+    def fingerprint(self) -> str:
+        inhalt = json.dumps(
+            [self.korrektoren, self.kandidaten, self.tage, self.verfuegbarkeit,
+             self.zeitslots, self.anzahl_korrektoren_pro_klausur, self.kandidaten_ids],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(inhalt.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class Ergebnis:
+    """
+    Ergebnis der Optimierung, kompakt in Arrays abgelegt.
+
+    zuordnung: Matrix Kandidat x Korrektor (zeilenweise, 1 = korrigiert)
+    tag:       Prüfungstag je Kandidat (-1 = keiner)
+    slot:      Index in instanz.zeitslots[tag] je Kandidat (-1 = kein Termin frei)
+    statistik: Kennzahlen als NumPy-Arrays, siehe berechne_statistik
+    messung:   Laufzeiten je Phase, Modellgröße, Speicher (siehe messung.Messung)
+    engine:    Engine, die den Plan erzeugt hat (bestimmt, wie Anwesenheit gezählt wird)
+    """
+    instanz: Instanz
+    zuordnung: array
+    tag: array
+    slot: array
+    status: str
+    dauer: float = 0.0
+    statistik: dict = field(default_factory=dict)
+    messung: dict = field(default_factory=dict)
+    engine: str = "milp"
+
+    def matrix(self) -> np.ndarray:
+        """Zuordnung als (Kandidaten x Korrektoren)-Matrix, ohne Kopie."""
+        return np.frombuffer(self.zuordnung, dtype=np.uint8).reshape(
+            len(self.instanz.kandidaten), len(self.instanz.korrektoren))
+
+    def pruefer(self, k: int) -> list[int]:
+        n = len(self.instanz.korrektoren)
+        zeile = self.zuordnung[k * n:(k + 1) * n]
+        return [p for p in range(n) if zeile[p]]
+
+    def pruefer_namen(self, k: int) -> list[str]:
+        return [self.instanz.korrektoren[p] for p in self.pruefer(k)]
+
+    def verteilung(self) -> dict:
+        """Datum -> [(Zeit, Prüfling, [Korrektoren])], nach Zeitslot sortiert."""
+        verteilung = {}
+        for t, datum in enumerate(self.instanz.tage):
+            termine = sorted(
+                (self.slot[k], k) for k in range(len(self.instanz.kandidaten))
+                if self.tag[k] == t and self.slot[k] >= 0
+            )
+            if termine:
+                verteilung[datum] = [
+                    (self.instanz.zeitslots[t][s], self.instanz.kandidaten[k], self.pruefer_namen(k))
+                    for s, k in termine
+                ]
+        return verteilung
+
+    def zuordnung_namen(self) -> list[tuple[str, list[str]]]:
+        """(Prüfling, [Korrektoren]) für alle Kandidaten in Eingabereihenfolge."""
+        return [(name, self.pruefer_namen(k)) for k, name in enumerate(self.instanz.kandidaten)]
+
+    def plan(self) -> dict[str, tuple]:
+        """Schlüssel des Prüflings -> (Datum, Zeit, (Korrektoren)); None für fehlenden Tag/Termin."""
+        instanz = self.instanz
+        zeilen, spalten = np.nonzero(self.matrix())
+        grenzen = np.searchsorted(zeilen, np.arange(len(instanz.kandidaten) + 1))
+        plan = {}
+        for k, schluessel in enumerate(instanz.kandidaten_ids):
+            t, s = self.tag[k], self.slot[k]
+            datum = instanz.tage[t] if t >= 0 else None
+            zeit = instanz.zeitslots[t][s] if t >= 0 and s >= 0 else None
+            pruefer = tuple(instanz.korrektoren[p] for p in spalten[grenzen[k]:grenzen[k + 1]])
+            plan[schluessel] = (datum, zeit, pruefer)
+        return plan
+
+    def als_dict(self) -> dict:
+        """Dictionary-Format (wie früher von berechne_korrektorenverteilung geliefert)."""
+        return {
+            "verteilung": self.verteilung(),
+            "zuordnung": self.zuordnung_namen(),
+            "korrektoren": list(self.instanz.korrektoren),
+            "status": self.status,
+            "messung": self.messung
+        }
+
+    def fingerprint(self) -> str:
+        h = hashlib.sha256(self.instanz.fingerprint().encode("ascii"))
+        for daten in (self.zuordnung, self.tag, self.slot):
+            h.update(daten.tobytes())
+        return h.hexdigest()
+
+
+def plan_unterschiede(alt: dict, neu: dict) -> set[str]:
+    """Schlüssel der Prüflinge, die hinzugekommen, weggefallen oder anders eingeplant sind (siehe Ergebnis.plan)."""
+    return {schluessel for schluessel in alt.keys() | neu.keys() if alt.get(schluessel) != neu.get(schluessel)}
+
+
+def berechne_statistik(zuordnung: np.ndarray, tag: np.ndarray, anzahl_tage: int) -> dict:
+    """
+    Kennzahlen einer Lösung als Matrixoperationen.
+
+    zuordnung: (Kandidaten x Korrektoren), 0/1
+    tag:       Prüfungstag je Kandidat (-1 = keiner)
+
+    belastung:          Arbeiten je Korrektor
+    partner:            gemeinsame Arbeiten je Korrektorenpaar (XᵀX ohne Diagonale)
+    belastung_pro_tag:  Arbeiten je Korrektor und Tag
+    anwesend:           Korrektor hat an dem Tag mindestens eine Arbeit
+    klausuren_pro_tag:  Prüflinge je Tag
+    """
+    x = zuordnung.astype(np.int32)
+    tage = (tag[:, None] == np.arange(anzahl_tage)).astype(np.int32)  # Kandidaten x Tage
+
+    partner = x.T @ x
+    np.fill_diagonal(partner, 0)
+    belastung_pro_tag = x.T @ tage
+
+    return {
+        "belastung": x.sum(axis=0),
+        "partner": partner,
+        "belastung_pro_tag": belastung_pro_tag,
+        "anwesend": belastung_pro_tag > 0,
+        "klausuren_pro_tag": tage.sum(axis=0)
+    }
@@ -0,0 +1,629 @@
+import logging
+import re
+from array import array
+
+import numpy as np
+import pulp
+
+from messung import Messung, speicher_spitze_mb
+from modell import Ergebnis, Instanz, berechne_statistik
+from protokoll import solver_log_pfad
+from validierung import (
+    GEWICHT_ABWEICHUNG, GEWICHT_ANWESENHEIT, MIN_ANWESEND, NichtLoesbar, pruefe_instanz, tagesquoten
+)
+
+logger = logging.getLogger(__name__)
+
+ZEITLIMIT = 10  # Sekunden für CBC
+
+
+def berechne_korrektorenverteilung(eingabedaten, profil=False, zeitlimit=ZEITLIMIT, fortschritt=None,
+                                   gewichte=None, startloesung=None) -> Ergebnis:
+    """
+    Optimiert die Korrektorenverteilung.
+
+    Erwartet eine Instanz oder das Eingabedaten-Dictionary mit
+        eingabedaten["zeitslots"] = [liste_tag1, liste_tag2]
+
+    fortschritt(text) wird, falls angegeben, zu Beginn jeder Phase aufgerufen.
+    Laufzeiten je Phase, Modellgröße, Zielwert/Gap und Speicherbedarf stehen in
+    Ergebnis.messung, mit profil=True zusätzlich ein cProfile-Auszug.
+
+    gewichte = (Abweichung, Anwesenheit) ersetzt die Standardgewichtung der Zielfunktion;
+    ein Ergebnis derselben Instanz als startloesung dient CBC als Startlösung.
+    """
+    return _mit_messung(_berechne, eingabedaten, profil, zeitlimit, fortschritt,
+                        gewichte=gewichte, startloesung=startloesung)
+
+
+def berechne_slotverteilung(eingabedaten, profil=False, zeitlimit=ZEITLIMIT, fortschritt=None,
+                            gewichte=None, startloesung=None) -> Ergebnis:
+    """
+    Wie berechne_korrektorenverteilung, plant aber die Zeitslots im Modell mit:
+    je Tag und Slot genau eine Prüfung mit anzahl_korrektoren_pro_klausur Korrektoren,
+    die an diesem Tag verfügbar sind. Die Prüfungen eines Korrektors liegen je Tag
+    in einem zusammenhängenden Block, danach kann er gehen.
+    """
+    return _mit_messung(_berechne_slots, eingabedaten, profil, zeitlimit, fortschritt,
+                        gewichte=gewichte, startloesung=startloesung)
+
+
+def _mit_messung(berechne, eingabedaten, profil, zeitlimit, fortschritt, gewichte, startloesung) -> Ergebnis:
+    if fortschritt is None:
+        fortschritt = lambda text: None
+    if gewichte is None:
+        gewichte = (GEWICHT_ABWEICHUNG, GEWICHT_ANWESENHEIT)
+
+    messung = Messung(profil)
+    messung.werte["gewichte"] = list(gewichte)
+    with messung.profiliert():
+        ergebnis = berechne(eingabedaten, fortschritt, messung, zeitlimit, gewichte, startloesung)
+
+    messung.werte["speicher_mb"] = speicher_spitze_mb()
+    messung.werte["speicher_solver_mb"] = speicher_spitze_mb(kindprozesse=True)
+    ergebnis.messung.update(messung.als_dict())
+    return ergebnis
+
+
+def _cbc_schranke(log_pfad):
+    """Untere Schranke aus dem CBC-Protokoll (steht nur drin, wenn CBC vorzeitig stoppt)."""
+    if not log_pfad:
+        return None
+    try:
+        with open(log_pfad, "r", encoding="utf-8", errors="replace") as f:
+            treffer = re.findall(r"^Lower bound:\s+(\S+)", f.read(), re.MULTILINE)
+        return float(treffer[-1]) if treffer else None
+    except (OSError, ValueError):
+        return None
+
+
+def _passende_startloesung(startloesung, instanz) -> Ergebnis | None:
+    """Startlösung nur für dieselbe Instanz (sonst passen die Variablen nicht)."""
+    if startloesung is None or startloesung.instanz.fingerprint() != instanz.fingerprint():
+        return None
+    return startloesung
+
+
+def _instanz_vorbereiten(eingabedaten, messung, engine) -> Instanz:
+    with messung.phase("instanz"):
+        instanz = eingabedaten if isinstance(eingabedaten, Instanz) else Instanz.aus_eingabedaten(eingabedaten)
+    if len(instanz.zeitslots) != 2:
+        raise ValueError("zeitslots müssen eine Liste mit zwei Listen sein (je Tag).")
+
+    # Strukturell unlösbare Eingaben gar nicht erst an CBC geben
+    with messung.phase("vorpruefung"):
+        gruende = pruefe_instanz(instanz, engine)
+    if gruende:
+        raise NichtLoesbar(gruende)
+    return instanz
+
+
+def _loesen(prob, instanz, fortschritt, messung, zeitlimit, warmstart=False, engine="milp") -> str:
+    """
+    Löst prob mit CBC, trägt Modellgröße und Solverwerte in messung ein und liefert den Status.
+    Mit warmstart=True startet CBC von den per setInitialValue gesetzten Werten.
+    Ist prob unlösbar, erklärt erklaere_unloesbarkeit das Modell der Engine.
+    """
+    messung.werte["modell"] = {
+        "variablen": prob.numVariables(),
+        "nebenbedingungen": prob.numConstraints(),
+        "nichtnullen": sum(len(c) for c in prob.constraints.values())
+    }
+
+    logger.debug("Modellgröße: %s", messung.werte["modell"])
+
+    # Das CBC-Protokoll geht je Lauf in eine eigene Datei statt auf stdout
+    log_pfad = solver_log_pfad()
+    messung.werte["solver_log"] = log_pfad
+
+    fortschritt("Solver läuft...")
+    with messung.phase("solver"):
+        prob.solve(pulp.PULP_CBC_CMD(timeLimit=zeitlimit, msg=False, logPath=log_pfad, warmStart=warmstart))
+
+    solver_status = pulp.LpStatus[prob.status]
+    duration = messung.phasen["solver"]["wand"]
+    logger.info("Solver: %s nach %.2f s (Protokoll: %s)", solver_status, duration, log_pfad)
+
+    if solver_status == "Infeasible":
+        # Statt nur "Infeasible" die verletzten Regeln benennen (ein zusätzlicher, kleiner Lauf)
+        fortschritt("Unlösbar, Ursachen werden gesucht...")
+        with messung.phase("erklaerung"):
+            gruende = erklaere_unloesbarkeit(instanz, zeitlimit, engine)
+        raise NichtLoesbar(gruende or [f"Optimierung nicht erfolgreich! Status: {solver_status}"])
+    if solver_status in ["Unbounded", "Undefined", "Not Solved"]:
+        raise ValueError(f"Optimierung nicht erfolgreich! Status: {solver_status}")
+    # Beim Abbruch durch das Zeitlimit meldet pulp ebenfalls "Optimal", nur sol_status unterscheidet
+    if solver_status == "Optimal" and prob.sol_status == pulp.LpSolutionIntegerFeasible:
+        final_status = "Beste gefundene Lösung (nicht optimal)"
+    elif solver_status == "Optimal" and duration >= 0.9 * zeitlimit:
+        final_status = "Optimal (nach Zeitlimit)"
+    elif solver_status == "Optimal":
+        final_status = "Optimal"
+    elif solver_status == "Integer Feasible":
+        final_status = "Beste gefundene Lösung (nicht optimal)"
+    else:
+        final_status = solver_status
+
+    zielwert = pulp.value(prob.objective)
+    schranke = zielwert if prob.sol_status == pulp.LpSolutionOptimal else _cbc_schranke(log_pfad)
+    messung.werte["solver"] = {
+        "status": final_status,
+        "zielwert": zielwert,
+        "schranke": schranke,
+        "gap": abs(zielwert - schranke) / max(abs(zielwert), 1e-9) if schranke is not None else None
+    }
+    return final_status
+
+
+def _min_abweichung(gesamt, n_korrektoren) -> float:
+    """
+    Gültige Schranke: Belastungen sind ganzzahlig, die Summe der Abweichungen kann also
+    nicht kleiner werden als bei einer Verteilung auf floor/ceil des Mittelwerts.
+    Erspart CBC den (symmetriebedingt teuren) Optimalitätsbeweis.
+    """
+    mittel = gesamt / n_korrektoren
+    basis, rest = divmod(gesamt, n_korrektoren)
+    return rest * (basis + 1 - mittel) + (n_korrektoren - rest) * (mittel - basis)
+
+
+def _berechne(eingabedaten, fortschritt, messung, zeitlimit, gewichte, startloesung) -> Ergebnis:
+    instanz = _instanz_vorbereiten(eingabedaten, messung, "milp")
+    startloesung = _passende_startloesung(startloesung, instanz)
+
+    n_korrektoren = len(instanz.korrektoren)
+    n_klausuren = len(instanz.kandidaten)
+    korrektoren = range(n_korrektoren)
+    klausuren = range(n_klausuren)
+    tage = [0, 1]
+    anzahl_korrektoren = instanz.anzahl_korrektoren_pro_klausur
+
+    tag_verfuegbarkeit = [instanz.korrektoren_an_tag(t) for t in tage]
+
+    anzahl_tag1, anzahl_tag2 = tagesquoten(n_klausuren)
+
+    fortschritt("Optimierungsmodell wird aufgebaut...")
+    with messung.phase("modellaufbau"):
+        prob = pulp.LpProblem("Korrekturverteilung", pulp.LpMinimize)
+
+        x = pulp.LpVariable.dicts("x", ((k, p) for k in klausuren for p in korrektoren), 0, 1, pulp.LpBinary)
+        klausur_tag = pulp.LpVariable.dicts("klausur_tag", ((k, t) for k in klausuren for t in tage), 0, 1, pulp.LpBinary)
+        anwesenheit = pulp.LpVariable.dicts("anwesenheit", ((p, t) for p in korrektoren for t in tage), 0, 1, pulp.LpBinary)
+
+        belastung = {p: pulp.lpSum(x[k, p] for k in klausuren) for p in korrektoren}
+        mittlere_belastung = anzahl_korrektoren * n_klausuren / n_korrektoren
+        abweichung = pulp.LpVariable.dicts("abweichung", korrektoren, 0)
+
+        for p in korrektoren:
+            prob += belastung[p] - mittlere_belastung <= abweichung[p]
+            prob += mittlere_belastung - belastung[p] <= abweichung[p]
+
+        prob += pulp.lpSum(abweichung[p] for p in korrektoren) >= _min_abweichung(anzahl_korrektoren * n_klausuren,
+                                                                                 n_korrektoren)
+
+        # Hier erfolgt die Gewichtung: Gleichverteilung / Anwesenheit
+        gewicht_abweichung, gewicht_anwesenheit = gewichte
+        prob += (
+            gewicht_abweichung * pulp.lpSum(abweichung[p] for p in korrektoren) +
+            gewicht_anwesenheit * pulp.lpSum(anwesenheit[p, t] for p in korrektoren for t in tage)
+        )
+
+        for k in klausuren:
+            prob += pulp.lpSum(x[k, p] for p in korrektoren) == anzahl_korrektoren
+            for t in tage:
+                gruppe = tag_verfuegbarkeit[t]
+                prob += klausur_tag[k, t] <= pulp.lpSum(x[k, p] for p in gruppe)
+            prob += klausur_tag[k, 0] + klausur_tag[k, 1] == 1
+
+        prob += pulp.lpSum(klausur_tag[k, 0] for k in klausuren) == anzahl_tag1
+        prob += pulp.lpSum(klausur_tag[k, 1] for k in klausuren) == anzahl_tag2
+
+        for p in korrektoren:
+            for t in tage:
+                if instanz.verfuegbar(p, t):
+                    for k in klausuren:
+                        prob += x[k, p] <= anwesenheit[p, t]
+
+        for t in tage:
+            prob += pulp.lpSum(anwesenheit[p, t] for p in tag_verfuegbarkeit[t]) >= MIN_ANWESEND
+
+        # Plan eines früheren Laufs (z.B. mit anderer Gewichtung) als Startlösung
+        if startloesung is not None:
+            start = startloesung.matrix()
+            start_tag = np.frombuffer(startloesung.tag, dtype=np.int8)
+            # Anwesenheit wie im Modell (x[k, p] <= anwesenheit[p, t] an jedem verfügbaren Tag):
+            # wer korrigiert, an allen verfügbaren Tagen, dazu bis MIN_ANWESEND verfügbare ohne Arbeit
+            belastung = start.sum(axis=0)
+            anwesend = {(p, t): instanz.verfuegbar(p, t) and belastung[p] > 0 for p in korrektoren for t in tage}
+            for t in tage:
+                fehlt = MIN_ANWESEND - sum(anwesend[p, t] for p in tag_verfuegbarkeit[t])
+                for p in tag_verfuegbarkeit[t]:
+                    if fehlt > 0 and not anwesend[p, t]:
+                        anwesend[p, t] = True
+                        fehlt -= 1
+            for (k, p), var in x.items():
+                var.setInitialValue(int(start[k, p]))
+            for (k, t), var in klausur_tag.items():
+                var.setInitialValue(int(start_tag[k] == t))
+            for (p, t), var in anwesenheit.items():
+                var.setInitialValue(int(anwesend[p, t]))
+            for p, var in abweichung.items():
+                var.setInitialValue(abs(int(startloesung.statistik["belastung"][p]) - mittlere_belastung))
+
+    final_status = _loesen(prob, instanz, fortschritt, messung, zeitlimit, warmstart=startloesung is not None)
+    duration = messung.phasen["solver"]["wand"]
+
+    with messung.phase("extraktion"):
+        # Lösungswerte in einem Durchgang als dichte Matrizen auslesen
+        werte_x = np.fromiter((x[k, p].varValue or 0 for k in klausuren for p in korrektoren),
+                              dtype=float, count=n_klausuren * n_korrektoren)
+        werte_tag = np.fromiter((klausur_tag[k, t].varValue or 0 for k in klausuren for t in tage),
+                                dtype=float, count=n_klausuren * len(tage))
+        matrix = (werte_x.reshape(n_klausuren, n_korrektoren) > 0.5).astype(np.uint8)
+        tag_matrix = werte_tag.reshape(n_klausuren, len(tage)) > 0.5
+        klausur_tage = np.where(tag_matrix.any(axis=1), tag_matrix.argmax(axis=1), -1)
+
+        # Zeitslots je Tag in Reihenfolge der Prüflingsliste vergeben
+        # (reichen die Slots nicht, bleibt der Prüfling ohne Termin: slot = -1)
+        slots = np.full(n_klausuren, -1, dtype=np.int16)
+        for t in tage:
+            klausuren_fuer_tag = np.flatnonzero(klausur_tage == t)[:len(instanz.zeitslots[t])]
+            slots[klausuren_fuer_tag] = np.arange(len(klausuren_fuer_tag))
+
+        statistik = berechne_statistik(matrix, klausur_tage, len(tage))
+
+    # Das PDF wird nicht hier erzeugt, sondern bei Bedarf (siehe pdfBericht.erzeuge_pdf)
+    return Ergebnis(
+        instanz=instanz,
+        zuordnung=array("B", matrix.tobytes()),
+        tag=array("b", klausur_tage.astype(np.int8).tobytes()),
+        slot=array("h", slots.tobytes()),
+        status=final_status,
+        dauer=duration,
+        statistik=statistik,
+        engine="milp"
+    )
+
+
+def _berechne_slots(eingabedaten, fortschritt, messung, zeitlimit, gewichte, startloesung) -> Ergebnis:
+    instanz = _instanz_vorbereiten(eingabedaten, messung, "slots")
+    startloesung = _passende_startloesung(startloesung, instanz)
+
+    n_korrektoren = len(instanz.korrektoren)
+    n_klausuren = len(instanz.kandidaten)
+    korrektoren = range(n_korrektoren)
+    tage = [0, 1]
+    anzahl_korrektoren = instanz.anzahl_korrektoren_pro_klausur
+    spuren = range(anzahl_korrektoren)
+    tag_verfuegbarkeit = [instanz.korrektoren_an_tag(t) for t in tage]
+    quoten = tagesquoten(n_klausuren)
+
+    fortschritt("Optimierungsmodell (mit Zeitslots) wird aufgebaut...")
+    with messung.phase("modellaufbau"):
+        prob = pulp.LpProblem("Korrekturverteilung_Slots", pulp.LpMinimize)
+
+        # Ein Tag hat quoten[t] belegte Slots mit je anzahl_korrektoren Plätzen ("Spuren").
+        # Arbeitet jeder Korrektor in einem zusammenhängenden Block, lassen sich die Blöcke
+        # immer so auf die Spuren verteilen, dass jeder ganz in einer Spur liegt (Intervallgraph
+        # mit Überdeckung anzahl_korrektoren ist entsprechend färbbar). Es genügt also, je
+        # Korrektor und Tag Spur und Blocklänge zu wählen: jede Spur ist genau voll.
+        einsaetze = [(p, t, r) for t in tage for p in tag_verfuegbarkeit[t] for r in spuren]
+        in_spur = pulp.LpVariable.dicts("in_spur", einsaetze, 0, 1, pulp.LpBinary)
+        laenge = pulp.LpVariable.dicts("laenge", einsaetze, 0, None, pulp.LpInteger)
+        # Wie im MILP-Modell darf ein Korrektor anwesend sein, ohne zu korrigieren (sonst wäre
+        # MIN_ANWESEND bei wenigen Prüfungen je Tag nicht erreichbar)
+        anwesenheit = pulp.LpVariable.dicts(
+            "anwesenheit", ((p, t) for t in tage for p in tag_verfuegbarkeit[t]), 0, 1, pulp.LpBinary)
+        belastung = {p: pulp.lpSum(laenge[e] for e in einsaetze if e[0] == p) for p in korrektoren}
+        mittlere_belastung = anzahl_korrektoren * n_klausuren / n_korrektoren
+        abweichung = pulp.LpVariable.dicts("abweichung", korrektoren, 0)
+        for p in korrektoren:
+            prob += belastung[p] - mittlere_belastung <= abweichung[p]
+            prob += mittlere_belastung - belastung[p] <= abweichung[p]
+        prob += pulp.lpSum(abweichung[p] for p in korrektoren) >= _min_abweichung(anzahl_korrektoren * n_klausuren,
+                                                                                 n_korrektoren)
+
+        gewicht_abweichung, gewicht_anwesenheit = gewichte
+        prob += (
+            gewicht_abweichung * pulp.lpSum(abweichung[p] for p in korrektoren) +
+            gewicht_anwesenheit * pulp.lpSum(anwesenheit.values())
+        )
+
+        for p, t, r in einsaetze:
+            # Block nur in der gewählten Spur, dort mindestens eine Prüfung
+            prob += laenge[p, t, r] <= quoten[t] * in_spur[p, t, r]
+            prob += laenge[p, t, r] >= in_spur[p, t, r]
+            prob += in_spur[p, t, r] <= anwesenheit[p, t]
+
+        for t in tage:
+            # Slotkapazität: jede Spur ist an jedem belegten Slot genau einmal besetzt
+            for r in spuren:
+                prob += pulp.lpSum(laenge[p, t, r] for p in tag_verfuegbarkeit[t]) == quoten[t]
+            # Höchstens ein Block (eine Spur) je Korrektor und Tag
+            for p in tag_verfuegbarkeit[t]:
+                prob += pulp.lpSum(in_spur[p, t, r] for r in spuren) <= 1
+            prob += pulp.lpSum(anwesenheit[p, t] for p in tag_verfuegbarkeit[t]) >= MIN_ANWESEND
+
+            # Symmetriebrechung: Spuren sind vertauschbar, der erste verfügbare Korrektor
+            # liegt (wenn er einen Block hat) in der ersten Spur
+            if tag_verfuegbarkeit[t]:
+                erster = tag_verfuegbarkeit[t][0]
+                for r in spuren[1:]:
+                    prob += in_spur[erster, t, r] == 0
+
+        # Symmetriebrechung: Korrektoren mit gleicher Verfügbarkeit sind vertauschbar,
+        # innerhalb einer solchen Gruppe ist die Belastung absteigend
+        gruppen = {}
+        for p in korrektoren:
+            gruppen.setdefault(instanz.verfuegbarkeit[p], []).append(p)
+        for gruppe in gruppen.values():
+            for p, q in zip(gruppe, gruppe[1:]):
+                prob += belastung[p] >= belastung[q]
+
+        # Startlösung: Plan eines früheren Laufs, sonst gierig, damit CBC auch bei großen
+        # Instanzen früh einen guten Plan hat
+        werte = _spuren_aus_ergebnis(startloesung, tag_verfuegbarkeit, quoten) if startloesung else None
+        werte = werte or _spuren_startloesung(instanz, quoten, mittlere_belastung)
+        for (p, t, r), wert in werte.items():
+            in_spur[p, t, r].setInitialValue(1 if wert else 0)
+            laenge[p, t, r].setInitialValue(wert)
+        # Anwesend, wer einen Block hat, dazu bis MIN_ANWESEND verfügbare ohne Arbeit
+        for t in tage:
+            anwesend = {p for (p, tag, r), wert in werte.items() if tag == t and wert}
+            ohne_block = [p for p in tag_verfuegbarkeit[t] if p not in anwesend]
+            anwesend.update(ohne_block[:max(0, MIN_ANWESEND - len(anwesend))])
+            for p in tag_verfuegbarkeit[t]:
+                anwesenheit[p, t].setInitialValue(int(p in anwesend))
+
+    final_status = _loesen(prob, instanz, fortschritt, messung, zeitlimit, warmstart=True, engine="slots")
+    duration = messung.phasen["solver"]["wand"]
+
+    with messung.phase("extraktion"):
+        # Prüflinge in Listenreihenfolge: zuerst die Quote des ersten Tages, Slot = Position am Tag
+        klausur_tage = np.repeat(np.array(tage), quoten)
+        slots = np.concatenate([np.arange(q) for q in quoten]).astype(np.int16)
+        erste_klausur = [0, quoten[0]]
+
+        # Blöcke je Spur hintereinander legen
+        matrix = np.zeros((n_klausuren, n_korrektoren), dtype=np.uint8)
+        for t in tage:
+            for r in spuren:
+                beginn = erste_klausur[t]
+                for p in tag_verfuegbarkeit[t]:
+                    anzahl = int(round(laenge[p, t, r].varValue or 0))
+                    matrix[beginn:beginn + anzahl, p] = 1
+                    beginn += anzahl
+
+        statistik = berechne_statistik(matrix, klausur_tage, len(tage))
+
+    return Ergebnis(
+        instanz=instanz,
+        zuordnung=array("B", matrix.tobytes()),
+        tag=array("b", klausur_tage.astype(np.int8).tobytes()),
+        slot=array("h", slots.tobytes()),
+        status=final_status,
+        dauer=duration,
+        statistik=statistik,
+        engine="slots"
+    )
+
+
+def _spuren_startloesung(instanz, quoten, mittel) -> dict:
+    """
+    Blocklängen je (Korrektor, Tag, Spur) für das Slot-Modell: Spuren der Reihe nach mit
+    den bisher am wenigsten belasteten Korrektoren füllen, jeder bekommt seinen Anteil
+    am Mittelwert (verteilt auf seine verbleibenden Tage), der letzte den Rest der Spur.
+    """
+    belastung = [0] * len(instanz.korrektoren)
+    tage_uebrig = [bin(maske).count("1") for maske in instanz.verfuegbarkeit]
+    werte = {}
+    for t, quote in enumerate(quoten):
+        frei = sorted(instanz.korrektoren_an_tag(t), key=lambda p: belastung[p])
+        for r in range(instanz.anzahl_korrektoren_pro_klausur):
+            rest = quote
+            while rest and frei:
+                p = frei.pop(0)
+                anteil = max(1, round((mittel - belastung[p]) / max(tage_uebrig[p], 1)))
+                laenge = rest if not frei else min(rest, anteil)
+                werte[p, t, r] = laenge
+                belastung[p] += laenge
+                rest -= laenge
+        for p in instanz.korrektoren_an_tag(t):
+            tage_uebrig[p] -= 1
+
+    # Passend zur Symmetriebrechung des Modells umbenennen: innerhalb gleicher Verfügbarkeit
+    # absteigende Belastung, der erste verfügbare Korrektor eines Tages in der ersten Spur
+    neu = {}
+    gruppen = {}
+    for p, maske in enumerate(instanz.verfuegbarkeit):
+        gruppen.setdefault(maske, []).append(p)
+    for gruppe in gruppen.values():
+        neu.update(zip(sorted(gruppe, key=lambda p: -belastung[p]), gruppe))
+    werte = {(neu[p], t, r): laenge for (p, t, r), laenge in werte.items()}
+    for t in range(len(quoten)):
+        verfuegbar = instanz.korrektoren_an_tag(t)
+        spur = next((r for (p, tag, r) in werte if tag == t and verfuegbar and p == verfuegbar[0]), 0)
+        if spur:
+            werte = {(p, tag, {0: spur, spur: 0}.get(r, r) if tag == t else r): laenge
+                     for (p, tag, r), laenge in werte.items()}
+    return werte
+
+
+def _spuren_aus_ergebnis(ergebnis, tag_verfuegbarkeit, quoten) -> dict | None:
+    """
+    Blocklängen je (Korrektor, Tag, Spur) aus einem Plan des Slot-Modells, Umkehrung der
+    Extraktion in _berechne_slots: die Blöcke eines Tages liegen je Spur in der Reihenfolge der
+    verfügbaren Korrektoren hintereinander. None, wenn der Plan nicht von der Slot-Engine stammt
+    oder nicht so aufgebaut ist (CBC würde eine unzulässige Startlösung stillschweigend verwerfen).
+    """
+    if ergebnis.engine != "slots":
+        return None
+    matrix = ergebnis.matrix()
+    spuren = ergebnis.instanz.anzahl_korrektoren_pro_klausur
+    werte = {}
+    erste_klausur = 0
+    for t, quote in enumerate(quoten):
+        tag = matrix[erste_klausur:erste_klausur + quote]
+        ende = [0] * spuren
+        for p in tag_verfuegbarkeit[t]:
+            zeilen = np.flatnonzero(tag[:, p])
+            if not len(zeilen):
+                continue
+            beginn, laenge = int(zeilen[0]), len(zeilen)
+            # Block beginnt am Ende einer Spur, die erste passende nehmen
+            r = next((r for r in range(spuren) if ende[r] == beginn), None)
+            if r is None or zeilen[-1] - beginn + 1 != laenge:
+                return None
+            werte[p, t, r] = laenge
+            ende[r] += laenge
+        # Jede Spur muss genau voll sein
+        if ende != [quote] * spuren:
+            return None
+        erste_klausur += quote
+    return werte
+
+
+def erklaere_unloesbarkeit(eingabedaten, zeitlimit=ZEITLIMIT, engine="milp") -> list[str]:
+    """
+    Erklärt, warum das Modell der Engine keine Lösung hat: löst eine elastische Fassung, in der
+    die Regeln gegen Strafe verletzt werden dürfen (Schlupfvariablen), und meldet die
+    kleinste Verletzung je Regel mit den betroffenen Tagen bzw. Prüflingen.
+    Leere Liste = das Modell ist lösbar. Die Zahl der Zeitslots gehört nicht zum Modell,
+    dafür siehe validierung.pruefe_instanz.
+    """
+    instanz = eingabedaten if isinstance(eingabedaten, Instanz) else Instanz.aus_eingabedaten(eingabedaten)
+    if engine == "slots":
+        return _erklaere_slots(instanz, zeitlimit)
+    return _erklaere_milp(instanz, zeitlimit)
+
+
+def _elastisch_loesen(prob, zeitlimit) -> bool:
+    prob.solve(pulp.PULP_CBC_CMD(timeLimit=zeitlimit, msg=False, logPath=solver_log_pfad()))
+    if pulp.LpStatus[prob.status] != "Optimal":
+        logger.warning("Elastisches Modell nicht gelöst: %s", pulp.LpStatus[prob.status])
+        return False
+    return True
+
+
+def _ganzzahl(var) -> int:
+    return int(round(var.varValue or 0))
+
+
+def _erklaere_milp(instanz, zeitlimit) -> list[str]:
+    n_korrektoren = len(instanz.korrektoren)
+    korrektoren = range(n_korrektoren)
+    klausuren = range(len(instanz.kandidaten))
+    tage = range(len(instanz.tage))
+    anzahl_korrektoren = instanz.anzahl_korrektoren_pro_klausur
+    tag_verfuegbarkeit = [instanz.korrektoren_an_tag(t) for t in tage]
+    quoten = tagesquoten(len(instanz.kandidaten))
+
+    prob = pulp.LpProblem("Korrekturverteilung_elastisch", pulp.LpMinimize)
+    x = pulp.LpVariable.dicts("x", ((k, p) for k in klausuren for p in korrektoren), 0, 1, pulp.LpBinary)
+    klausur_tag = pulp.LpVariable.dicts("klausur_tag", ((k, t) for k in klausuren for t in tage), 0, 1, pulp.LpBinary)
+    anwesenheit = pulp.LpVariable.dicts("anwesenheit", ((p, t) for p in korrektoren for t in tage), 0, 1, pulp.LpBinary)
+
+    # Schlupf je Regel: fehlende Korrektoren je Prüfung, Prüfung ohne verfügbaren Korrektor,
+    # Abweichung von der Tagesquote, fehlende Anwesende je Tag
+    fehlt_korrektor = pulp.LpVariable.dicts("fehlt_korrektor", klausuren, 0)
+    ohne_verfuegbare = pulp.LpVariable.dicts("ohne_verfuegbare", ((k, t) for k in klausuren for t in tage), 0)
+    quote_plus = pulp.LpVariable.dicts("quote_plus", tage, 0)
+    quote_minus = pulp.LpVariable.dicts("quote_minus", tage, 0)
+    fehlt_anwesend = pulp.LpVariable.dicts("fehlt_anwesend", tage, 0)
+
+    prob += (
+        pulp.lpSum(fehlt_korrektor.values()) + pulp.lpSum(ohne_verfuegbare.values())
+        + pulp.lpSum(quote_plus.values()) + pulp.lpSum(quote_minus.values())
+        + pulp.lpSum(fehlt_anwesend.values())
+    )
+
+    for k in klausuren:
+        prob += pulp.lpSum(x[k, p] for p in korrektoren) + fehlt_korrektor[k] == anzahl_korrektoren
+        for t in tage:
+            prob += klausur_tag[k, t] <= pulp.lpSum(x[k, p] for p in tag_verfuegbarkeit[t]) + ohne_verfuegbare[k, t]
+        prob += pulp.lpSum(klausur_tag[k, t] for t in tage) == 1
+
+    for t in tage:
+        prob += pulp.lpSum(klausur_tag[k, t] for k in klausuren) + quote_minus[t] - quote_plus[t] == quoten[t]
+        prob += pulp.lpSum(anwesenheit[p, t] for p in tag_verfuegbarkeit[t]) + fehlt_anwesend[t] >= MIN_ANWESEND
+        for p in tag_verfuegbarkeit[t]:
+            for k in klausuren:
+                prob += x[k, p] <= anwesenheit[p, t]
+
+    if not _elastisch_loesen(prob, zeitlimit):
+        return []
+
+    gruende = []
+    for t in tage:
+        tag = f"Tag {t + 1} ({instanz.tage[t]})"
+        if _ganzzahl(fehlt_anwesend[t]):
+            gruende.append(f"{tag}: nur {len(tag_verfuegbarkeit[t])} Korrektoren verfügbar, "
+                           f"mindestens {MIN_ANWESEND} nötig")
+        abweichung = _ganzzahl(quote_plus[t]) - _ganzzahl(quote_minus[t])
+        if abweichung:
+            gruende.append(f"{tag}: Tagesquote von {quoten[t]} Prüfungen nicht einhaltbar "
+                           f"({quoten[t] + abweichung} möglich)")
+        ohne = [instanz.kandidaten[k] for k in klausuren if _ganzzahl(ohne_verfuegbare[k, t])]
+        if ohne:
+            gruende.append(f"{tag}: {len(ohne)} Prüfungen ohne verfügbaren Korrektor ({', '.join(ohne[:5])}"
+                           f"{', ...' if len(ohne) > 5 else ''})")
+    unterbesetzt = [instanz.kandidaten[k] for k in klausuren if _ganzzahl(fehlt_korrektor[k])]
+    if unterbesetzt:
+        gruende.append(f"{len(unterbesetzt)} Prüfungen mit weniger als {anzahl_korrektoren} Korrektoren "
+                       f"(nur {n_korrektoren} Korrektoren eingetragen)")
+    return gruende
+
+
+def _erklaere_slots(instanz, zeitlimit) -> list[str]:
+    """Elastische Fassung von _berechne_slots: Spuren dürfen unbesetzte Plätze haben."""
+    tage = range(len(instanz.tage))
+    anzahl_korrektoren = instanz.anzahl_korrektoren_pro_klausur
+    spuren = range(anzahl_korrektoren)
+    tag_verfuegbarkeit = [instanz.korrektoren_an_tag(t) for t in tage]
+    quoten = tagesquoten(len(instanz.kandidaten))
+
+    prob = pulp.LpProblem("Korrekturverteilung_Slots_elastisch", pulp.LpMinimize)
+    einsaetze = [(p, t, r) for t in tage for p in tag_verfuegbarkeit[t] for r in spuren]
+    in_spur = pulp.LpVariable.dicts("in_spur", einsaetze, 0, 1, pulp.LpBinary)
+    laenge = pulp.LpVariable.dicts("laenge", einsaetze, 0, None, pulp.LpInteger)
+    anwesenheit = pulp.LpVariable.dicts(
+        "anwesenheit", ((p, t) for t in tage for p in tag_verfuegbarkeit[t]), 0, 1, pulp.LpBinary)
+
+    # Schlupf je Regel: unbesetzte Plätze je Spur, fehlende Anwesende je Tag
+    unbesetzt = pulp.LpVariable.dicts("unbesetzt", ((t, r) for t in tage for r in spuren), 0)
+    fehlt_anwesend = pulp.LpVariable.dicts("fehlt_anwesend", tage, 0)
+    prob += pulp.lpSum(unbesetzt.values()) + pulp.lpSum(fehlt_anwesend.values())
+
+    for p, t, r in einsaetze:
+        prob += laenge[p, t, r] <= quoten[t] * in_spur[p, t, r]
+        prob += laenge[p, t, r] >= in_spur[p, t, r]
+        prob += in_spur[p, t, r] <= anwesenheit[p, t]
+    for t in tage:
+        for r in spuren:
+            prob += pulp.lpSum(laenge[p, t, r] for p in tag_verfuegbarkeit[t]) + unbesetzt[t, r] == quoten[t]
+        for p in tag_verfuegbarkeit[t]:
+            prob += pulp.lpSum(in_spur[p, t, r] for r in spuren) <= 1
+        prob += pulp.lpSum(anwesenheit[p, t] for p in tag_verfuegbarkeit[t]) + fehlt_anwesend[t] >= MIN_ANWESEND
+
+    if not _elastisch_loesen(prob, zeitlimit):
+        return []
+
+    gruende = []
+    for t in tage:
+        tag = f"Tag {t + 1} ({instanz.tage[t]})"
+        if _ganzzahl(fehlt_anwesend[t]):
+            gruende.append(f"{tag}: nur {len(tag_verfuegbarkeit[t])} Korrektoren verfügbar, "
+                           f"mindestens {MIN_ANWESEND} nötig")
+        plaetze = sum(_ganzzahl(unbesetzt[t, r]) for r in spuren)
+        if plaetze:
+            gruende.append(f"{tag}: {plaetze} Korrektorplätze in den Zeitslots unbesetzt (nur "
+                           f"{len(tag_verfuegbarkeit[t])} Korrektoren verfügbar, je Prüfung "
+                           f"{anzahl_korrektoren} verschiedene nötig)")
+    return gruende
+
+
+# Name -> Funktion(eingabedaten, profil=False, zeitlimit=..., fortschritt=None,
+#                  gewichte=None, startloesung=None) -> Ergebnis
+ENGINES = {
+    "milp": berechne_korrektorenverteilung,
+    "slots": berechne_slotverteilung,
+}
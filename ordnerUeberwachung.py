@@ -0,0 +1,278 @@
+"""
+Überwachungsmodus: beobachtet einen Ordner mit Prüfungsausschüssen und plant bei
+jeder Änderung der Eingabedateien automatisch neu.
+
+Aufbau des überwachten Ordners (der Ordner selbst und jeder direkte Unterordner
+ist je ein Prüfungsausschuss):
+
+    ausschuss_a/
+        prueflinge.txt      Prüflingsliste (eine Zeile je Prüfling)
+        korrektoren.txt     Korrektorenliste im Format '# version=3' (oder 2)
+        ausschuss.json      optional: {"pruefungstage": [...], "zeitslots": [[...], [...]]}
+        verteilung.pdf      <- wird erzeugt
+        verteilung.json     <- wird erzeugt
+
+Aufruf:
+    python ordnerUeberwachung.py ORDNER [--poll SEKUNDEN] [--verzoegerung MS] [--ohne-verlauf]
+"""
+import argparse
+import json
+import logging
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication, QFileSystemWatcher, QTimer
+
+from dateien import (
+    ist_korrektorendatei, lese_kandidatendatei, lese_korrektorendatei, schreibe_atomar
+)
+from einstellungen import lese_einstellungen
+from modell import KandidatenIndex
+from optimierung import berechne_korrektorenverteilung
+from pdfBericht import erzeuge_pdf
+from validierung import NichtLoesbar, pruefe_kandidaten
+from verlauf import Verlauf
+import protokoll
+
+logger = logging.getLogger(__name__)
+
+AUSSCHUSS_DATEI = "ausschuss.json"
+AUSGABE_PDF = "verteilung.pdf"
+AUSGABE_JSON = "verteilung.json"
+
+
+def lade_zeitslots():
+    """Zeitslots wie in der GUI aus den Einstellungen, sonst die Standardwerte."""
+    return lese_einstellungen()["zeitslots"]
+
+
+def finde_eingabedateien(ordner: Path):
+    """Liefert (Prüflingsdatei, Korrektorendatei) eines Ausschussordners oder None."""
+    kandidatendatei = None
+    korrektorendatei = None
+    for pfad in sorted(ordner.glob("*.txt")):
+        if pfad.name.startswith("."):
+            continue
+        if ist_korrektorendatei(pfad):
+            korrektorendatei = korrektorendatei or pfad
+        elif pfad.name == "prueflinge.txt" or kandidatendatei is None:
+            kandidatendatei = pfad
+    if kandidatendatei and korrektorendatei:
+        return kandidatendatei, korrektorendatei
+    return None
+
+
+def eingabe_signatur(ordner: Path):
+    """Änderungsmerkmal (Name, mtime, Größe) aller Eingabedateien eines Ausschusses."""
+    signatur = []
+    for pfad in sorted(ordner.iterdir()):
+        if pfad.name.startswith(".") or not pfad.is_file():
+            continue
+        if pfad.suffix == ".txt" or pfad.name == AUSSCHUSS_DATEI:
+            st = pfad.stat()
+            signatur.append((pfad.name, st.st_mtime_ns, st.st_size))
+    return tuple(signatur)
+
+
+def baue_eingabedaten(ordner: Path) -> dict:
+    """Baut das Eingabedaten-Dictionary wie MainWindow.sammle_eingabedaten."""
+    dateien = finde_eingabedateien(ordner)
+    if dateien is None:
+        raise ValueError("Prüflings- oder Korrektorenliste fehlt")
+    kandidatendatei, korrektorendatei = dateien
+
+    ausschuss = {}
+    ausschuss_pfad = ordner / AUSSCHUSS_DATEI
+    if ausschuss_pfad.exists():
+        with open(ausschuss_pfad, "r", encoding="utf-8") as f:
+            ausschuss = json.load(f)
+
+    # Ohne Angabe wie in der GUI: in einer und in zwei Wochen
+    pruefungstage = ausschuss.get("pruefungstage") or [
+        (date.today() + timedelta(days=7)).isoformat(),
+        (date.today() + timedelta(days=14)).isoformat()
+    ]
+
+    # Im Format version=2 gilt die Anwesenheit für alle Tage
+    verfuegbarkeiten = {}
+    for name, tage in lese_korrektorendatei(korrektorendatei, len(pruefungstage)):
+        anwesend = [datum for datum, da in zip(pruefungstage, tage) if da]
+        if name and anwesend:
+            verfuegbarkeiten[name] = anwesend
+
+    kandidaten = KandidatenIndex.aus_zeilen(lese_kandidatendatei(kandidatendatei))
+    gruende = pruefe_kandidaten(kandidaten)
+    if gruende:
+        raise NichtLoesbar(gruende)
+
+    return {
+        "verfügbarkeiten": verfuegbarkeiten,
+        "kandidaten": kandidaten.als_eingabedaten(),
+        "pruefungstage": pruefungstage,
+        "anzahl_korrektoren_pro_klausur": 2,
+        "zeitslots": ausschuss.get("zeitslots") or lade_zeitslots()
+    }
+
+
+def plane_ausschuss(ordner: Path, verlauf: Verlauf | None = None, ausschuss=None) -> str:
+    """Löst einen Ausschuss und schreibt PDF und JSON atomar neben die Eingabe (und ggf. in den Verlauf)."""
+    eingabedaten = baue_eingabedaten(ordner)
+    ergebnis = berechne_korrektorenverteilung(eingabedaten)
+
+    verteilung = {
+        datum: [
+            {"zeit": zeit, "pruefling": pruefling, "korrektoren": list(pruefer)}
+            for zeit, pruefling, pruefer in eintraege
+        ]
+        for datum, eintraege in ergebnis.verteilung().items()
+    }
+    plan = {
+        "erstellt": datetime.now().isoformat(timespec="seconds"),
+        "status": ergebnis.status,
+        "pruefungstage": eingabedaten["pruefungstage"],
+        "verteilung": verteilung,
+        # Je Prüflingsnummer, für Vergleiche zwischen zwei Läufen
+        "prueflinge": {
+            schluessel: {"datum": datum, "zeit": zeit, "korrektoren": list(pruefer)}
+            for schluessel, (datum, zeit, pruefer) in ergebnis.plan().items()
+        }
+    }
+
+    pdf = erzeuge_pdf(ergebnis)
+    schreibe_atomar(ordner / AUSGABE_PDF, pdf)
+    if verlauf is not None:
+        verlauf.pdf_speichern(verlauf.speichern(ergebnis, ausschuss or ordner.name), pdf)
+    schreibe_atomar(ordner / AUSGABE_JSON, json.dumps(plan, indent=2, ensure_ascii=False).encode("utf-8"))
+    return ergebnis.status
+
+
+class OrdnerUeberwachung:
+    """
+    Beobachtet den Wurzelordner und seine direkten Unterordner.
+    Auf Linux nutzt QFileSystemWatcher inotify; wo das nicht geht
+    (oder mit --poll, z.B. für Netzlaufwerke) wird periodisch abgefragt.
+    """
+
+    def __init__(self, wurzel: Path, verzoegerung_ms=1000, poll_sekunden=None, verlauf=None):
+        self.wurzel = wurzel.resolve()
+        self.verlauf = verlauf
+        self.verzoegerung_ms = verzoegerung_ms
+        self.signaturen = {}    # Ausschussordner -> Signatur beim letzten Lauf
+        self.timer = {}         # Ausschussordner -> Entprell-Timer
+
+        self.watcher = None
+        self.poll_timer = None
+
+        if poll_sekunden is None:
+            self.watcher = QFileSystemWatcher()
+            if self.watcher.addPath(str(self.wurzel)):
+                self.watcher.directoryChanged.connect(self.pfad_geaendert)
+                self.watcher.fileChanged.connect(self.pfad_geaendert)
+            else:
+                logger.warning("Dateisystem-Benachrichtigungen nicht verfügbar, weiche auf Abfrage aus.")
+                self.watcher = None
+                poll_sekunden = 2
+
+        if poll_sekunden is not None:
+            self.poll_timer = QTimer()
+            self.poll_timer.setInterval(int(poll_sekunden * 1000))
+            self.poll_timer.timeout.connect(self.abfragen)
+            self.poll_timer.start()
+
+        self.aktualisiere_ueberwachung()
+        for ordner in self.ausschuesse():
+            self.einplanen(ordner)
+
+    def ausschuesse(self):
+        ordner = [self.wurzel]
+        ordner += [p for p in sorted(self.wurzel.iterdir()) if p.is_dir() and not p.name.startswith(".")]
+        return [o for o in ordner if finde_eingabedateien(o)]
+
+    def aktualisiere_ueberwachung(self):
+        """Neue Unterordner und (nach Umbenennen durch Editoren) Dateien wieder anmelden."""
+        if self.watcher is None:
+            return
+        bekannt = set(self.watcher.directories()) | set(self.watcher.files())
+        neu = []
+        for ordner in [self.wurzel] + [p for p in self.wurzel.iterdir() if p.is_dir()]:
+            if str(ordner) not in bekannt:
+                neu.append(str(ordner))
+            for pfad in ordner.glob("*.txt"):
+                if str(pfad) not in bekannt:
+                    neu.append(str(pfad))
+            if (ordner / AUSSCHUSS_DATEI).exists() and str(ordner / AUSSCHUSS_DATEI) not in bekannt:
+                neu.append(str(ordner / AUSSCHUSS_DATEI))
+        if neu:
+            self.watcher.addPaths(neu)
+
+    def pfad_geaendert(self, pfad):
+        pfad = Path(pfad)
+        ordner = pfad if pfad.is_dir() else pfad.parent
+        self.aktualisiere_ueberwachung()
+        if ordner == self.wurzel:
+            # Im Wurzelordner können auch neue Ausschussordner entstanden sein
+            for ausschuss in self.ausschuesse():
+                self.einplanen(ausschuss)
+        else:
+            self.einplanen(ordner)
+
+    def abfragen(self):
+        for ordner in self.ausschuesse():
+            if eingabe_signatur(ordner) != self.signaturen.get(ordner):
+                self.einplanen(ordner)
+
+    def einplanen(self, ordner: Path):
+        """Entprellen: erst nach einer Ruhephase wird der Ausschuss neu geplant."""
+        timer = self.timer.get(ordner)
+        if timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda o=ordner: self.neu_planen(o))
+            self.timer[ordner] = timer
+        timer.start(self.verzoegerung_ms)
+
+    def neu_planen(self, ordner: Path):
+        if not ordner.is_dir() or not finde_eingabedateien(ordner):
+            return
+        signatur = eingabe_signatur(ordner)
+        if signatur == self.signaturen.get(ordner):
+            return  # z.B. nur eigene Ausgabedateien geändert
+        self.signaturen[ordner] = signatur
+
+        name = ordner.relative_to(self.wurzel) if ordner != self.wurzel else ordner.name
+        try:
+            status = plane_ausschuss(ordner, self.verlauf, str(name))
+            logger.info("%s: neu geplant (%s)", name, status)
+        except Exception as e:
+            logger.exception("%s: Planung fehlgeschlagen: %s", name, e)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ordner überwachen und Prüfungsverteilungen automatisch neu planen.")
+    parser.add_argument("ordner", help="zu überwachender Ordner")
+    parser.add_argument("--poll", type=float, metavar="SEKUNDEN",
+                        help="Ordner periodisch abfragen statt Dateisystem-Benachrichtigungen zu nutzen")
+    parser.add_argument("--verzoegerung", type=int, default=1000, metavar="MS",
+                        help="Ruhezeit nach der letzten Änderung vor dem Neuplanen (Standard: 1000)")
+    parser.add_argument("--ohne-verlauf", action="store_true",
+                        help="Läufe nicht im Verlauf (~/.pvihk_verlauf.sqlite) ablegen")
+    args = parser.parse_args(argv)
+
+    wurzel = Path(args.ordner)
+    if not wurzel.is_dir():
+        parser.error(f"{wurzel} ist kein Ordner")
+
+    protokoll.einrichten()
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    verlauf = None if args.ohne_verlauf else Verlauf()
+    ueberwachung = OrdnerUeberwachung(wurzel, args.verzoegerung, args.poll, verlauf)
+    logger.info("Überwache %s (%s)", ueberwachung.wurzel, "Abfrage" if ueberwachung.poll_timer else "Benachrichtigung")
+    code = app.exec()
+    if verlauf is not None:
+        verlauf.schliessen()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import multiprocessing
+import os
+import re
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from fpdf import FPDF
+
+from versioning import get_app_metadata
+
+# Kein Hochzählen der Buildnummer: das Modul wird auch ohne GUI genutzt
+VERSION = get_app_metadata()["VERSION"]
+
+
+class FooterPDF(FPDF):
+    def footer(self):
+        self.set_y(-10)
+        self.set_font("Arial", size=8)
+        self.cell(0, 5, f"Erstellt von PVIHK({VERSION}) am {datetime.now().strftime('%d.%m.%Y %H:%M:%S')} - created by fz@zenmeister.de", align="C")
+
+
+def erzeuge_pdf(ergebnis, pdf_pfad=None, fortschritt=None):
+    """
+    Erzeugt das PDF (Zeitplan, Korrektorenübersicht, Versand und Weitergabe)
+    aus einem Ergebnis (modell.Ergebnis) von berechne_korrektorenverteilung.
+
+    Mit pdf_pfad wird das (komprimierte) PDF direkt in diese Datei geschrieben
+    und der Pfad zurückgegeben, sonst kommen die Bytes zurück.
+    """
+    if fortschritt is None:
+        fortschritt = lambda text: None
+    fortschritt("PDF wird erzeugt...")
+
+    klausurverteilung = ergebnis.verteilung()
+    zuordnung = ergebnis.zuordnung_namen()
+    korrektornamen = ergebnis.instanz.korrektoren
+
+    versand_start = defaultdict(list)
+    weitergaben = defaultdict(list)
+
+    paarweise = defaultdict(list)
+    for klausurname, pruefer in zuordnung:
+        if len(pruefer) == 2:
+            p1, p2 = sorted(pruefer)
+            paarweise[(p1, p2)].append(klausurname)
+    for (p1, p2), klist in paarweise.items():
+        versand_start[p1].extend(klist)
+        weitergaben[(p1, p2)].extend(klist)
+
+    pdf = FooterPDF()
+    pdf.set_compression(True)
+    pdf.set_auto_page_break(auto=True, margin=10)
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 8, "Prüfungsverteilung nach Tagen und aktiven Korrektoren", ln=True)
+    pdf.ln(3)
+
+    for datum, termine in klausurverteilung.items():
+        pdf.set_font("Arial", "B", 10)
+        pdf.cell(0, 6, f"Zeitplan: {datum}", ln=True)
+        pdf.set_fill_color(200, 200, 220)
+        pdf.cell(22, 6, "Zeit", border=1, fill=True)
+        pdf.cell(78, 6, "Prüfung", border=1, fill=True)
+        pdf.cell(85, 6, "Korrektoren", border=1, ln=True, fill=True)
+        pdf.set_font("Arial", size=9)
+        for zeit, klausurname, pruefer in termine:
+            pdf.cell(22, 6, zeit, border=1)
+            pdf.cell(78, 6, klausurname, border=1)
+            pdf.cell(85, 6, ", ".join(pruefer), border=1, ln=True)
+        pdf.ln(3)
+
+    # Korrektorenübersicht mit Partnern
+    pdf.ln(4)
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(0, 6, "Korrektorenübersicht mit Partnern", ln=True)
+    pdf.set_font("Arial", "B", 9)
+    pdf.cell(60, 6, "Korrektor (gesamt)", border=1)
+    pdf.cell(130, 6, "Verteilung auf Partner", border=1, ln=True)
+    pdf.set_font("Arial", size=9)
+
+    statistik = ergebnis.statistik
+    index = {p: i for i, p in enumerate(korrektornamen)}
+
+    for p in sorted(korrektornamen):
+        i = index[p]
+        partnertext = ', '.join(
+            f"{q}({statistik['partner'][i, index[q]]})"
+            for q in sorted(korrektornamen) if statistik['partner'][i, index[q]]
+        )
+        pdf.set_text_color(0, 0, 200)
+        pdf.cell(60, 6, f"{p} ({statistik['belastung'][i]})", border=1)
+        pdf.set_text_color(0)
+        pdf.cell(130, 6, partnertext, border=1, ln=True)
+
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(0, 6, "Versand und Weitergabe der Klausuren", ln=True)
+    pdf.ln(4)
+    pdf.set_font("Arial", "B", 10)
+    for sender, klist in versand_start.items():
+        pdf.cell(0, 6, f"{sender} erhält:", ln=True)
+        pdf.set_font("Arial", size=10)
+        for klausurname in klist:
+            pdf.cell(0, 6, f"   - {klausurname}", ln=True)
+        pdf.set_font("Arial", "B", 10)
+        pdf.ln(2)
+    for (sender, empfaenger), klist in weitergaben.items():
+        pdf.cell(0, 6, f"{sender} -> {empfaenger}:", ln=True)
+        pdf.set_font("Arial", size=10)
+        for klausurname in klist:
+            pdf.cell(0, 6, f"   - {klausurname}", ln=True)
+        pdf.set_font("Arial", "B", 10)
+        pdf.ln(2)
+
+    if pdf_pfad:
+        pdf.output(pdf_pfad, 'F')
+        return pdf_pfad
+    return pdf.output(dest='S').encode('latin1')
+
+
+def erzeuge_korrektorenmappe(ergebnis, korrektor) -> bytes:
+    """
+    Persönliche Unterlagen eines Korrektors: eigene Prüfungen mit Zeit und Partner,
+    Anwesenheitstage, sowie von wem er Arbeiten erhält und an wen er sie weitergibt.
+    """
+    eigene_termine = []
+    for datum, termine in ergebnis.verteilung().items():
+        for zeit, klausurname, pruefer in termine:
+            if korrektor in pruefer:
+                partner = ", ".join(p for p in pruefer if p != korrektor)
+                eigene_termine.append((datum, zeit, klausurname, partner))
+
+    # Wie im Gesamt-PDF: der alphabetisch erste Korrektor eines Paars erhält die Arbeit
+    # und gibt sie an den zweiten weiter
+    erhaelt_direkt = []
+    weitergabe_an = defaultdict(list)
+    erhaelt_von = defaultdict(list)
+    for klausurname, pruefer in ergebnis.zuordnung_namen():
+        if len(pruefer) != 2 or korrektor not in pruefer:
+            continue
+        p1, p2 = sorted(pruefer)
+        if korrektor == p1:
+            erhaelt_direkt.append(klausurname)
+            weitergabe_an[p2].append(klausurname)
+        else:
+            erhaelt_von[p1].append(klausurname)
+
+    instanz = ergebnis.instanz
+    korrektornamen = instanz.korrektoren
+    p = korrektornamen.index(korrektor)
+    partner_zeile = ergebnis.statistik["partner"][p]
+    partner_anzahl = {q: int(n) for q, n in zip(korrektornamen, partner_zeile) if n}
+
+    pdf = FooterPDF()
+    pdf.set_compression(True)
+    pdf.set_auto_page_break(auto=True, margin=10)
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 8, f"Korrekturunterlagen für {korrektor}", ln=True)
+    pdf.ln(3)
+
+    # Anwesend nur an verfügbaren Tagen mit eigener Arbeit (das MILP kann Arbeiten auch
+    # an Tagen zuteilen, an denen der Korrektor nicht da ist)
+    tage = [datum for t, datum in enumerate(instanz.tage)
+            if instanz.verfuegbar(p, t) and ergebnis.statistik["belastung_pro_tag"][p, t] > 0]
+    pdf.set_font("Arial", size=10)
+    pdf.cell(0, 6, f"Anwesenheit: {', '.join(tage) if tage else 'keine'}", ln=True)
+    pdf.cell(0, 6, f"Arbeiten insgesamt: {len(eigene_termine)}", ln=True)
+    pdf.ln(3)
+
+    pdf.set_font("Arial", "B", 10)
+    pdf.set_fill_color(200, 200, 220)
+    pdf.cell(25, 6, "Datum", border=1, fill=True)
+    pdf.cell(15, 6, "Zeit", border=1, fill=True)
+    pdf.cell(85, 6, "Prüfung", border=1, fill=True)
+    pdf.cell(65, 6, "Partner", border=1, ln=True, fill=True)
+    pdf.set_font("Arial", size=9)
+    for datum, zeit, klausurname, partner in eigene_termine:
+        pdf.cell(25, 6, datum, border=1)
+        pdf.cell(15, 6, zeit, border=1)
+        pdf.cell(85, 6, klausurname, border=1)
+        pdf.cell(65, 6, partner, border=1, ln=True)
+
+    pdf.ln(4)
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(0, 6, "Partner", ln=True)
+    pdf.set_font("Arial", size=10)
+    pdf.cell(0, 6, ', '.join(f"{q}({n})" for q, n in sorted(partner_anzahl.items())) or "-", ln=True)
+
+    pdf.ln(4)
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(0, 6, "Versand und Weitergabe", ln=True)
+    pdf.set_font("Arial", "B", 10)
+    if erhaelt_direkt:
+        pdf.cell(0, 6, "Sie erhalten direkt:", ln=True)
+        pdf.set_font("Arial", size=10)
+        for klausurname in erhaelt_direkt:
+            pdf.cell(0, 6, f"   - {klausurname}", ln=True)
+        pdf.set_font("Arial", "B", 10)
+        pdf.ln(2)
+    for absender, klist in sorted(erhaelt_von.items()):
+        pdf.cell(0, 6, f"Sie erhalten von {absender}:", ln=True)
+        pdf.set_font("Arial", size=10)
+        for klausurname in klist:
+            pdf.cell(0, 6, f"   - {klausurname}", ln=True)
+        pdf.set_font("Arial", "B", 10)
+        pdf.ln(2)
+    for empfaenger, klist in sorted(weitergabe_an.items()):
+        pdf.cell(0, 6, f"Sie geben weiter an {empfaenger}:", ln=True)
+        pdf.set_font("Arial", size=10)
+        for klausurname in klist:
+            pdf.cell(0, 6, f"   - {klausurname}", ln=True)
+        pdf.set_font("Arial", "B", 10)
+        pdf.ln(2)
+
+    return pdf.output(dest='S').encode('latin1')
+
+
+def mappen_dateiname(korrektor) -> str:
+    return "Korrektorenmappe_" + (re.sub(r"[^\w.-]+", "_", korrektor).strip("_") or "Korrektor") + ".pdf"
+
+
+def mappen_dateinamen(korrektoren) -> dict[str, str]:
+    """
+    Eindeutige Dateinamen je Korrektor: Namen wie 'A B' und 'A_B' ergeben sonst denselben
+    (auch bei Groß-/Kleinschreibung, wegen Dateisystemen ohne Unterscheidung); Zähler ab _2.
+    """
+    namen = {}
+    vergeben = set()
+    for korrektor in korrektoren:
+        dateiname = mappen_dateiname(korrektor)
+        stamm, nummer = dateiname[:-len(".pdf")], 1
+        while dateiname.casefold() in vergeben:
+            nummer += 1
+            dateiname = f"{stamm}_{nummer}.pdf"
+        vergeben.add(dateiname.casefold())
+        namen[korrektor] = dateiname
+    return namen
+
+
+def erzeuge_mappen_archiv(ergebnis, zip_pfad, fortschritt=None, max_prozesse=None):
+    """
+    Erzeugt die Korrektorenmappen parallel in einem Prozesspool
+    und packt sie in ein ZIP-Archiv. Liefert den Pfad des Archivs.
+    """
+    if fortschritt is None:
+        fortschritt = lambda text: None
+
+    korrektoren = sorted(ergebnis.instanz.korrektoren)
+    max_prozesse = max_prozesse or min(len(korrektoren), os.cpu_count() or 1) or 1
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_prozesse, mp_context=ctx) as pool:
+        auftraege = {pool.submit(erzeuge_korrektorenmappe, ergebnis, k): k for k in korrektoren}
+        mappen = {}
+        for nummer, auftrag in enumerate(as_completed(auftraege), start=1):
+            mappen[auftraege[auftrag]] = auftrag.result()
+            fortschritt(f"Korrektorenmappen: {nummer}/{len(korrektoren)} erzeugt...")
+
+    # PDFs sind bereits komprimiert, daher nur speichern
+    dateinamen = mappen_dateinamen(korrektoren)
+    with zipfile.ZipFile(zip_pfad, "w", compression=zipfile.ZIP_STORED) as archiv:
+        for korrektor in korrektoren:
+            archiv.writestr(dateinamen[korrektor], mappen[korrektor])
+    return zip_pfad
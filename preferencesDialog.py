@@ -1,12 +1,17 @@
 from PySide6.QtWidgets import QDialog, QHeaderView, QTableWidgetItem
-from PySide6.QtCore import Qt, QTime
-from datetime import datetime, timedelta
-import json
-from pathlib import Path
+from PySide6.QtCore import Qt, QTime, QTimer
+import logging
+from einstellungen import Einstellungen
 from preferences import Ui_Preferences
 
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
+MIN_PAUSE = 15              # Minuten zwischen Vormittag und Nachmittag
+TAGESENDE = 18 * 60         # letzte Prüfung endet spätestens um 18:00
+AKTUALISIEREN_NACH_MS = 150
+
 @contextmanager
 def block_signals(widgets):
     for w in widgets:
@@ -17,174 +22,127 @@ def block_signals(widgets):
         for w in widgets:
             w.blockSignals(False)
 
+def berechne_zeiten(begin1: QTime, dauer1: int, begin2: QTime, dauer2: int) -> tuple[list[str], int]:
+    """Prüfungszeiten aus Beginn und Dauer von Vormittag und Nachmittag, dazu die Mittagspause in Minuten."""
+    start1 = begin1.hour() * 60 + begin1.minute()
+    start2 = begin2.hour() * 60 + begin2.minute()
+    minuten = []
+
+    aktuelle = start1
+    while aktuelle + dauer1 <= start2 - MIN_PAUSE:
+        minuten.append(aktuelle)
+        aktuelle += dauer1
+    pause = start2 - aktuelle
+
+    aktuelle = start2
+    while aktuelle + dauer2 <= TAGESENDE:
+        minuten.append(aktuelle)
+        aktuelle += dauer2
+    return [f"{m // 60:02d}:{m % 60:02d}" for m in minuten], pause
+
 class PreferencesDialog(QDialog, Ui_Preferences):
-    def __init__(self, parent=None, preferences_path=None):
+    def __init__(self, parent=None, einstellungen=None):
         super().__init__(parent)
         self.setupUi(self)
 
-        self.preferences_file = preferences_path or Path.home() / ".pvihk_preferences.json"
+        self.einstellungen = einstellungen or Einstellungen(parent=self)
+        self.tableWidgetTimes.setRowCount(2)
+        self.tableWidgetTimes.setVerticalHeaderLabels(["Tag 1", "Tag 2"])
+        self.tableWidgetTimes.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        # Zeittabelle erst neu berechnen, wenn die Eingabe kurz ruht (nicht bei jedem Schritt der Spinbox)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(AKTUALISIEREN_NACH_MS)
+        self.timer.timeout.connect(self.update_zeittabelle)
 
-        # Events
-        self.timeEditBegin1.timeChanged.connect(self.update_zeittabelle)
-        self.timeEditBegin2.timeChanged.connect(self.update_zeittabelle)
-        self.spinBoxDuration1.valueChanged.connect(self.update_zeittabelle)
-        self.spinBoxDuration2.valueChanged.connect(self.update_zeittabelle)
+        # Events (ohne Signalwert: timer.start(int) würde ihn als neues Intervall nehmen)
+        self.timeEditBegin1.timeChanged.connect(lambda *_: self.timer.start())
+        self.timeEditBegin2.timeChanged.connect(lambda *_: self.timer.start())
+        self.spinBoxDuration1.valueChanged.connect(lambda *_: self.timer.start())
+        self.spinBoxDuration2.valueChanged.connect(lambda *_: self.timer.start())
 
         # Initial laden
         self.load_preferences()
 
     def load_preferences(self):
-        if not self.preferences_file.exists():
-            # Defaults setzen – alles konsistent
-            with block_signals([
-                self.timeEditBegin1,
-                self.timeEditBegin2,
-                self.spinBoxDuration1,
-                self.spinBoxDuration2
-            ]):
-                self.timeEditBegin1.setTime(QTime(9, 0))
-                self.timeEditBegin2.setTime(QTime(14, 0))
-                self.spinBoxDuration1.setValue(60)
-                self.spinBoxDuration2.setValue(60)
-
-            default_slots = [
-                ["09:00", "10:00", "11:00", "12:00"],
-                ["14:00", "15:00", "16:00", "17:00"]
-            ]
-            self.set_zeitslots(default_slots)
-            self.geladene_zeitslots = default_slots
-            return
-
-        try:
-            with open(self.preferences_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            version = data.get("version", 1)
-            if version != 2:
-                print(f"⚠️ Einstellungen nicht geladen: inkompatible Version {version} (erwartet: 2)")
-                return
-
-            with block_signals([
-                self.timeEditBegin1,
-                self.timeEditBegin2,
-                self.spinBoxDuration1,
-                self.spinBoxDuration2
-            ]):
-                if "begin1" in data:
-                    h, m = map(int, data["begin1"].split(":"))
-                    self.timeEditBegin1.setTime(QTime(h, m))
-
-                if "begin2" in data:
-                    h, m = map(int, data["begin2"].split(":"))
-                    self.timeEditBegin2.setTime(QTime(h, m))
-
-                if "dauer1" in data:
-                    self.spinBoxDuration1.setValue(int(data["dauer1"]))
-
-                if "dauer2" in data:
-                    self.spinBoxDuration2.setValue(int(data["dauer2"]))
-
-            if "zeitslots" in data:
-                self.set_zeitslots(data["zeitslots"])
-                self.geladene_zeitslots = data["zeitslots"]
-
-        except Exception as e:
-            print(f"Fehler beim Laden der Einstellungen: {e}")
+        """Übernimmt die Werte aus den Einstellungen (ohne Dateizugriff)."""
+        with block_signals([
+            self.timeEditBegin1,
+            self.timeEditBegin2,
+            self.spinBoxDuration1,
+            self.spinBoxDuration2
+        ]):
+            try:
+                self.timeEditBegin1.setTime(QTime.fromString(self.einstellungen.wert("begin1"), "HH:mm"))
+                self.timeEditBegin2.setTime(QTime.fromString(self.einstellungen.wert("begin2"), "HH:mm"))
+                self.spinBoxDuration1.setValue(int(self.einstellungen.wert("dauer1")))
+                self.spinBoxDuration2.setValue(int(self.einstellungen.wert("dauer2")))
+            except (TypeError, ValueError) as e:
+                logger.warning("Ungültige Werte in den Einstellungen: %s", e)
+
+        self.set_zeitslots(self.einstellungen.zeitslots())
+        self.geladene_zeitslots = self.einstellungen.zeitslots()
 
     def save_preferences(self):
-        daten = {
-            "version": 2,
-            "begin1": self.timeEditBegin1.time().toString("HH:mm"),
-            "begin2": self.timeEditBegin2.time().toString("HH:mm"),
-            "dauer1": self.spinBoxDuration1.value(),
-            "dauer2": self.spinBoxDuration2.value(),
-            "zeitslots": self.get_pruefungszeiten()
-        }
-        try:
-            with open(self.preferences_file, "w", encoding="utf-8") as f:
-                json.dump(daten, f, indent=2)
-            print("Einstellungen gespeichert in", self.preferences_file)
-        except Exception as e:
-            print(f"Fehler beim Speichern der Einstellungen: {e}")
+        """Legt die Werte in den Einstellungen ab; geschrieben wird dort gesammelt."""
+        self.einstellungen.setzen(
+            begin1=self.timeEditBegin1.time().toString("HH:mm"),
+            begin2=self.timeEditBegin2.time().toString("HH:mm"),
+            dauer1=self.spinBoxDuration1.value(),
+            dauer2=self.spinBoxDuration2.value(),
+            zeitslots=self.get_pruefungszeiten()
+        )
 
     def update_zeittabelle(self):
+        self.timer.stop()
         try:
-            fmt = "%H:%M"
-            dauer1 = self.spinBoxDuration1.value()
-            dauer2 = self.spinBoxDuration2.value()
-
-            start1_dt = datetime.combine(datetime.today(), self.timeEditBegin1.time().toPython())
-            start2_dt = datetime.combine(datetime.today(), self.timeEditBegin2.time().toPython())
-
-            min_pause = timedelta(minutes=15)
-            max_end_time = datetime.combine(datetime.today(), datetime.strptime("18:00", fmt).time())
-
-            # Slot-Berechnung
-            zeiten = []
-
-            aktuelle = start1_dt
-            while aktuelle + timedelta(minutes=dauer1) <= start2_dt - min_pause:
-                zeiten.append(aktuelle.strftime(fmt))
-                aktuelle += timedelta(minutes=dauer1)
-
-            pause_start = aktuelle
-            pause_dauer = start2_dt - pause_start
-            pause_min = int(pause_dauer.total_seconds() // 60)
+            zeiten, pause_min = berechne_zeiten(
+                self.timeEditBegin1.time(), self.spinBoxDuration1.value(),
+                self.timeEditBegin2.time(), self.spinBoxDuration2.value()
+            )
             if pause_min >= 60:
                 pause_str = f"Mittagspause: {pause_min // 60}:{pause_min % 60:02d} Stunden"
             else:
                 pause_str = f"Mittagspause: {pause_min} Minuten"
             self.labelLunch.setText(pause_str)
-
-            aktuelle = start2_dt
-            while aktuelle + timedelta(minutes=dauer2) <= max_end_time:
-                zeiten.append(aktuelle.strftime(fmt))
-                aktuelle += timedelta(minutes=dauer2)
-
-            # Tabelle füllen
-            self.tableWidgetTimes.clearContents()
-            self.tableWidgetTimes.setRowCount(2)
-            self.tableWidgetTimes.setColumnCount(len(zeiten))
-            self.tableWidgetTimes.setHorizontalHeaderLabels([f"P{i+1}" for i in range(len(zeiten))])
-            self.tableWidgetTimes.setVerticalHeaderLabels(["Tag 1", "Tag 2"])
-
-            for row in range(2):
-                for col, zeit in enumerate(zeiten):
-                    item = QTableWidgetItem(zeit)
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                    self.tableWidgetTimes.setItem(row, col, item)
-
-            # Spalten strecken
-            header = self.tableWidgetTimes.horizontalHeader()
-            for i in range(self.tableWidgetTimes.columnCount()):
-                header.setSectionResizeMode(i, QHeaderView.Stretch)
+            self.set_zeitslots([zeiten, zeiten])
 
         except Exception as e:
-            print(f"Fehler beim Aktualisieren der Zeittabelle: {e}")
+            logger.exception("Fehler beim Aktualisieren der Zeittabelle: %s", e)
 
     def set_zeitslots(self, slots: list[list[str]]):
+        """Trägt die Zeiten ein; nur geänderte Zellen und Spalten werden angefasst."""
         if not (isinstance(slots, list) and len(slots) == 2):
-            print("⚠️ Ungültige Zeitslots-Struktur – erwartet 2 Listen")
+            logger.warning("Ungültige Zeitslots-Struktur – erwartet 2 Listen")
             return
 
+        tabelle = self.tableWidgetTimes
+        alte_spalten = tabelle.columnCount()
         max_spalten = max(len(slots[0]), len(slots[1]))
-        self.tableWidgetTimes.clearContents()
-        self.tableWidgetTimes.setRowCount(2)
-        self.tableWidgetTimes.setColumnCount(max_spalten)
-        self.tableWidgetTimes.setHorizontalHeaderLabels([f"P{i+1}" for i in range(max_spalten)])
-        self.tableWidgetTimes.setVerticalHeaderLabels(["Tag 1", "Tag 2"])
+        if max_spalten != alte_spalten:
+            tabelle.setColumnCount(max_spalten)
+            for col in range(alte_spalten, max_spalten):
+                tabelle.setHorizontalHeaderItem(col, QTableWidgetItem(f"P{col + 1}"))
 
         for row in range(2):
-            for col, zeit in enumerate(slots[row]):
-                item = QTableWidgetItem(zeit)
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
-                self.tableWidgetTimes.setItem(row, col, item)
-
-        header = self.tableWidgetTimes.horizontalHeader()
-        for i in range(self.tableWidgetTimes.columnCount()):
-            header.setSectionResizeMode(i, QHeaderView.Stretch)
+            for col in range(max_spalten):
+                zeit = slots[row][col] if col < len(slots[row]) else None
+                item = tabelle.item(row, col)
+                if zeit is None:
+                    if item is not None:
+                        tabelle.takeItem(row, col)
+                elif item is None:
+                    item = QTableWidgetItem(zeit)
+                    item.setFlags(item.flags() | Qt.ItemIsEditable)
+                    tabelle.setItem(row, col, item)
+                elif item.text() != zeit:
+                    item.setText(zeit)
 
     def get_pruefungszeiten(self):
+        # Eine noch ausstehende Neuberechnung zuerst ausführen
+        if self.timer.isActive():
+            self.update_zeittabelle()
         zeiten = [[], []]
         for row in range(2):
             for col in range(self.tableWidgetTimes.columnCount()):
@@ -0,0 +1,114 @@
+"""
+Protokollierung für GUI, Rechenprozesse und Überwachungsmodus.
+
+Alle Module holen sich ihren Logger mit logging.getLogger(__name__).
+einrichten() hängt an den Wurzel-Logger nur einen QueueHandler; das eigentliche
+Schreiben (Datei mit Rotation, Konsole) erledigt ein QueueListener in einem eigenen
+Thread, ein Log-Aufruf im GUI-Thread kostet also kaum etwas.
+
+Stufe über die Umgebungsvariable PVIHK_LOGLEVEL (Standard: INFO).
+Das Solver-Protokoll (CBC) landet je Lauf in einer eigenen Datei unter solver/.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime
+from pathlib import Path
+
+LOG_ORDNER = Path.home() / ".pvihk_logs"
+LOG_DATEI = "pvihk.log"
+SOLVER_ORDNER = "solver"
+MAX_SOLVER_LOGS = 20
+
+FORMAT = "%(asctime)s %(levelname)-7s %(processName)s %(name)s: %(message)s"
+
+_listener = None
+
+
+def log_stufe():
+    return getattr(logging, os.environ.get("PVIHK_LOGLEVEL", "INFO").upper(), logging.INFO)
+
+
+def einrichten(konsole=True, ordner=None):
+    """Richtet die Protokollierung für den Hauptprozess ein (mehrfacher Aufruf ist harmlos)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    ordner = Path(ordner or LOG_ORDNER)
+    handler = []
+    try:
+        ordner.mkdir(parents=True, exist_ok=True)
+        datei = logging.handlers.RotatingFileHandler(
+            ordner / LOG_DATEI, maxBytes=1_000_000, backupCount=5, encoding="utf-8"
+        )
+        handler.append(datei)
+    except OSError as e:
+        print(f"Protokolldatei nicht verfügbar: {e}", file=sys.stderr)
+    # Im gebündelten Fensterprogramm gibt es kein stderr
+    if konsole and sys.stderr is not None:
+        handler.append(logging.StreamHandler())
+    for h in handler:
+        h.setFormatter(logging.Formatter(FORMAT))
+
+    warteschlange = queue.SimpleQueue()
+    wurzel = logging.getLogger()
+    wurzel.setLevel(log_stufe())
+    wurzel.addHandler(logging.handlers.QueueHandler(warteschlange))
+
+    _listener = logging.handlers.QueueListener(warteschlange, *handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(beenden)
+
+
+def beenden():
+    """Schreibt ausstehende Einträge und hält den Listener an."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class WeiterleitungsHandler(logging.Handler):
+    """
+    Für Kindprozesse: schickt Log-Einträge über eine Nachrichten-Queue
+    als ("log", record) an den Elternprozess (siehe ProzessWorker).
+    """
+
+    def __init__(self, nachrichten):
+        super().__init__()
+        self.nachrichten = nachrichten
+        self._aufbereiter = logging.handlers.QueueHandler(None)
+
+    def emit(self, record):
+        try:
+            # Argumente einsetzen und Ausnahme als Text ablegen, damit der Eintrag pickle-bar ist
+            self.nachrichten.put(("log", self._aufbereiter.prepare(record)))
+        except Exception:
+            self.handleError(record)
+
+
+def kindprozess_einrichten(nachrichten, stufe):
+    wurzel = logging.getLogger()
+    wurzel.handlers.clear()
+    wurzel.setLevel(stufe)
+    wurzel.addHandler(WeiterleitungsHandler(nachrichten))
+
+
+def solver_log_pfad(ordner=None) -> str | None:
+    """
+    Neuer Pfad für das CBC-Protokoll eines Laufs. Alte Protokolle werden aufgeräumt,
+    es bleiben die letzten MAX_SOLVER_LOGS. None, wenn der Ordner nicht angelegt werden kann.
+    """
+    ordner = Path(ordner or LOG_ORDNER) / SOLVER_ORDNER
+    try:
+        ordner.mkdir(parents=True, exist_ok=True)
+        alte = sorted(ordner.glob("cbc_*.log"))
+        for pfad in alte[:max(0, len(alte) - MAX_SOLVER_LOGS + 1)]:
+            pfad.unlink(missing_ok=True)
+    except OSError:
+        return None
+    return str(ordner / f"cbc_{datetime.now():%Y%m%d_%H%M%S_%f}_{os.getpid()}.log")
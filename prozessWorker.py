@@ -0,0 +1,127 @@
+import logging
+import multiprocessing
+import queue
+import time
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+import protokoll
+
+logger = logging.getLogger(__name__)
+
+
+# Signale aus dem Worker (werden im GUI-Thread zugestellt)
+class ProzessWorkerSignals(QObject):
+    finished = Signal(object)
+    error = Signal(str)
+    progress = Signal(str)
+
+
+def _prozess_einstieg(nachrichten, funktion, args, log_stufe):
+    """
+    Läuft im Kindprozess: ruft die Funktion auf und schickt Fortschritt,
+    Log-Einträge, Ergebnis oder Fehler über die Queue zurück.
+    """
+    nachrichten.put(("gestartet", time.time()))
+    protokoll.kindprozess_einrichten(nachrichten, log_stufe)
+
+    def fortschritt(text):
+        nachrichten.put(("fortschritt", text))
+
+    try:
+        ergebnis = funktion(*args, fortschritt=fortschritt)
+        nachrichten.put(("ergebnis", ergebnis))
+    except Exception as e:
+        logger.exception("Fehler im Rechenprozess")
+        nachrichten.put(("fehler", str(e)))
+
+
+class ProzessWorker(QRunnable):
+    """
+    Führt funktion(*args, fortschritt=...) in einem eigenen Prozess aus.
+    Der Thread im QThreadPool wartet nur auf die Queue und hält dabei nicht die GIL,
+    die GUI bleibt also flüssig. Stürzt der Rechenprozess ab, kommt nur ein Fehler-Signal.
+
+    Die Funktion muss auf Modulebene liegen (sie wird für 'spawn' gepickelt),
+    Argumente und Ergebnis müssen pickle-bar sein.
+    """
+
+    def __init__(self, funktion, *args):
+        super().__init__()
+        self.funktion = funktion
+        self.args = args
+        self.signals = ProzessWorkerSignals()
+        self.prozess = None
+        self.abgebrochen = False
+        self.startdauer = None  # Sekunden von start() bis der Kindprozess läuft
+
+    def ergebnis_aufbereiten(self, ergebnis):
+        """Hook für Unterklassen, läuft im Worker-Thread vor dem finished-Signal."""
+        return ergebnis
+
+    @Slot()
+    def run(self):
+        # 'spawn' überall: kein fork eines Prozesses mit laufender Qt-Eventloop
+        ctx = multiprocessing.get_context("spawn")
+        nachrichten = ctx.Queue()
+        log_stufe = logging.getLogger().getEffectiveLevel()
+        self.prozess = ctx.Process(target=_prozess_einstieg, args=(nachrichten, self.funktion, self.args, log_stufe), daemon=True)
+        if self.abgebrochen:
+            return  # vor dem Start abgebrochen
+
+        try:
+            gestartet = time.time()
+            self.prozess.start()
+        except Exception as e:
+            self.prozess = None
+            nachrichten.close()
+            self.signals.error.emit(str(e))
+            return
+
+        try:
+            while True:
+                try:
+                    art, inhalt = nachrichten.get(timeout=0.2)
+                except queue.Empty:
+                    if self.abgebrochen:
+                        return
+                    if not self.prozess.is_alive() and nachrichten.empty():
+                        self.signals.error.emit(f"Rechenprozess unerwartet beendet (Exitcode {self.prozess.exitcode})")
+                        return
+                    continue
+
+                if art == "log":
+                    # Log-Einträge des Kindprozesses hier weiterreichen (auch nach Abbruch)
+                    logging.getLogger(inhalt.name).handle(inhalt)
+                    continue
+                if self.abgebrochen:
+                    return
+                if art == "gestartet":
+                    self.startdauer = inhalt - gestartet
+                elif art == "fortschritt":
+                    self.signals.progress.emit(inhalt)
+                elif art == "ergebnis":
+                    self.signals.finished.emit(self.ergebnis_aufbereiten(inhalt))
+                    return
+                elif art == "fehler":
+                    self.signals.error.emit(inhalt)
+                    return
+        except Exception as e:
+            if not self.abgebrochen:
+                logger.exception("Fehler im Worker-Thread")
+                self.signals.error.emit(str(e))
+        finally:
+            if self.prozess.is_alive():
+                self.prozess.terminate()
+            self.prozess.join(timeout=5)
+            nachrichten.close()
+            nachrichten.join_thread()
+            # Prozessobjekt (hält die Queue in seinen Argumenten) freigeben
+            self.prozess = None
+
+    def abbrechen(self):
+        """Beendet den Rechenprozess; danach werden keine Signale mehr gesendet."""
+        self.abgebrochen = True
+        prozess = self.prozess
+        if prozess is not None and prozess.is_alive():
+            prozess.terminate()
@@ -1,25 +1,26 @@
 import sys
 import os
+import logging
 import platform
 import tempfile
 import json
+import multiprocessing
+import atexit
+import shutil
+import time
 
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt, QDate, QObject, QRunnable, QThreadPool, Signal, Slot, QTimer
+from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import Qt, QDate, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QAbstractItemView, QListWidgetItem,
-    QHeaderView, QTableWidgetItem, QFileDialog, QMessageBox, QListWidget
+    QApplication, QMainWindow, QAbstractItemView,
+    QHeaderView, QTableView, QFileDialog, QMessageBox, QLabel, QComboBox, QCheckBox
 )
 
-import pulp
-from collections import defaultdict
-from datetime import datetime
-from fpdf import FPDF
-
 from pathlib import Path
 
 from versioning import get_app_metadata
-meta = get_app_metadata(increment=True)
+# Buildnummer nur beim Start als Programm hochzählen (nicht beim Import)
+meta = get_app_metadata(increment=__name__ == "__main__")
 VERSION = meta["VERSION"]
 DATE = meta["DATE"]
 TITLEVERSION = meta["TITLEVERSION"]
@@ -30,12 +31,35 @@ COPYRIGHT = meta["COPYRIGHT"]
 from  MainWindow import Ui_MainWindow
 from preferencesDialog import PreferencesDialog
 
-from customListWidget import CustomListWidget
+from kandidatenListe import KandidatenListe
+from ergebnisTabelle import ErgebnisModell
+from korrektorenTabelle import STANDARD_KORREKTOREN, KorrektorenModell, KorrektorenTabelle
+from optimierung import ENGINES, ZEITLIMIT
+from pdfBericht import erzeuge_pdf, erzeuge_mappen_archiv
+from prozessWorker import ProzessWorker, ProzessWorkerSignals
+from dateien import (
+    KANDIDATEN_ENDUNGEN, lese_kandidaten_bloecke, lese_korrektorendatei, schreibe_atomar, schreibe_korrektorendatei
+)
+from messung import Messung, schreibe_messwerte
+from modell import Instanz, KandidatenIndex, plan_unterschiede
+from validierung import NichtLoesbar, pruefe_instanz, pruefe_kandidaten
+from diagnoseDialog import DiagnoseDialog
+from einstellungen import Einstellungen
+from verlauf import VERLAUF_DATEI, Verlauf
+from verlaufDialog import VerlaufDialog
+from gewichtsreihe import VERHAELTNISSE, abschnitte, loese_abschnitt, pareto_front
+from gewichtsreiheDialog import GewichtsreiheDialog
+from sitzungsJournal import SitzungsJournal, lese_sitzung, letzte_nummer
+import protokoll
+
+# Als Programm gestartet hieße der Logger sonst "__main__"
+logger = logging.getLogger("pvihk")
 
 # Plattformabhängige Lokation der aktuellen Session-Datei
 # eingetragene Korrektoren und Prüflinge
 SESSION_FILE = Path.home() / ".pvihk_session.json"
-PREFERENCES_FILE = Path.home() / ".preferences.json"
+SESSION_JOURNAL = Path.home() / ".pvihk_session.journal"
+SESSION_VERSION = 3
 
 # Den aktuellen Pfad für Entwicklung und Produktivbetrieb merken
 if getattr(sys, 'frozen', False):
@@ -45,233 +69,94 @@ else:
     # Normal als .py Script
     BASIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Für Multithreading
-# Signale aus dem Optimierungsblock
-class OptimierungsWorkerSignals(QObject):
-    finished = Signal(dict)
+# Die Optimierung läuft in einem eigenen Prozess (siehe ProzessWorker)
+class OptimierungsWorker(ProzessWorker):
+    def __init__(self, eingabedaten, profil=False, engine="milp"):
+        super().__init__(ENGINES[engine], eingabedaten, profil)
+        self.engine = engine
+
+    def ergebnis_aufbereiten(self, ergebnis):
+        if self.startdauer is not None:
+            ergebnis.messung["phasen"]["prozessstart"] = {"wand": self.startdauer, "cpu": None}
+        return ergebnis
+
+
+# Das PDF wird erst bei Bedarf erzeugt, ebenfalls in eigenem Prozess (FPDF hält sonst die GIL).
+# Der Prozess schreibt direkt in die Zieldatei, zurück kommt nur der Pfad.
+class PdfWorker(ProzessWorker):
+    def __init__(self, ergebnis, pdf_pfad):
+        super().__init__(erzeuge_pdf, ergebnis, pdf_pfad)
+
+
+# Die Korrektorenmappen entstehen parallel in einem Prozesspool, dieser Thread wartet nur
+class MappenWorker(QRunnable):
+    def __init__(self, ergebnis, zip_pfad):
+        super().__init__()
+        self.ergebnis = ergebnis
+        self.zip_pfad = zip_pfad
+        self.signals = ProzessWorkerSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            pfad = erzeuge_mappen_archiv(self.ergebnis, self.zip_pfad, fortschritt=self.signals.progress.emit)
+            self.signals.finished.emit(pfad)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+# Prüflingslisten werden im Hintergrund blockweise gelesen und blockweise ins Modell übernommen
+class ImportWorkerSignals(QObject):
+    block = Signal(object, bool)    # Namen, True = bisherige Liste ersetzen
+    finished = Signal(int)          # Anzahl eingelesener Zeilen
     error = Signal(str)
+    progress = Signal(str)
 
-# Routine mit Optimierungsblock wird in diesem Runner aufgerufen
-class OptimierungsWorker(QRunnable):
-    def __init__(self, eingabedaten):
+
+class ImportWorker(QRunnable):
+    INTERVALL = 0.1
+
+    def __init__(self, dateinamen):
         super().__init__()
-        self.eingabedaten = eingabedaten
-        self.signals = OptimierungsWorkerSignals()
+        self.dateinamen = dateinamen
+        self.signals = ImportWorkerSignals()
+        self.abgebrochen = False
+
+    def abbrechen(self):
+        self.abgebrochen = True
 
     @Slot()
     def run(self):
+        anzahl = 0
+        gesammelt = []
+        gesendet = time.perf_counter()
         try:
-            ergebnis = berechne_korrektorenverteilung(self.eingabedaten)
-            self.signals.finished.emit(ergebnis)    # Bei Ende: Ergebnis-Dict
+            for dateiname in self.dateinamen:
+                for namen, anteil in lese_kandidaten_bloecke(dateiname):
+                    if self.abgebrochen:
+                        return
+                    # Blöcke höchstens alle INTERVALL Sekunden senden, sonst staut sich die GUI
+                    gesammelt += namen
+                    if time.perf_counter() - gesendet >= self.INTERVALL:
+                        self.senden(gesammelt, anzahl == 0)
+                        anzahl += len(gesammelt)
+                        gesammelt = []
+                        gesendet = time.perf_counter()
+                        self.signals.progress.emit(
+                            f"Importiere {Path(dateiname).name}: {anteil:.0%} ({anzahl} Prüflinge)")
+            if not self.abgebrochen:
+                self.senden(gesammelt, anzahl == 0)
+                self.signals.finished.emit(anzahl + len(gesammelt))
+        except ValueError as e:
+            logger.warning("Kandidatenliste nicht eingelesen: %s", e)
+            self.signals.error.emit(str(e))
         except Exception as e:
-            self.signals.error.emit(str(e))         # Bei Fehler String
-
-
-def berechne_korrektorenverteilung(eingabedaten) -> dict:
-    """
-    Optimiert die Korrektorenverteilung und erzeugt ein PDF.
-
-    Erwartet:
-        eingabedaten["zeitslots"] = [liste_tag1, liste_tag2]
-    """
-
-
-    korrektornamen = list(eingabedaten["verfügbarkeiten"].keys())
-    klausurnamen = eingabedaten["kandidaten"]
-    klausuren = [f"K_{i}" for i in klausurnamen.keys()]
-    termine = eingabedaten["pruefungstage"]
-    anzahl_korrektoren = eingabedaten.get("anzahl_korrektoren_pro_klausur", 2)
-
-    # === Zeitslots überprüfen ===
-    zeitslots = eingabedaten.get("zeitslots")
-    if not isinstance(zeitslots, list) or len(zeitslots) != 2 or not all(isinstance(t, list) for t in zeitslots):
-        raise ValueError("zeitslots müssen eine Liste mit zwei Listen sein (je Tag).")
-
-    sortierte_zeiten = []
-    for tag_slots in zeitslots:
-        zeiten_tag = [datetime.strptime(z, "%H:%M").time() for z in tag_slots]
-        sortierte_zeiten.append(zeiten_tag)
-
-    tag_verfuegbarkeit = {datum: [] for datum in termine}
-    for korrektor, tage in eingabedaten["verfügbarkeiten"].items():
-        for tag in tage:
-            tag_verfuegbarkeit[tag].append(korrektor)
-
-    anzahl_tag1 = (len(klausuren) + 1) // 2
-    anzahl_tag2 = len(klausuren) - anzahl_tag1
-
-    prob = pulp.LpProblem("Korrekturverteilung", pulp.LpMinimize)
-
-    x = pulp.LpVariable.dicts("x", ((k, p) for k in klausuren for p in korrektornamen), 0, 1, pulp.LpBinary)
-    klausur_tag = pulp.LpVariable.dicts("klausur_tag", ((k, t) for k in klausuren for t in [0, 1]), 0, 1, pulp.LpBinary)
-    anwesenheit = pulp.LpVariable.dicts("anwesenheit", ((p, t) for p in korrektornamen for t in [0, 1]), 0, 1, pulp.LpBinary)
-
-    belastung = {p: pulp.lpSum(x[k, p] for k in klausuren) for p in korrektornamen}
-    mittlere_belastung = 2 * len(klausuren) / len(korrektornamen)
-    abweichung = pulp.LpVariable.dicts("abweichung", korrektornamen, 0)
-
-    for p in korrektornamen:
-        prob += belastung[p] - mittlere_belastung <= abweichung[p]
-        prob += mittlere_belastung - belastung[p] <= abweichung[p]
-
-# Hier erfolgt die Gewichtung: Gleichverteilung / Anwesenheit
-    prob += (
-        1.0 * pulp.lpSum(abweichung[p] for p in korrektornamen) +
-        0.1 * pulp.lpSum(anwesenheit[p, t] for p in korrektornamen for t in [0, 1])
-    )
-
-    for k in klausuren:
-        prob += pulp.lpSum(x[k, p] for p in korrektornamen) == anzahl_korrektoren
-        for t in [0, 1]:
-            gruppe = tag_verfuegbarkeit[termine[t]]
-            prob += klausur_tag[k, t] <= pulp.lpSum(x[k, p] for p in gruppe)
-        prob += klausur_tag[k, 0] + klausur_tag[k, 1] == 1
-
-    prob += pulp.lpSum(klausur_tag[k, 0] for k in klausuren) == anzahl_tag1
-    prob += pulp.lpSum(klausur_tag[k, 1] for k in klausuren) == anzahl_tag2
-
-    for p in korrektornamen:
-        for t in [0, 1]:
-            if p in tag_verfuegbarkeit[termine[t]]:
-                for k in klausuren:
-                    prob += x[k, p] <= anwesenheit[p, t]
-
-    for t in [0, 1]:
-        prob += pulp.lpSum(anwesenheit[p, t] for p in tag_verfuegbarkeit[termine[t]]) >= 3
-
-    import time
-    start_time = time.time()
-    prob.solve(pulp.PULP_CBC_CMD(timeLimit=10, msg=True))
-    end_time = time.time()
-
-    solver_status = pulp.LpStatus[prob.status]
-    duration = end_time - start_time
-
-    if solver_status in ["Infeasible", "Unbounded", "Undefined", "Not Solved"]:
-        raise ValueError(f"Optimierung nicht erfolgreich! Status: {solver_status}")
-    if solver_status == "Optimal" and duration >= 9:
-        final_status = "Optimal (nach Zeitlimit)"
-    elif solver_status == "Optimal":
-        final_status = "Optimal"
-    elif solver_status == "Integer Feasible":
-        final_status = "Beste gefundene Lösung (nicht optimal)"
-    else:
-        final_status = solver_status
-
-    zuordnung = defaultdict(list)
-    klausur_tage = {}
-    for (k, p), var in x.items():
-        if var.varValue == 1:
-            zuordnung[k].append(p)
-    for (k, t), var in klausur_tag.items():
-        if var.varValue == 1:
-            klausur_tage[k] = t
-
-    klausurverteilung = defaultdict(list)
-    versand_start = defaultdict(list)
-    weitergaben = defaultdict(list)
-
-    for t in [0, 1]:
-        datum = termine[t]
-        klausuren_fuer_tag = sorted(k for k, tag in klausur_tage.items() if tag == t)
-        zeiten = sortierte_zeiten[t][:len(klausuren_fuer_tag)]
-        for k, zeit in zip(klausuren_fuer_tag, zeiten):
-            zeit_str = zeit.strftime("%H:%M")
-            pruefer = zuordnung[k]
-            klausurname = klausurnamen[int(k.split("_")[1])]
-            klausurverteilung[datum].append((zeit_str, klausurname, pruefer))
-
-    paarweise = defaultdict(list)
-    for k, pruefer in zuordnung.items():
-        if len(pruefer) == 2:
-            p1, p2 = sorted(pruefer)
-            paarweise[(p1, p2)].append(k)
-    for (p1, p2), klist in paarweise.items():
-        versand_start[p1].extend(klist)
-        weitergaben[(p1, p2)].extend(klist)
-
-    class FooterPDF(FPDF):
-        def footer(self):
-            self.set_y(-10)
-            self.set_font("Arial", size=8)
-            self.cell(0, 5, f"Erstellt von PVIHK({VERSION}) am {datetime.now().strftime('%d.%m.%Y %H:%M:%S')} - created by fz@zenmeister.de", align="C")
-
-    pdf = FooterPDF()
-    pdf.set_auto_page_break(auto=True, margin=10)
-    pdf.add_page()
-    pdf.set_font("Arial", "B", 14)
-    pdf.cell(0, 8, "Prüfungsverteilung nach Tagen und aktiven Korrektoren", ln=True)
-    pdf.ln(3)
-
-    for datum, termine in klausurverteilung.items():
-        pdf.set_font("Arial", "B", 10)
-        pdf.cell(0, 6, f"Zeitplan: {datum}", ln=True)
-        pdf.set_fill_color(200, 200, 220)
-        pdf.cell(22, 6, "Zeit", border=1, fill=True)
-        pdf.cell(78, 6, "Prüfung", border=1, fill=True)
-        pdf.cell(85, 6, "Korrektoren", border=1, ln=True, fill=True)
-        pdf.set_font("Arial", size=9)
-        for zeit, klausurname, pruefer in termine:
-            pdf.cell(22, 6, zeit, border=1)
-            pdf.cell(78, 6, klausurname, border=1)
-            pdf.cell(85, 6, ", ".join(pruefer), border=1, ln=True)
-        pdf.ln(3)
-
-    # Korrektorenübersicht mit Partnern
-    pdf.ln(4)
-    pdf.set_font("Arial", "B", 12)
-    pdf.cell(0, 6, "Korrektorenübersicht mit Partnern", ln=True)
-    pdf.set_font("Arial", "B", 9)
-    pdf.cell(60, 6, "Korrektor (gesamt)", border=1)
-    pdf.cell(130, 6, "Verteilung auf Partner", border=1, ln=True)
-    pdf.set_font("Arial", size=9)
-
-    korrektor_partner = defaultdict(lambda: defaultdict(int))
-    korrektor_gesamt = defaultdict(int)
-
-    for k, pruefer in zuordnung.items():
-        if len(pruefer) == 2:
-            p1, p2 = sorted(pruefer)
-            korrektor_partner[p1][p2] += 1
-            korrektor_partner[p2][p1] += 1
-            korrektor_gesamt[p1] += 1
-            korrektor_gesamt[p2] += 1
-
-    for p in sorted(korrektornamen):
-        partnertext = ', '.join(f"{q}({n})" for q, n in sorted(korrektor_partner[p].items()))
-        pdf.set_text_color(0, 0, 200)
-        pdf.cell(60, 6, f"{p} ({korrektor_gesamt[p]})", border=1)
-        pdf.set_text_color(0)
-        pdf.cell(130, 6, partnertext, border=1, ln=True)
-
-    pdf.add_page()
-    pdf.set_font("Arial", "B", 12)
-    pdf.cell(0, 6, "Versand und Weitergabe der Klausuren", ln=True)
-    pdf.ln(4)
-    pdf.set_font("Arial", "B", 10)
-    for sender, klist in versand_start.items():
-        pdf.cell(0, 6, f"{sender} erhält:", ln=True)
-        pdf.set_font("Arial", size=10)
-        for k in klist:
-            pdf.cell(0, 6, f"   - {klausurnamen[int(k.split('_')[1])]}", ln=True)
-        pdf.set_font("Arial", "B", 10)
-        pdf.ln(2)
-    for (sender, empfaenger), klist in weitergaben.items():
-        pdf.cell(0, 6, f"{sender} -> {empfaenger}:", ln=True)
-        pdf.set_font("Arial", size=10)
-        for k in klist:
-            pdf.cell(0, 6, f"   - {klausurnamen[int(k.split('_')[1])]}", ln=True)
-        pdf.set_font("Arial", "B", 10)
-        pdf.ln(2)
-
-    pdf_bytes = pdf.output(dest='S').encode('latin1')
-
-    return {
-        "pdf_data": pdf_bytes,
-        "verteilung": klausurverteilung,
-        "status": final_status
-    }
+            logger.exception("Fehler beim Einlesen der Kandidatenliste")
+            self.signals.error.emit(str(e))
 
+    def senden(self, namen, ersetzen):
+        if namen or ersetzen:
+            self.signals.block.emit(namen, ersetzen)
 
 
 class MainWindow(QMainWindow,Ui_MainWindow):
@@ -280,8 +165,8 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         self.setupUi(self)
 
         # Eigenes Widget anstelle des gebauten listWidget setzen
-        # Neues Widget erzeugen
-        custom_widget = CustomListWidget(self)
+        # Neues Widget erzeugen (Ansicht über KandidatenModell, ohne Obergrenze)
+        custom_widget = KandidatenListe(self)
         custom_widget.setObjectName("listWidgetList")  # Name zum Suchen
 
         # Layout und Position finden
@@ -294,20 +179,12 @@ class MainWindow(QMainWindow,Ui_MainWindow):
 
         # Referenz aktualisieren
         self.listWidgetList = custom_widget
+        self.kandidaten_modell = custom_widget.model()
 
-        self.preferences_file = PREFERENCES_FILE
-        self.zeitslots = [
-            [
-                "09:00", "10:00", "11:00", "12:00",
-                "14:00", "15:00", "16:00", "17:00"
-            ],
-            [
-                "09:00", "10:00", "11:00", "12:00",
-                "14:00", "15:00", "16:00", "17:00"
-            ]
-        ]
-
-        self.lade_preferences()
+        # Einstellungen einmal laden, Änderungen (auch aus dem Dialog) kommen als Signal
+        self.einstellungen = Einstellungen(parent=self)
+        self.zeitslots = self.einstellungen.zeitslots()
+        self.einstellungen.geaendert.connect(self.einstellung_geaendert)
 
         self.setWindowTitle(TITLEVERSION)
         icon_path = os.path.join(BASIS_DIR, "assets", "PVIHK.png")
@@ -315,14 +192,79 @@ class MainWindow(QMainWindow,Ui_MainWindow):
 
         self.setWindowIcon(QIcon(icon_path))
 
-        self.pushButtonCancelOptimize.hide()    # Wird z.Z. nicht gebraucht
 
         self.threadpool = QThreadPool()
+        self.aktiver_worker = None  # laufende Optimierung (eigener Prozess)
+        self.import_worker = None   # laufender Import einer Prüflingsliste
+        self.pushButtonCancelOptimize.clicked.connect(self.optimierung_abbrechen)
+
+        # Persönliche Unterlagen je Korrektor (ZIP mit einem PDF pro Korrektor)
+        self.actionMappen_abspeichern = QAction("Korrektorenmappen abspeichern...", self)
+        self.actionMappen_abspeichern.triggered.connect(self.korrektorenmappen_abspeichern)
+        self.menuAnsicht.addAction(self.actionMappen_abspeichern)
+
+        # Live-Modus: jede Eingabeänderung plant (entprellt) eine neue Optimierung ein
+        self.actionLive = QAction("Live-Modus (automatisch neu aufteilen)", self)
+        self.actionLive.setCheckable(True)
+        self.actionLive.toggled.connect(self.live_modus_umschalten)
+        self.menuAnsicht.addSeparator()
+        self.menuAnsicht.addAction(self.actionLive)
+
+        # Optional: Zeitslots im Modell planen, je Korrektor und Tag ein zusammenhängender Block
+        self.actionSlotModell = QAction("Zeitslots mitplanen (Korrektoren in Blöcken)", self)
+        self.actionSlotModell.setCheckable(True)
+        self.actionSlotModell.toggled.connect(self.eingabe_geaendert)
+        self.menuAnsicht.addAction(self.actionSlotModell)
+
+        # Pareto-optimale Pläne für Anwesenheit gegen Gleichverteilung (mehrere Gewichtungen)
+        self.gewichtsreihe_worker = []  # laufende Abschnitte der Gewichtsreihe (je ein Prozess)
+        # Eigener Pool, damit PDF, Mappen und Import nicht auf die Gewichtsreihe warten
+        self.gewichtsreihe_pool = QThreadPool(self)
+        self.actionGewichtsreihe = QAction("Gewichtungen vergleichen...", self)
+        self.actionGewichtsreihe.triggered.connect(self.gewichtsreihe_starten)
+        self.menuAnsicht.addAction(self.actionGewichtsreihe)
+
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(600)
+        self.live_timer.timeout.connect(self.optimierung_starten)
+
+        # Diagnose: Laufzeiten je Phase, optional als JSON-Zeilen protokolliert bzw. mit Profiling
+        self.menuDiagnose = self.menuAnsicht.addMenu("Diagnose")
+        self.actionDiagnose = QAction("Messwerte des letzten Laufs...", self)
+        self.actionDiagnose.triggered.connect(self.diagnose_anzeigen)
+        self.actionMesswerte = QAction("Messwerte protokollieren (~/.pvihk_messwerte.jsonl)", self)
+        self.actionMesswerte.setCheckable(True)
+        self.actionProfil = QAction("Profiling (cProfile/tracemalloc)", self)
+        self.actionProfil.setCheckable(True)
+        self.menuDiagnose.addAction(self.actionDiagnose)
+        self.menuDiagnose.addAction(self.actionMesswerte)
+        self.menuDiagnose.addAction(self.actionProfil)
+
+        # Verlauf früherer Läufe (SQLite, siehe verlauf_oeffnen)
+        self.verlauf = None
+        self.actionVerlauf = QAction("Verlauf...", self)
+        self.actionVerlauf.setEnabled(False)
+        self.actionVerlauf.triggered.connect(self.verlauf_anzeigen)
+        self.menuAnsicht.addAction(self.actionVerlauf)
 
         self.pushButtonOptimize.setEnabled(True)
         self.pushButtonCancelOptimize.setEnabled(False)
 
-        self.letztes_pdf_data = None  # Inhalt des aktuell erzeugten PDFs (Bytes)
+        # Belastung je Korrektor (aus Ergebnis.statistik), dauerhaft rechts in der Statusleiste
+        self.belastung_label = QLabel()
+        self.statusBar().addPermanentWidget(self.belastung_label)
+
+        self.letztes_ergebnis = None    # Ergebnis der letzten Optimierung
+        self.kandidaten_index = KandidatenIndex()   # Prüflingsliste der letzten Eingabe
+        self.letzter_fingerprint = None
+        self.pdf_cache = {}             # Fingerprint -> Pfad der PDF-Datei
+        self.pdf_worker = {}            # Fingerprint -> laufende PDF-Erzeugung
+        self.pdf_wartend = {}           # Fingerprint -> Aktionen, die auf das PDF warten
+
+        # Ein temporärer Ordner je Sitzung für die erzeugten PDFs, wird beim Beenden gelöscht
+        self.pdf_ordner = tempfile.mkdtemp(prefix="pvihk_pdf_")
+        atexit.register(shutil.rmtree, self.pdf_ordner, ignore_errors=True)
         self.actionPDF_abspeichern.triggered.connect(self.pdf_abspeichern)
 
         self.actionSession_save.triggered.connect(self.session_save)
@@ -339,19 +281,6 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         # noinspection PyUnresolvedReferences
         self.listWidgetList.setDragDropMode(QAbstractItemView.DropOnly)
 
-        # Kleine Schönheitskorrekturen: Selektionsartefakte vermeiden
-        # noinspection PyUnresolvedReferences
-        self.listWidget1.setSelectionMode(QAbstractItemView.NoSelection)
-        # noinspection PyUnresolvedReferences
-        self.listWidget2.setSelectionMode(QAbstractItemView.NoSelection)
-        # noinspection PyUnresolvedReferences
-        self.listWidget1.setFocusPolicy(Qt.NoFocus)
-        # noinspection PyUnresolvedReferences
-        self.listWidget2.setFocusPolicy(Qt.NoFocus)
-
-        self.listWidget1.currentItemChanged.connect(self.disable_current_item)
-        self.listWidget2.currentItemChanged.connect(self.disable_current_item)
-
         # Signal verbinden
         self.date1Edit.dateChanged.connect(self.sync_date1)
         self.date2Edit.dateChanged.connect(self.sync_date2)
@@ -372,61 +301,96 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         self.date1Edit.setDate(QDate.currentDate().addDays(7))
         self.date2Edit.setDate(QDate.currentDate().addDays(14))
 
-        # Korrektoren Listen
-        # Feste Auswahlmöglichkeiten
-        # TODO: Später über init oder Einstelllungen einlesen lassen...
-        options = [" ", "Korrektor1", "Korrektor2", "Korrektor3", "Korrektor4", "Korrektor5", "Korrektor6", "Korrektor7"]
-        self.listWidget1.setSpacing(2)  # Kein extra Abstand zwischen Items
-        self.listWidget2.setSpacing(2)  # Kein extra Abstand zwischen Items
-
-        from korrektorItem import KorrektorItem  # ganz oben im Modul einfügen, falls noch nicht geschehen
-
-        self.korrektor_items_tag1 = []
-        self.korrektor_items_tag2 = []
-
-        korrektoren_default = [f"Korrektor {i + 1}" for i in range(10)]
-
-        for name in korrektoren_default:
-            # Tag 1
-            item1 = QListWidgetItem(self.listWidget1)
-            widget1 = KorrektorItem(name=name, checked=False)
-            self.listWidget1.setItemWidget(item1, widget1)
-            item1.setSizeHint(widget1.sizeHint())
-            self.korrektor_items_tag1.append(widget1)
-
-            # Tag 2
-            item2 = QListWidgetItem(self.listWidget2)
-            widget2 = KorrektorItem(name=name, checked=False)
-            self.listWidget2.setItemWidget(item2, widget2)
-            item2.setSizeHint(widget2.sizeHint())
-            self.korrektor_items_tag2.append(widget2)
+        # Eine gemeinsame Tabelle Korrektoren x Tage, je Tag eine Ansicht (Name + Häkchen dieses Tages)
+        self.korrektoren_modell = KorrektorenModell(anzahl_tage=2, parent=self)
+        self.korrektoren_modell.setze_korrektoren((name, [False, False]) for name in STANDARD_KORREKTOREN)
+        self.korrektoren_tabellen = []
+        for tag, (alt, layout) in enumerate([(self.listWidget1, self.verticalLayout_5),
+                                             (self.listWidget2, self.verticalLayout_7)]):
+            tabelle = KorrektorenTabelle(self.korrektoren_modell, tag, self.frame_top)
+            tabelle.setObjectName(alt.objectName())
+            layout.insertWidget(layout.indexOf(alt), tabelle)
+            alt.setParent(None)
+            self.korrektoren_tabellen.append(tabelle)
+        self.listWidget1, self.listWidget2 = self.korrektoren_tabellen
+
+        # Ergebnistabellen: je Tag eine Ansicht auf ein ErgebnisModell (statt Items je Zelle)
+        self.ergebnis_modelle = []
+        for tag, (alt, layout) in enumerate([(self.table1Widget, self.verticalLayout_10),
+                                             (self.table2Widget, self.verticalLayout_9)]):
+            modell = ErgebnisModell(tag, self)
+            tabelle = QTableView(self.frame_bottom)
+            tabelle.setObjectName(alt.objectName())
+            tabelle.setModel(modell)
+            tabelle.setShowGrid(False)
+            tabelle.setSortingEnabled(True)
+            tabelle.sortByColumn(0, Qt.AscendingOrder)
+            tabelle.setSelectionBehavior(QAbstractItemView.SelectRows)
+            tabelle.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            tabelle.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            tabelle.verticalHeader().setDefaultSectionSize(tabelle.fontMetrics().height() + 8)
 
             # Jetzt per StyleSheet nur untere Border simulieren (quasi horizontale Linien)
-            self.table1Widget.setStyleSheet("""
-            QTableView::item {
-                border-bottom: 1px solid gray;
-            }
-            """)
-            self.table2Widget.setStyleSheet("""
+            tabelle.setStyleSheet("""
             QTableView::item {
                 border-bottom: 1px solid gray;
             }
             """)
-
-            self.table1Widget.setColumnWidth(0, 50)
+            tabelle.setColumnWidth(0, 50)
             # noinspection PyUnresolvedReferences
-            self.table1Widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+            tabelle.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
             # noinspection PyUnresolvedReferences
-            self.table1Widget.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-
-            self.table2Widget.setColumnWidth(0, 50)
-            # noinspection PyUnresolvedReferences
-            self.table2Widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-            # noinspection PyUnresolvedReferences
-            self.table2Widget.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+            tabelle.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+
+            layout.insertWidget(layout.indexOf(alt), tabelle)
+            alt.setParent(None)
+            self.ergebnis_modelle.append(modell)
+            setattr(self, alt.objectName(), tabelle)
+
+        # Korrektor im Ergebnis hervorheben bzw. nur seine Prüfungen zeigen
+        self.korrektor_auswahl = QComboBox()
+        self.korrektor_auswahl.setToolTip("Prüfungen dieses Korrektors hervorheben")
+        self.korrektor_auswahl.addItem("(alle Korrektoren)")
+        self.korrektor_auswahl.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.korrektor_auswahl.currentIndexChanged.connect(self.korrektor_auswahl_geaendert)
+        self.nur_korrektor = QCheckBox("nur diese")
+        self.nur_korrektor.toggled.connect(self.korrektor_auswahl_geaendert)
+        self.statusBar().insertPermanentWidget(0, self.korrektor_auswahl)
+        self.statusBar().insertPermanentWidget(1, self.nur_korrektor)
 
         self.pushButtonOptimize.clicked.connect(self.optimierung_starten)
 
+        # Eingabeänderungen für den Live-Modus beobachten
+        modell = self.kandidaten_modell
+        modell.rowsInserted.connect(self.eingabe_geaendert)
+        modell.rowsRemoved.connect(self.eingabe_geaendert)
+        modell.dataChanged.connect(self.eingabe_geaendert)
+        modell.modelReset.connect(self.eingabe_geaendert)
+        modell = self.korrektoren_modell
+        modell.rowsRemoved.connect(self.eingabe_geaendert)
+        modell.dataChanged.connect(self.eingabe_geaendert)
+        modell.modelReset.connect(self.eingabe_geaendert)
+        self.date1Edit.dateChanged.connect(self.eingabe_geaendert)
+        self.date2Edit.dateChanged.connect(self.eingabe_geaendert)
+
+        # Autosave: Änderungen als Journal-Einträge aufzeichnen (siehe autosave_starten)
+        self.journal = None
+        self.journal_basis = False
+        self.sitzung_laedt = False
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(60_000)
+        self.autosave_timer.timeout.connect(self.autosave_kompaktieren)
+        modell = self.kandidaten_modell
+        modell.rowsInserted.connect(self.kandidaten_eingefuegt)
+        modell.rowsRemoved.connect(self.kandidaten_entfernt)
+        modell.dataChanged.connect(self.kandidaten_geaendert)
+        modell.modelReset.connect(self.kandidaten_zurueckgesetzt)
+        modell = self.korrektoren_modell
+        for signal in (modell.rowsInserted, modell.rowsRemoved, modell.dataChanged, modell.modelReset):
+            signal.connect(lambda *_: self.aufzeichnen("korrektoren", wert=self.korrektoren_daten()))
+        self.date1Edit.dateChanged.connect(lambda datum: self.aufzeichnen("datum1", wert=datum.toString(Qt.ISODate)))
+        self.date2Edit.dateChanged.connect(lambda datum: self.aufzeichnen("datum2", wert=datum.toString(Qt.ISODate)))
+
     # Überprüfen ob Duplikate bei den Korrektoren vorhanden sin
     @staticmethod
     def check_for_duplicates(combos):
@@ -441,27 +405,6 @@ class MainWindow(QMainWindow,Ui_MainWindow):
             else:
                 used_texts.add(text)
 
-    def lade_zeitslots(self):
-        try:
-            if self.preferences_file.exists():
-                with open(self.preferences_file, "r", encoding="utf-8") as f:
-                    daten = json.load(f)
-                zeitslots = daten.get("zeitslots")
-                if isinstance(zeitslots, list) and all(isinstance(z, list) for z in zeitslots):
-                    return zeitslots
-        except Exception as e:
-            print(f"Fehler beim Laden der Zeitslots: {e}")
-
-        # Fallback auf Default-Werte
-        return [
-            ["09:00", "10:00", "11:00", "12:00"],  # Tag 1
-            ["14:00", "15:00", "16:00", "17:00"]  # Tag 2
-        ]
-
-    def disable_current_item(self, _, __):
-        self.listWidget1.setCurrentItem(None)
-
-
     # Funktionen: Datum von oben nach unten kopieren
     def sync_date1(self, dat):
         self.labelDate1.setText(dat.toString("dd.MM.yyyy"))
@@ -473,6 +416,26 @@ class MainWindow(QMainWindow,Ui_MainWindow):
     def cancel_program(self):
         self.close()  # Fenster schließen (sanft)
 
+    def closeEvent(self, event):
+        # Laufenden Rechenprozess beenden, sonst wartet der Threadpool auf den Solver
+        if self.aktiver_worker is not None:
+            self.aktiver_worker.abbrechen()
+        if self.import_worker is not None:
+            self.import_worker.abbrechen()
+        self.gewichtsreihe_abbrechen()
+        for worker in self.pdf_worker.values():
+            worker.abbrechen()
+        if self.journal is not None:
+            # Letzter Schnappschuss, danach ist das Journal leer
+            self.session_save()
+            self.journal.beenden()
+            self.journal = None
+        if self.verlauf is not None:
+            self.verlauf.schliessen()
+            self.verlauf = None
+        self.einstellungen.sichern()
+        super().closeEvent(event)
+
     # Für den Import über Drag-and-Drop bei der Prüflingliste
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -482,22 +445,10 @@ class MainWindow(QMainWindow,Ui_MainWindow):
 
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                filepath = url.toLocalFile()
-                if filepath.endswith(".txt"):
-                    try:
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            lines = f.readlines()
-                        self.listWidgetList.clear()
-                        for line in lines:
-                            #self.listWidgetList.addItem(line.strip())
-                            item = QListWidgetItem(line.strip())
-                            item.setFlags(item.flags() | Qt.ItemIsEditable)
-                            self.listWidgetList.addItem(item)
-                        self.listWidgetList._limit_warning_shown = False
-
-                    except Exception as e:
-                        print(f"Fehler beim Lesen der Datei: {e}")
+            dateinamen = [url.toLocalFile() for url in event.mimeData().urls()
+                          if url.toLocalFile().lower().endswith(KANDIDATEN_ENDUNGEN)]
+            if dateinamen:
+                self.kandidaten_importieren(dateinamen)
 
             event.acceptProposedAction()
         else:
@@ -509,45 +460,15 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         """
         eingabedaten = {}
 
-        # 1. Korrektoren und individuelle Verfügbarkeiten erfassen
-        verfuegbarkeiten = {}
-
-        # Verfügbarkeiten von Tag 1 sammeln (listWidget1)
         tag1_datum = self.date1Edit.date().toString("yyyy-MM-dd")
         tag2_datum = self.date2Edit.date().toString("yyyy-MM-dd")
 
-        # Verfügbarkeiten aus den neuen Widgets
-        korrektor_zwischenspeicher = {}
-
-        # Tag 1
-        for widget in self.korrektor_items_tag1:
-            name = widget.get_name().strip()
-            if name:
-                korrektor_zwischenspeicher.setdefault(name, []).append((tag1_datum, widget.is_checked()))
-
-        # Tag 2
-        for widget in self.korrektor_items_tag2:
-            name = widget.get_name().strip()
-            if name:
-                korrektor_zwischenspeicher.setdefault(name, []).append((tag2_datum, widget.is_checked()))
+        # 1. Korrektoren und individuelle Verfügbarkeiten (nur mit mindestens einem Häkchen)
+        eingabedaten["verfügbarkeiten"] = self.korrektoren_modell.verfuegbarkeiten([tag1_datum, tag2_datum])
 
-        # Jetzt filtern: nur Korrektoren mit mindestens einer aktiven Checkbox
-        for name, tag_infos in korrektor_zwischenspeicher.items():
-            tage = [tag for tag, checked in tag_infos if checked]
-            if tage:
-                verfuegbarkeiten[name] = tage
-
-        eingabedaten["verfügbarkeiten"] = verfuegbarkeiten
-
-        # 2. Kandidatenliste aus listWidgetList lesen
-        kandidaten = {}
-        for i in range(self.listWidgetList.count()):
-            item = self.listWidgetList.item(i)
-            text = item.text().strip()
-            if text:
-                kandidaten[i + 1] = text  # Klausurnummer ab 1
-
-        eingabedaten["kandidaten"] = kandidaten
+        # 2. Kandidatenliste aus dem Kandidatenmodell lesen, Schlüssel ist die Prüflingsnummer
+        self.kandidaten_index = KandidatenIndex.aus_zeilen(self.kandidaten_modell.namen())
+        eingabedaten["kandidaten"] = self.kandidaten_index.als_eingabedaten()
 
         # 3. Prüfungstage (Datum 1 und 2)
         pruefungstage = []
@@ -568,150 +489,416 @@ class MainWindow(QMainWindow,Ui_MainWindow):
 
     # Optimierung starten (bisher nur Daten sammeln und anzeigen)
 
+    def live_modus_umschalten(self, aktiv):
+        if aktiv:
+            self.eingabe_geaendert()
+        else:
+            self.live_timer.stop()
+
+    def eingabe_geaendert(self, *_):
+        """Im Live-Modus: Neuberechnung entprellt einplanen (Timer startet bei jeder Änderung neu)."""
+        if self.actionLive.isChecked():
+            self.live_timer.start()
+
     def optimierung_starten(self):
         """
         Startet die Optimierung, verarbeitet das Ergebnis und zeigt Statusmeldungen an.
+        Eine noch laufende Optimierung mit veralteten Eingaben wird dabei abgebrochen.
         """
+        live = self.actionLive.isChecked()
+        self.live_timer.stop()
+        if self.aktiver_worker is not None:
+            self.aktiver_worker.abbrechen()
+            self.aktiver_worker = None
 
         self.statusBar().clearMessage()
         self.statusBar().setStyleSheet("")
         self.pushButtonCancelOptimize.setEnabled(True)
-        self.pushButtonOptimize.setEnabled(False)
-
-        # Tabellen leeren und GUI sofort aktualisieren
-        self.table1Widget.setRowCount(0)
-        self.table2Widget.setRowCount(0)
-        QApplication.processEvents()
-
-        eingabedaten = self.sammle_eingabedaten()
-
-        # Zeitslots aus Einstellungen übernehmen (wenn vorhanden)
-        if self.zeitslots:
-            eingabedaten["zeitslots"] = self.zeitslots
-
-        print("Eingabedaten für die Optimierung:")
-        import pprint
-        pprint.pprint(eingabedaten)
+        # Im Live-Modus bleibt der Knopf aktiv und die alte Lösung sichtbar, bis die neue da ist
+        self.pushButtonOptimize.setEnabled(live)
+
+        if not live:
+            # Tabellen leeren und GUI sofort aktualisieren
+            for modell in self.ergebnis_modelle:
+                modell.leeren()
+            QApplication.processEvents()
+
+        gestartet = time.perf_counter()
+        gui_messung = Messung()
+        with gui_messung.phase("eingabe"):
+            eingabedaten = self.sammle_eingabedaten()
+
+            # Zeitslots aus Einstellungen übernehmen (wenn vorhanden)
+            if self.zeitslots:
+                eingabedaten["zeitslots"] = self.zeitslots
+
+        # Nur auf Stufe DEBUG: wird sonst gar nicht erst formatiert
+        logger.debug("Eingabedaten für die Optimierung: %s", eingabedaten)
+
+        # Unlösbare Eingaben sofort melden, ohne Prozess und Solver zu starten
+        engine = "slots" if self.actionSlotModell.isChecked() else "milp"
+        gruende = pruefe_kandidaten(self.kandidaten_index)
+        try:
+            gruende += pruefe_instanz(Instanz.aus_eingabedaten(eingabedaten), engine)
+        except ValueError as e:
+            gruende.append(str(e))
+        if gruende:
+            self.optimierung_fehler(NichtLoesbar(gruende))
+            return
 
         # Worker erstellen
-        worker =  OptimierungsWorker(eingabedaten)
-        worker.signals.finished.connect(self.optimierung_abgeschlossen)
-        worker.signals.error.connect(self.optimierung_fehler)
+        # Signale eines abgelösten Workers werden verworfen (nur das neueste Ergebnis zählt)
+        worker =  OptimierungsWorker(eingabedaten, self.actionProfil.isChecked(), engine)
+        worker.gestartet = gestartet
+        worker.gui_messung = gui_messung
+        worker.signals.finished.connect(lambda ergebnis: self.optimierung_abgeschlossen(ergebnis, worker))
+        worker.signals.error.connect(lambda meldung: self.optimierung_fehler(meldung, worker))
+        worker.signals.progress.connect(lambda text: worker is self.aktiver_worker and self.statusBar().showMessage(text))
         # ergebnis = berechne_korrektorenverteilung(eingabedaten)
         # Worker starten
+        self.aktiver_worker = worker
         self.threadpool.start(worker)
 
 
-    def optimierung_abgeschlossen(self, ergebnis):
-        self.verarbeite_ergebnis(ergebnis)
+    def optimierung_abgeschlossen(self, ergebnis, worker=None):
+        if worker is not self.aktiver_worker:
+            return  # veraltetes Ergebnis
+        self.aktiver_worker = None
+        # Vergleich über die Prüflingsnummern, Umsortieren der Liste zählt also nicht als Änderung
+        vorher = self.letztes_ergebnis
+        with worker.gui_messung.phase("tabellen"):
+            self.verarbeite_ergebnis(ergebnis)
+        geaendert = plan_unterschiede(vorher.plan(), ergebnis.plan()) if vorher is not None else None
+        ergebnis.messung["phasen"].update(worker.gui_messung.phasen)
+        ergebnis.messung["gesamt"] = time.perf_counter() - worker.gestartet
+        self.messwerte_protokollieren("optimierung", ergebnis.messung)
+        if self.verlauf is not None:
+            self.verlauf.speichern(ergebnis, engine=worker.engine)
 
         self.pushButtonCancelOptimize.setEnabled(False)
         self.pushButtonOptimize.setEnabled(True)
 
-        status = ergebnis.get("status", "Unknown")
+        status = ergebnis.status
         if status == "Optimal":
-            self.statusBar().showMessage("Optimierung erfolgreich abgeschlossen (optimale Lösung).")
+            meldung = "Optimierung erfolgreich abgeschlossen (optimale Lösung)."
         elif status == "Optimal (nach Zeitlimit)":
-            self.statusBar().showMessage("Optimierung abgeschlossen (optimale Lösung, aber durch Zeitlimit erreicht).")
+            meldung = "Optimierung abgeschlossen (optimale Lösung, aber durch Zeitlimit erreicht)."
         elif status == "Beste gefundene Lösung (nicht optimal)":
-            self.statusBar().showMessage("Optimierung abgeschlossen (beste gefundene Lösung nach Zeitlimit).")
+            meldung = "Optimierung abgeschlossen (beste gefundene Lösung nach Zeitlimit)."
         else:
-            self.statusBar().showMessage(f"Optimierung abgeschlossen (Status: {status})")
+            meldung = f"Optimierung abgeschlossen (Status: {status})"
+        if geaendert is not None:
+            meldung += f" {len(geaendert)} Prüflinge anders eingeplant als zuvor."
+        self.statusBar().showMessage(meldung)
 
-    def optimierung_fehler(self, fehlermeldung):
+    def optimierung_fehler(self, fehlermeldung, worker=None):
+        if worker is not self.aktiver_worker:
+            return
+        self.aktiver_worker = None
         fehlertext = f"Fehler: {fehlermeldung}"
-        print(fehlertext)
+        logger.error("Optimierung fehlgeschlagen: %s", fehlermeldung)
         self.statusBar().setStyleSheet("color: red;")
         self.statusBar().showMessage(fehlertext)
 
         self.pushButtonCancelOptimize.setEnabled(False)
         self.pushButtonOptimize.setEnabled(True)
 
-    def pdf_anzeigen(self):
+    def optimierung_abbrechen(self):
+        if self.aktiver_worker is None and not self.gewichtsreihe_worker:
+            return
+        if self.aktiver_worker is not None:
+            self.aktiver_worker.abbrechen()
+            self.aktiver_worker = None
+        self.gewichtsreihe_abbrechen()
+        self.statusBar().showMessage("Optimierung abgebrochen.")
+        self.pushButtonCancelOptimize.setEnabled(False)
+        self.pushButtonOptimize.setEnabled(True)
+
+    def gewichtsreihe_starten(self):
         """
-        Zeigt das aktuell erzeugte PDF an (aus dem Speicher).
+        Löst das Modell für alle Gewichtungen aus gewichtsreihe.VERHAELTNISSE, in Abschnitten
+        parallel (je Abschnitt ein Prozess, Start jeweils vom vorigen Plan bzw. vom angezeigten),
+        und bietet danach die Pareto-optimalen Pläne zur Auswahl an.
         """
-        if not self.letztes_pdf_data:
-            print("Kein PDF im Speicher vorhanden.")
-            return
+        self.live_timer.stop()
+        if self.aktiver_worker is not None:
+            self.aktiver_worker.abbrechen()
+            self.aktiver_worker = None
+        self.gewichtsreihe_abbrechen()
+        self.statusBar().setStyleSheet("")
 
+        eingabedaten = self.sammle_eingabedaten()
+        if self.zeitslots:
+            eingabedaten["zeitslots"] = self.zeitslots
+        engine = "slots" if self.actionSlotModell.isChecked() else "milp"
+        gruende = pruefe_kandidaten(self.kandidaten_index)
         try:
-            # Temporäre Datei erstellen
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(self.letztes_pdf_data)
-                temp_path = tmp.name
+            instanz = Instanz.aus_eingabedaten(eingabedaten)
+            gruende += pruefe_instanz(instanz, engine)
+        except ValueError as e:
+            gruende.append(str(e))
+        if gruende:
+            self.gewichtsreihe_fehler(NichtLoesbar(gruende))
+            return
 
-            # Datei öffnen (plattformabhängig)
-            if sys.platform == "darwin":  # macOS
-                os.system(f"open '{temp_path}'")
-            elif sys.platform == "win32":  # Windows
-                os.startfile(temp_path)
-            elif sys.platform.startswith("linux"):
-                os.system(f"xdg-open '{temp_path}'")
+        ergebnisse = []
+
+        def fertig(teil, worker):
+            if worker not in self.gewichtsreihe_worker:
+                return  # abgebrochen
+            self.gewichtsreihe_worker.remove(worker)
+            ergebnisse.extend(teil)
+            if self.gewichtsreihe_worker:
+                self.statusBar().showMessage(f"Gewichtsreihe: {len(ergebnisse)}/{len(VERHAELTNISSE)} gelöst...")
             else:
-                print("Unbekanntes Betriebssystem.")
-        except Exception as e:
-            print(f"Fehler beim Öffnen der PDF-Datei: {e}")
+                self.gewichtsreihe_fertig(ergebnisse, engine)
+
+        def fehler(meldung, worker):
+            if worker in self.gewichtsreihe_worker:
+                self.gewichtsreihe_abbrechen()
+                self.gewichtsreihe_fehler(meldung)
+
+        # Alle Abschnitte gleichzeitig, der Threadpool wartet nur auf die Prozesse
+        for teil in abschnitte(VERHAELTNISSE, self.gewichtsreihe_pool.maxThreadCount()):
+            worker = ProzessWorker(loese_abschnitt, instanz, engine, teil, ZEITLIMIT, self.letztes_ergebnis)
+            worker.signals.finished.connect(lambda ergebnis, worker=worker: fertig(ergebnis, worker))
+            worker.signals.error.connect(lambda meldung, worker=worker: fehler(meldung, worker))
+            worker.signals.progress.connect(
+                lambda text, worker=worker: worker in self.gewichtsreihe_worker and self.statusBar().showMessage(text))
+            self.gewichtsreihe_worker.append(worker)
+        for worker in self.gewichtsreihe_worker:
+            self.gewichtsreihe_pool.start(worker)
+
+        self.statusBar().showMessage(f"Gewichtsreihe: {len(VERHAELTNISSE)} Gewichtungen werden gelöst...")
+        self.pushButtonCancelOptimize.setEnabled(True)
+        self.pushButtonOptimize.setEnabled(False)
 
-    def verarbeite_ergebnis(self, ergebnis):
+    def gewichtsreihe_abbrechen(self):
+        for worker in self.gewichtsreihe_worker:
+            worker.abbrechen()
+        self.gewichtsreihe_worker = []
+
+    def gewichtsreihe_fehler(self, fehlermeldung):
+        # Unabhängig von einer laufenden Einzeloptimierung immer anzeigen
+        logger.error("Gewichtsreihe fehlgeschlagen: %s", fehlermeldung)
+        self.statusBar().setStyleSheet("color: red;")
+        self.statusBar().showMessage(f"Fehler: {fehlermeldung}")
+        self.pushButtonCancelOptimize.setEnabled(self.aktiver_worker is not None)
+        self.pushButtonOptimize.setEnabled(True)
+
+    def gewichtsreihe_fertig(self, ergebnisse, engine):
+        self.pushButtonCancelOptimize.setEnabled(self.aktiver_worker is not None)
+        self.pushButtonOptimize.setEnabled(True)
+        front = pareto_front(ergebnisse)
+        if not front:
+            self.gewichtsreihe_fehler("Gewichtsreihe: für keine Gewichtung wurde im Zeitlimit ein Plan gefunden")
+            return
+        self.statusBar().showMessage(
+            f"Gewichtsreihe: {len(front)} Pareto-optimale Pläne aus {len(ergebnisse)} Läufen.")
+        dialog = GewichtsreiheDialog(front, self)
+        dialog.plan_gewaehlt.connect(lambda zeile: self.gewichtsreihe_uebernehmen(front[zeile], engine))
+        dialog.exec()
+
+    def gewichtsreihe_uebernehmen(self, ergebnis, engine):
+        self.verarbeite_ergebnis(ergebnis)
+        if self.verlauf is not None:
+            self.verlauf.speichern(ergebnis, engine=engine)
+        werte = ergebnis.messung["gewichtsreihe"]
+        self.statusBar().setStyleSheet("")
+        self.statusBar().showMessage(
+            f"Plan mit Gewichtung 1 : {werte['verhaeltnis']:g} übernommen "
+            f"({werte['anwesenheit']} Anwesenheitstage, Abweichung {werte['abweichung']:.1f}).")
+
+    def pdf_bereitstellen(self, aktion=None):
         """
-        Verarbeitet das Ergebnis der Optimierung:
-        - Speichert das erzeugte PDF (als Bytes)
-        - Füllt die Tabellen für Tag 1 und Tag 2 neu
+        Ruft aktion(pdf_pfad) auf, sobald das PDF zum aktuellen Ergebnis vorliegt.
+        Fehlt es noch im Cache, wird es im Hintergrund erzeugt (einmal je Ergebnis).
         """
+        if self.letztes_ergebnis is None:
+            logger.warning("Kein Ergebnis vorhanden.")
+            return
 
-        # 1. PDF-Daten speichern
-        self.letztes_pdf_data = ergebnis.get("pdf_data")
+        fingerprint = self.letzter_fingerprint
+        if fingerprint in self.pdf_cache:
+            if aktion:
+                aktion(self.pdf_cache[fingerprint])
+            return
 
-        if self.letztes_pdf_data:
-            print("Optimierung abgeschlossen. PDF liegt im Speicher.")
-        else:
-            print("Kein PDF im Ergebnis enthalten.")
+        if aktion:
+            self.pdf_wartend.setdefault(fingerprint, []).append(aktion)
+        if fingerprint in self.pdf_worker:
+            return  # wird bereits erzeugt
+
+        pdf_pfad = os.path.join(self.pdf_ordner, f"Pruefungsverteilung_{fingerprint[:12]}.pdf")
+        worker = PdfWorker(self.letztes_ergebnis, pdf_pfad)
+        worker.gestartet = time.perf_counter()
+        worker.signals.finished.connect(lambda pfad: self.pdf_fertig(fingerprint, pfad))
+        worker.signals.error.connect(lambda meldung: self.pdf_fehler(fingerprint, meldung))
+        self.pdf_worker[fingerprint] = worker
+        self.statusBar().showMessage("PDF wird erzeugt...")
+        self.threadpool.start(worker)
 
-        # 2. Tabellen leeren
-        self.table1Widget.setRowCount(0)
-        self.table2Widget.setRowCount(0)
+    def pdf_fertig(self, fingerprint, pdf_pfad):
+        worker = self.pdf_worker.pop(fingerprint, None)
+        if worker is not None:
+            # Nur die Erzeugung selbst, ohne den Start des Rechenprozesses
+            dauer = time.perf_counter() - worker.gestartet - (worker.startdauer or 0)
+            if fingerprint == self.letzter_fingerprint:
+                self.letztes_ergebnis.messung["phasen"]["pdf"] = {"wand": dauer, "cpu": None}
+            self.messwerte_protokollieren("pdf", {"phasen": {"pdf": {"wand": dauer, "cpu": None}}})
+        self.pdf_cache[fingerprint] = pdf_pfad
+        if worker is not None and self.verlauf is not None:
+            self.verlauf.pdf_speichern(fingerprint, pdf_pfad)
+        # Nur die letzten PDFs aufheben (Live-Modus erzeugt viele Ergebnisse)
+        while len(self.pdf_cache) > 10:
+            alt = self.pdf_cache.pop(next(iter(self.pdf_cache)))
+            try:
+                os.remove(alt)
+            except OSError:
+                pass  # z.B. unter Windows noch im Viewer geöffnet
+        self.statusBar().clearMessage()
+        for aktion in self.pdf_wartend.pop(fingerprint, []):
+            aktion(pdf_pfad)
 
-        # 3. Verteilung holen
-        verteilung = ergebnis.get("verteilung", {})
+    def pdf_fehler(self, fingerprint, meldung):
+        self.pdf_worker.pop(fingerprint, None)
+        self.pdf_wartend.pop(fingerprint, None)
+        logger.error("Fehler beim Erzeugen des PDFs: %s", meldung)
+        self.statusBar().setStyleSheet("color: red;")
+        self.statusBar().showMessage(f"Fehler beim Erzeugen des PDFs: {meldung}")
 
-        # 4. Tabellen füllen
-        pruefungstage = self.sammle_eingabedaten()["pruefungstage"]
+    def messwerte_protokollieren(self, art, messung):
+        if not self.actionMesswerte.isChecked():
+            return
+        try:
+            schreibe_messwerte({"art": art, "fingerprint": self.letzter_fingerprint, **messung})
+        except OSError as e:
+            logger.error("Fehler beim Schreiben der Messwerte: %s", e)
 
-        for tag_index, datum in enumerate(pruefungstage):
-            if datum not in verteilung:
-                continue
+    def verlauf_oeffnen(self, pfad=VERLAUF_DATEI):
+        try:
+            self.verlauf = Verlauf(pfad)
+            self.actionVerlauf.setEnabled(True)
+        except Exception as e:
+            logger.exception("Verlauf nicht verfügbar: %s", e)
 
-            table = self.table1Widget if tag_index == 0 else self.table2Widget
-            eintraege = verteilung[datum]
+    def verlauf_anzeigen(self):
+        dialog = VerlaufDialog(self.verlauf, self)
+        dialog.plan_laden.connect(self.plan_aus_verlauf)
+        dialog.eingaben_laden.connect(lambda lauf_id: self.plan_aus_verlauf(lauf_id, eingaben=True))
+        dialog.exec()
 
-            for eintrag in eintraege:
-                if isinstance(eintrag, (list, tuple)) and len(eintrag) == 3:
-                    zeit, pruefling, korr_pair = eintrag
-                else:
-                    continue  # falls falsches Format, überspringen
+    def plan_aus_verlauf(self, lauf_id, eingaben=False):
+        """
+        Zeigt einen gespeicherten Plan ohne neue Optimierung; ein gespeichertes PDF wird direkt verwendet.
+        Mit eingaben=True werden auch Prüflinge, Korrektoren und Prüfungstage des Laufs übernommen.
+        """
+        try:
+            ergebnis = self.verlauf.laden(lauf_id)
+        except Exception as e:
+            logger.exception("Lauf %s nicht geladen: %s", lauf_id, e)
+            return
 
-                row = table.rowCount()
-                table.insertRow(row)
+        instanz = ergebnis.instanz
+        if eingaben:
+            self.kandidaten_modell.setze_namen(instanz.kandidaten)
+            self.korrektoren_modell.setze_korrektoren(
+                (name, [instanz.verfuegbar(p, t) for t in range(len(instanz.tage))])
+                for p, name in enumerate(instanz.korrektoren)
+            )
+            for edit, datum in zip((self.date1Edit, self.date2Edit), instanz.tage):
+                edit.setDate(QDate.fromString(datum, Qt.ISODate))
+            # Eingaben entsprechen dem geladenen Plan, keine Neuberechnung im Live-Modus
+            self.live_timer.stop()
 
-                # Uhrzeit
-                table.setItem(row, 0, QTableWidgetItem(zeit))
+        self.verarbeite_ergebnis(ergebnis)
+        pdf = self.verlauf.pdf(lauf_id)
+        if pdf is not None and self.letzter_fingerprint not in self.pdf_cache:
+            pdf_pfad = os.path.join(self.pdf_ordner, f"Pruefungsverteilung_{self.letzter_fingerprint[:12]}.pdf")
+            with open(pdf_pfad, "wb") as f:
+                f.write(pdf)
+            self.pdf_cache[self.letzter_fingerprint] = pdf_pfad
+        self.statusBar().setStyleSheet("")
+        self.statusBar().showMessage(f"Plan aus dem Verlauf geladen ({', '.join(instanz.tage)}, Status: {ergebnis.status}).")
 
-                # Prüfling
-                table.setItem(row, 1, QTableWidgetItem(pruefling))
+    def diagnose_anzeigen(self):
+        messung = self.letztes_ergebnis.messung if self.letztes_ergebnis is not None else {}
+        DiagnoseDialog(messung, self).exec()
 
-                # Korrektoren
-                korr_name = ", ".join(korr_pair) if isinstance(korr_pair, (list, tuple)) else str(korr_pair)
-                table.setItem(row, 2, QTableWidgetItem(korr_name))
+    def pdf_anzeigen(self):
+        """
+        Zeigt das PDF zum aktuellen Ergebnis an (wird bei Bedarf erst erzeugt).
+        """
+        self.pdf_bereitstellen(self.pdf_oeffnen)
+
+    @staticmethod
+    def pdf_oeffnen(temp_path):
+        try:
+            # Datei öffnen (plattformabhängig)
+            if sys.platform == "darwin":  # macOS
+                os.system(f"open '{temp_path}'")
+            elif sys.platform == "win32":  # Windows
+                os.startfile(temp_path)
+            elif sys.platform.startswith("linux"):
+                os.system(f"xdg-open '{temp_path}'")
+            else:
+                logger.warning("Unbekanntes Betriebssystem.")
+        except Exception as e:
+            logger.exception("Fehler beim Öffnen der PDF-Datei: %s", e)
+
+    def verarbeite_ergebnis(self, ergebnis):
+        """
+        Verarbeitet das Ergebnis der Optimierung:
+        - Merkt sich das Ergebnis (das PDF wird erst bei Bedarf erzeugt)
+        - Übergibt es den Modellen der Tabellen für Tag 1 und Tag 2 (ein Reset je Tabelle)
+        """
+
+        # 1. Ergebnis merken
+        self.letztes_ergebnis = ergebnis
+        self.letzter_fingerprint = ergebnis.fingerprint()
+
+        # 2. Belastung je Korrektor
+        statistik = ergebnis.statistik
+        if statistik:
+            korrektoren = ergebnis.instanz.korrektoren
+            self.belastung_label.setText("Belastung: " + ", ".join(
+                f"{p} {n}" for p, n in zip(korrektoren, statistik["belastung"])))
+            self.belastung_label.setToolTip("\n".join(
+                f"{p}: " + " / ".join(str(n) for n in zeile)
+                for p, zeile in zip(korrektoren, statistik["belastung_pro_tag"])))
+
+        # 3. Auswahlliste der Korrektoren, die bisherige Auswahl bleibt wenn möglich erhalten
+        auswahl = self.korrektor_auswahl.currentText()
+        self.korrektor_auswahl.blockSignals(True)
+        self.korrektor_auswahl.clear()
+        self.korrektor_auswahl.addItem("(alle Korrektoren)")
+        self.korrektor_auswahl.addItems(ergebnis.instanz.korrektoren)
+        self.korrektor_auswahl.setCurrentIndex(max(0, self.korrektor_auswahl.findText(auswahl)))
+        self.korrektor_auswahl.blockSignals(False)
+
+        # 4. Tabellen in einem Schritt füllen; Sortierung, Filter und Hervorhebung macht das Modell
+        for modell in self.ergebnis_modelle:
+            modell.setze_ergebnis(ergebnis)
+        self.korrektor_auswahl_geaendert()
+
+    def korrektor_auswahl_geaendert(self):
+        """Hebt die Prüfungen des gewählten Korrektors hervor bzw. zeigt nur diese."""
+        korrektor = self.korrektor_auswahl.currentText() if self.korrektor_auswahl.currentIndex() > 0 else None
+        for modell in self.ergebnis_modelle:
+            modell.hervorheben(korrektor)
+            modell.filtern(korrektor if self.nur_korrektor.isChecked() else None)
 
     def pdf_abspeichern(self)-> None:
         """
-        Speichert das aktuell erzeugte PDF über einen Dateidialog ab.
+        Speichert das PDF zum aktuellen Ergebnis über einen Dateidialog ab.
         """
-        if not self.letztes_pdf_data:
-            print("Kein PDF im Speicher vorhanden.")
+        if self.letztes_ergebnis is None:
+            logger.warning("Kein Ergebnis vorhanden.")
             return
 
+        # PDF schon erzeugen, während der Dateidialog offen ist
+        self.pdf_bereitstellen()
+
         # Dateidialog öffnen
         dateiname, _ = QFileDialog.getSaveFileName(
             self,
@@ -725,44 +912,119 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         if not dateiname.lower().endswith(".pdf"):
             dateiname += ".pdf"
 
+        self.pdf_bereitstellen(lambda pdf_pfad: self.pdf_kopieren(pdf_pfad, dateiname))
+
+    @staticmethod
+    def pdf_kopieren(pdf_pfad, dateiname):
         try:
-            with open(dateiname, "wb") as f:
-                f.write(self.letztes_pdf_data)
-            print(f"PDF erfolgreich gespeichert: {dateiname}")
+            # Fertige Datei kopieren statt das PDF erneut zu serialisieren
+            shutil.copyfile(pdf_pfad, dateiname)
+            logger.info("PDF erfolgreich gespeichert: %s", dateiname)
         except Exception as e:
-            print(f"Fehler beim Speichern des PDFs: {e}")
+            logger.exception("Fehler beim Speichern des PDFs: %s", e)
+
 
 
+    def korrektorenmappen_abspeichern(self) -> None:
+        """
+        Erzeugt je Korrektor eine persönliche Mappe und speichert alle als ZIP-Archiv.
+        """
+        if self.letztes_ergebnis is None:
+            logger.warning("Kein Ergebnis vorhanden.")
+            return
+
+        dateiname, _ = QFileDialog.getSaveFileName(
+            self,
+            "Korrektorenmappen speichern unter...",
+            filter="ZIP-Archive (*.zip)"
+        )
+
+        if not dateiname:
+            return
+
+        if not dateiname.lower().endswith(".zip"):
+            dateiname += ".zip"
+
+        worker = MappenWorker(self.letztes_ergebnis, dateiname)
+        worker.signals.progress.connect(self.statusBar().showMessage)
+        worker.signals.finished.connect(lambda pfad: self.statusBar().showMessage(f"Korrektorenmappen gespeichert: {pfad}"))
+        worker.signals.error.connect(lambda meldung: logger.error("Fehler beim Erzeugen der Korrektorenmappen: %s", meldung))
+        self.threadpool.start(worker)
 
     def kandidaten_einlesen(self) -> None:
         """
-        Liest eine Textdatei mit Kandidaten ein und füllt die listWidgetList.
+        Liest eine Prüflingsliste (Text, CSV oder Excel) im Hintergrund ein und füllt die listWidgetList.
         """
         dateiname, _ = QFileDialog.getOpenFileName(
             self,
             "Kandidatenliste laden...",
-            filter="Textdateien (*.txt)"
+            filter="Prüflingslisten (*.txt *.csv *.xlsx);;Textdateien (*.txt);;CSV (*.csv);;Excel (*.xlsx)"
         )
 
         if not dateiname:
             return  # Abbruch
 
-        try:
-            with open(dateiname, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+        self.kandidaten_importieren([dateiname])
 
-            self.listWidgetList.clear()
+    def kandidaten_importieren(self, dateinamen) -> None:
+        """
+        Startet den Import im Hintergrund; die Namen kommen blockweise an, der erste Block
+        ersetzt die bisherige Liste, alle weiteren (auch aus weiteren Dateien) werden angehängt.
+        Ein noch laufender Import wird abgebrochen.
+        """
+        if self.import_worker is not None:
+            self.import_worker.abbrechen()
 
-            for line in lines:
-                item = QListWidgetItem(line.strip())
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
-                self.listWidgetList.addItem(item)
+        worker = ImportWorker(dateinamen)
+        self.import_worker = worker
 
-            self.listWidgetList._limit_warning_shown = False
+        def block(namen, ersetzen):
+            if worker is self.import_worker:
+                if ersetzen:
+                    self.kandidaten_uebernehmen(namen)
+                else:
+                    self.kandidaten_modell.anhaengen(namen)
+
+        def fertig(anzahl):
+            if worker is self.import_worker:
+                self.import_worker = None
+                logger.info("%s Kandidaten erfolgreich eingelesen.", anzahl)
+                self.kandidaten_pruefen()
+
+        def fehler(meldung):
+            if worker is self.import_worker:
+                self.import_worker = None
+                self.statusBar().showMessage(f"Prüflingsliste nicht eingelesen: {meldung}")
+
+        def fortschritt(text):
+            if worker is self.import_worker:
+                self.statusBar().showMessage(text)
+
+        worker.signals.block.connect(block)
+        worker.signals.finished.connect(fertig)
+        worker.signals.error.connect(fehler)
+        worker.signals.progress.connect(fortschritt)
+        self.threadpool.start(worker)
 
-            print(f"{len(lines)} Kandidaten erfolgreich eingelesen.")
-        except Exception as e:
-            print(f"Fehler beim Einlesen der Kandidatenliste: {e}")
+    def kandidaten_pruefen(self) -> None:
+        """Meldet doppelte Prüflingsnummern und Zeilen ohne Nummer in der Statuszeile."""
+        index = KandidatenIndex.aus_zeilen(self.kandidaten_modell.namen())
+        meldungen = pruefe_kandidaten(index)
+        if index.ohne_nummer:
+            zeilen = ", ".join(str(z) for z in index.ohne_nummer[:5]) + (" ..." if len(index.ohne_nummer) > 5 else "")
+            meldungen.append(f"{len(index.ohne_nummer)} Zeilen ohne Prüflingsnummer (Zeilen {zeilen})")
+        text = f"{len(index.kandidaten)} Prüflinge eingelesen."
+        if meldungen:
+            logger.warning("Prüflingsliste: %s", "; ".join(meldungen))
+            self.statusBar().setStyleSheet("color: red;" if index.doppelt else "")
+            self.statusBar().showMessage(text + " " + "; ".join(meldungen))
+        else:
+            self.statusBar().setStyleSheet("")
+            self.statusBar().showMessage(text, 5000)
+
+    def kandidaten_uebernehmen(self, lines) -> None:
+        """Ersetzt die Prüflingsliste durch die übergebenen Zeilen (in einem Schritt)."""
+        self.kandidaten_modell.setze_namen(lines)
 
     def korrektoren_einlesen(self):
         dateiname, _ = QFileDialog.getOpenFileName(
@@ -775,44 +1037,19 @@ class MainWindow(QMainWindow,Ui_MainWindow):
             return
 
         try:
-            with open(dateiname, "r", encoding="utf-8") as f:
-                zeilen = [line.strip() for line in f if line.strip()]
-            version = 1
-            if zeilen and zeilen[0].startswith("# version="):
-                try:
-                    version = int(zeilen[0].split("=")[1])
-                except ValueError:
-                    version = 0  # ungültige Versionsangabe
-                zeilen.pop(0)  # Entferne die Versionszeile
-
-            if version != 2:
-                print(f"Korrektorenliste nicht geladen: inkompatible Version {version} (erwartet: 2)")
-                return
-
+            zeilen = lese_korrektorendatei(dateiname)
+        except ValueError as e:
+            logger.warning("Korrektorenliste nicht geladen: %s", e)
+            return
         except Exception as e:
-            print(f"Fehler beim Einlesen der Korrektoren: {e}")
+            logger.exception("Fehler beim Einlesen der Korrektoren: %s", e)
             return
 
-        # Maximal 10 übernehmen
-        zeilen = zeilen[:10]
-
-        # Beide Tage aktualisieren (gleichmäßig)
-        for i, zeile in enumerate(zeilen):
-            parts = zeile.split(";")
-            name = parts[0].strip()
-            if not name:
-                continue  # Zeile ignorieren, wenn Name leer
-
-            checked = parts[1].strip() == "1" if len(parts) > 1 else False
+        # Zeilen ohne Namen ignorieren
+        zeilen = [(name, tage) for name, tage in zeilen if name]
+        self.korrektoren_modell.setze_korrektoren(zeilen)
 
-            if i < len(self.korrektor_items_tag1):
-                self.korrektor_items_tag1[i].set_name(name)
-                self.korrektor_items_tag1[i].set_checked(checked)
-            if i < len(self.korrektor_items_tag2):
-                self.korrektor_items_tag2[i].set_name(name)
-                self.korrektor_items_tag2[i].set_checked(checked)
-
-        print(f"Korrektorenliste erfolgreich geladen mit {len(zeilen)} Einträgen.")
+        logger.info("Korrektorenliste erfolgreich geladen mit %s Einträgen.", len(zeilen))
 
     def kandidaten_speichern(self):
         """
@@ -833,12 +1070,11 @@ class MainWindow(QMainWindow,Ui_MainWindow):
 
         try:
             with open(dateiname, "w", encoding="utf-8") as f:
-                for i in range(self.listWidgetList.count()):
-                    item = self.listWidgetList.item(i)
-                    f.write(item.text() + "\n")
-            print(f"Kandidatenliste erfolgreich gespeichert: {dateiname}")
+                for name in self.kandidaten_modell.namen():
+                    f.write(name + "\n")
+            logger.info("Kandidatenliste erfolgreich gespeichert: %s", dateiname)
         except Exception as e:
-            print(f"Fehler beim Speichern der Kandidaten: {e}")
+            logger.exception("Fehler beim Speichern der Kandidaten: %s", e)
 
     def korrektoren_speichern(self):
         dateiname, _ = QFileDialog.getSaveFileName(
@@ -854,77 +1090,70 @@ class MainWindow(QMainWindow,Ui_MainWindow):
             dateiname += ".txt"
 
         try:
-            # Nur Namen aus Tag 1 exportieren, zusätzlich mit Anwesenheits-Flag
-            with open(dateiname, "w", encoding="utf-8") as f:
-                f.write("# version=2\n")
-                for w in self.korrektor_items_tag1:
-                    name = w.get_name()
-                    if name:
-                        checked = "1" if w.is_checked() else "0"
-                        f.write(f"{name};{checked}\n")
-
-            print(f"Korrektorenliste erfolgreich gespeichert: {dateiname}")
-        except Exception as e:
-            print(f"Fehler beim Speichern der Korrektoren: {e}")
-
-    def session_save(self):
-        """
-        Speichert die aktuelle GUI-Sitzung in eine JSON-Datei im Home-Verzeichnis.
-        """
-        try:
-            session_data = {}
+            # Namen mit Anwesenheit je Tag (Format version=3)
+            schreibe_korrektorendatei(dateiname, self.korrektoren_modell.korrektoren())
 
-            # Fenstergröße und -position
-            geom = self.geometry()
-            session_data["geometry"] = {
+            logger.info("Korrektorenliste erfolgreich gespeichert: %s", dateiname)
+        except Exception as e:
+            logger.exception("Fehler beim Speichern der Korrektoren: %s", e)
+
+    def session_daten(self) -> dict:
+        """Die aktuelle GUI-Sitzung im Format der Sitzungsdatei."""
+        # Fenstergröße und -position
+        geom = self.geometry()
+        return {
+            "geometry": {
                 "x": geom.x(),
                 "y": geom.y(),
                 "width": geom.width(),
                 "height": geom.height()
-            }
-
+            },
             # Prüflingsliste
-            session_data["prueflinge"] = [self.listWidgetList.item(i).text() for i in
-                                          range(self.listWidgetList.count())]
-
-            # Korrektoren Tag 1
-            session_data["korrektoren_tag1"] = [
-                {"name": w.get_name(), "checked": w.is_checked()}
-                for w in self.korrektor_items_tag1
-            ]
-
-            # Korrektoren Tag 2
-            session_data["korrektoren_tag2"] = [
-                {"name": w.get_name(), "checked": w.is_checked()}
-                for w in self.korrektor_items_tag2
-            ]
-
+            "prueflinge": self.kandidaten_modell.namen(),
+            # Korrektoren mit Anwesenheit je Tag
+            "korrektoren": self.korrektoren_daten(),
             # Prüfungstage
-            session_data["datum1"] = self.date1Edit.date().toString(Qt.ISODate)
-            session_data["datum2"] = self.date2Edit.date().toString(Qt.ISODate)
-            session_data["version"] = 2
+            "datum1": self.date1Edit.date().toString(Qt.ISODate),
+            "datum2": self.date2Edit.date().toString(Qt.ISODate),
+            "version": SESSION_VERSION
+        }
 
-            # Datei schreiben
-            with open(str(SESSION_FILE), "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2)
+    def korrektoren_daten(self) -> list[dict]:
+        return [{"name": name, "tage": tage} for name, tage in self.korrektoren_modell.korrektoren()]
 
-            print(f"Sitzung erfolgreich gespeichert unter {SESSION_FILE}")
+    def session_save(self):
+        """
+        Speichert die aktuelle GUI-Sitzung in eine JSON-Datei im Home-Verzeichnis (atomar).
+        Mit laufendem Autosave geht das als Schnappschuss über das Journal.
+        """
+        try:
+            if self.journal is not None:
+                self.journal.schnappschuss(self.session_daten())
+                self.journal_basis = True
+            else:
+                schreibe_atomar(SESSION_FILE, json.dumps(self.session_daten(), indent=2).encode("utf-8"))
+            logger.info("Sitzung erfolgreich gespeichert unter %s", SESSION_FILE)
         except Exception as e:
-            print(f"Fehler beim Speichern der Sitzung: {e}")
+            logger.exception("Fehler beim Speichern der Sitzung: %s", e)
 
     def session_read(self):
         """
-        Fragt beim Start, ob die letzte Sitzung geladen werden soll und lädt sie ggf.
+        Fragt (beim Start bzw. über das Menü), ob die letzte Sitzung geladen werden soll, und lädt sie ggf.
+        Änderungen aus dem Journal, die noch in keinem Schnappschuss stehen, werden nachgespielt.
         """
         try:
-            if not SESSION_FILE.exists():
+            session_data, nachgespielt = lese_sitzung(SESSION_FILE, SESSION_JOURNAL)
+            if session_data is None:
                 return  # Keine gespeicherte Sitzung
 
+            frage = "Möchten Sie die letzte Sitzung wiederherstellen?"
+            if nachgespielt:
+                frage += f"\n({nachgespielt} nicht gespeicherte Änderungen aus dem Journal)"
             # noinspection PyUnresolvedReferences
             reply = QMessageBox.question(
                 self,
                 "Session laden",
-                "Möchten Sie die letzte Sitzung wiederherstellen?",
+                frage,
 
                 QMessageBox.Yes | QMessageBox.No
             )
@@ -933,48 +1162,106 @@ class MainWindow(QMainWindow,Ui_MainWindow):
             if reply != QMessageBox.Yes:
                 return
 
-            with open(SESSION_FILE, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            self.session_anwenden(session_data)
+            logger.info("Sitzung erfolgreich geladen von %s (%s Änderungen aus dem Journal)",
+                        SESSION_FILE, nachgespielt)
+            # Journal und Schnappschuss auf den geladenen Stand bringen
+            if self.journal is not None:
+                self.session_save()
+        except Exception as e:
+            logger.exception("Fehler beim Laden der Sitzung: %s", e)
 
-            version = session_data.get("version", 1)
-            if version != 2:
-                print(f"Sitzung wird nicht geladen: inkompatible Version {version} (erwartet: 2)")
-                return
+    def session_laden(self, pfad):
+        """
+        Stellt eine gespeicherte Sitzung aus pfad wieder her (ohne Rückfrage).
+        """
+        try:
+            with open(pfad, "r", encoding="utf-8") as f:
+                session_data = json.load(f)
+            self.session_anwenden(session_data)
+            logger.info("Sitzung erfolgreich geladen von %s", pfad)
+        except Exception as e:
+            logger.exception("Fehler beim Laden der Sitzung: %s", e)
+
+    def session_anwenden(self, session_data):
+        """Überträgt eine Sitzung (Format der Sitzungsdatei) in die GUI, ohne sie erneut aufzuzeichnen."""
+        version = session_data.get("version", 1)
+        if version not in (2, SESSION_VERSION):
+            logger.warning("Sitzung wird nicht geladen: inkompatible Version %s (erwartet: 2 oder %s)",
+                           version, SESSION_VERSION)
+            return
 
+        self.sitzung_laedt = True
+        try:
             # Fenstergröße und -position
             g = session_data["geometry"]
             self.setGeometry(g["x"], g["y"], g["width"], g["height"])
 
             # Prüflingsliste
-            self.listWidgetList.clear()
-            for text in session_data.get("prueflinge", []):
-                item = QListWidgetItem(text.strip())
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
-                self.listWidgetList.addItem(item)
-
-            # Korrektoren Tag 1
-            for i, eintrag in enumerate(session_data.get("korrektoren_tag1", [])):
-                if i < len(self.korrektor_items_tag1):
-                    w = self.korrektor_items_tag1[i]
-                    w.set_name(eintrag.get("name", ""))
-                    w.set_checked(eintrag.get("checked", False))
-
-            # Korrektoren Tag 2
-            for i, eintrag in enumerate(session_data.get("korrektoren_tag2", [])):
-                if i < len(self.korrektor_items_tag2):
-                    w = self.korrektor_items_tag2[i]
-                    w.set_name(eintrag.get("name", ""))
-                    w.set_checked(eintrag.get("checked", False))
+            self.kandidaten_modell.setze_namen(session_data.get("prueflinge", []))
+
+            # Korrektoren
+            if version == 2:
+                # Version 2: je Tag eine eigene Liste, gleiche Namen werden zusammengeführt
+                korrektoren = {}
+                for t, schluessel in enumerate(["korrektoren_tag1", "korrektoren_tag2"]):
+                    for eintrag in session_data.get(schluessel, []):
+                        name = eintrag.get("name", "").strip()
+                        if name:
+                            korrektoren.setdefault(name, [False, False])[t] = bool(eintrag.get("checked", False))
+                self.korrektoren_modell.setze_korrektoren(korrektoren.items())
+            else:
+                self.korrektoren_modell.setze_korrektoren(
+                    (eintrag.get("name", ""), eintrag.get("tage", [])) for eintrag in session_data.get("korrektoren", [])
+                )
 
             # Prüfungstage
             if "datum1" in session_data:
                 self.date1Edit.setDate(QDate.fromString(session_data["datum1"], Qt.ISODate))
             if "datum2" in session_data:
                 self.date2Edit.setDate(QDate.fromString(session_data["datum2"], Qt.ISODate))
+        finally:
+            self.sitzung_laedt = False
 
-            print(f"Sitzung erfolgreich geladen von {SESSION_FILE}")
-        except Exception as e:
-            print(f"Fehler beim Laden der Sitzung: {e}")
+    def autosave_starten(self):
+        """
+        Startet das automatische Speichern: Änderungen gehen ab jetzt ins Journal.
+        Solange kein Schnappschuss zum aktuellen Stand existiert (z.B. Wiederherstellen abgelehnt),
+        wird bei der ersten Änderung zuerst einer geschrieben.
+        """
+        self.journal = SitzungsJournal(SESSION_FILE, SESSION_JOURNAL, letzte_nummer(SESSION_FILE, SESSION_JOURNAL))
+        self.journal_basis = False
+        self.autosave_timer.start()
+
+    def aufzeichnen(self, art, umfang=1, **daten):
+        """Hängt eine Änderung ans Journal (nur mit laufendem Autosave, nicht beim Laden einer Sitzung)."""
+        if self.journal is None or self.sitzung_laedt:
+            return
+        if not self.journal_basis:
+            self.session_save()
+        elif self.journal.aufzeichnen(art, umfang, **daten):
+            self.session_save()
+
+    def autosave_kompaktieren(self):
+        """Regelmäßig: offene Journal-Einträge (und die Fenstergeometrie) in einen Schnappschuss übernehmen."""
+        if self.journal is not None and self.journal_basis and self.journal.unkompaktiert:
+            self.session_save()
+
+    def kandidaten_eingefuegt(self, _parent, erste, letzte):
+        namen = [self.kandidaten_modell.index(i).data() for i in range(erste, letzte + 1)]
+        self.aufzeichnen("kandidaten_einfuegen", len(namen), zeile=erste, namen=namen)
+
+    def kandidaten_entfernt(self, _parent, erste, letzte):
+        self.aufzeichnen("kandidaten_entfernen", zeile=erste, anzahl=letzte - erste + 1)
+
+    def kandidaten_geaendert(self, oben, unten, *_):
+        namen = [self.kandidaten_modell.index(i).data() for i in range(oben.row(), unten.row() + 1)]
+        self.aufzeichnen("kandidaten_aendern", len(namen), zeile=oben.row(), namen=namen)
+
+    def kandidaten_zurueckgesetzt(self):
+        # Eine ganz neue Liste landet direkt im Schnappschuss statt als großer Journal-Eintrag
+        if self.journal is not None and not self.sitzung_laedt:
+            self.session_save()
 
     def about_box(self):
         QMessageBox.about(
@@ -985,81 +1272,50 @@ class MainWindow(QMainWindow,Ui_MainWindow):
         )
 
     def open_preferences_dialog(self):
-        dialog = PreferencesDialog(self, self.preferences_file)
+        dialog = PreferencesDialog(self, self.einstellungen)
 
         if dialog.exec():
-            neue_zeitslots = dialog.get_pruefungszeiten()
-
-            # Zeitslots übernehmen, wenn sie sich geändert haben
-            if neue_zeitslots != self.zeitslots:
-                self.zeitslots = neue_zeitslots
-                self.table1Widget.setRowCount(0)
-                self.table2Widget.setRowCount(0)
-                self.statusBar().clearMessage()
-                self.statusBar().setStyleSheet("")
-                self.letztes_pdf_data = None
-
-            # Jetzt auch die 4 Werte dauerhaft speichern
+            # Geänderte Zeitslots kommen über einstellung_geaendert zurück
             dialog.save_preferences()
         else:
-            print("Abbrechen gedrückt – nichts speichern")
+            logger.debug("Abbrechen gedrückt – nichts speichern")
 
-    def lade_preferences(self):
-        """
-        Liest gespeicherte Einstellungen wie Zeitslots aus ~/.pvihk_preferences.json
-        (Eintragen in Widgets erfolgt im Dialog selbst.)
-        """
-        if not self.preferences_file.exists():
+    def einstellung_geaendert(self, schluessel, wert):
+        if schluessel != "zeitslots":
             return
+        self.zeitslots = wert
+        for modell in self.ergebnis_modelle:
+            modell.leeren()
+        self.statusBar().clearMessage()
+        self.statusBar().setStyleSheet("")
+        self.letztes_ergebnis = None
+        self.letzter_fingerprint = None
+        self.eingabe_geaendert()
 
-        try:
-            with open(self.preferences_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            version = data.get("version", 1)
-            if version != 2:
-                print(f"Präferenzen werden nicht geladen: inkompatible Version {version} (erwartet: 2)")
-                return
-
-            # Nur Zeitslots übernehmen
-            if isinstance(data.get("zeitslots"), list) and all(isinstance(z, list) for z in data["zeitslots"]):
-                self.zeitslots = data["zeitslots"]
-
-        except Exception as e:
-            print(f"Fehler beim Laden der Präferenzen: {e}")
-
-    def speichere_preferences(self):
-        """
-        Speichert aktuelle Einstellungen (z. B. Zeitslots) in ~/.pvihk_preferences.json.
-        Nur die vom Hauptfenster verwalteten Daten, z. B. Zeitslots.
-        Weitere Felder wie begin1/dauer1 werden vom PreferencesDialog verwaltet.
-        """
-        try:
-            data = {}
-
-            # Bestehende Datei laden, damit nicht andere Einstellungen verloren gehen
-            if self.preferences_file.exists():
-                with open(self.preferences_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
 
-            # Nur Zeitslots aus MainWindow aktualisieren
-            data["zeitslots"] = self.zeitslots
-            data["version"] = 2
+if __name__ == "__main__":
+    # Nötig für die Rechenprozesse im gebündelten Programm (PyInstaller)
+    multiprocessing.freeze_support()
 
-            with open(self.preferences_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+    # Überwachungsmodus ohne Fenster, z.B.: pvihk --ueberwachen ORDNER
+    if len(sys.argv) > 1 and sys.argv[1] == "--ueberwachen":
+        from ordnerUeberwachung import main as ueberwachung_main
+        sys.exit(ueberwachung_main(sys.argv[2:]))
 
-            print("Präferenzen gespeichert.")
-        except Exception as e:
-            print(f"Fehler beim Speichern der Präferenzen: {e}")
+    protokoll.einrichten()
+    logger.info("%s gestartet", WINDOWTITLE)
 
+    app = QApplication(sys.argv)
 
-app = QApplication(sys.argv)
+    if platform.system() == "Windows":
+        app.setStyle("Fusion")
 
-if platform.system() == "Windows":
-    app.setStyle("Fusion")
+    window = MainWindow()
+    window.show()
 
-window = MainWindow()
-window.show()
+    # Letzte Sitzung (inkl. nicht gespeicherter Änderungen aus dem Journal) anbieten, dann automatisch speichern
+    window.session_read()
+    window.autosave_starten()
+    window.verlauf_oeffnen()
 
-app.exec()
+    app.exec()
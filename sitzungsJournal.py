@@ -0,0 +1,140 @@
+"""
+Automatisches Speichern der Sitzung.
+
+Jede Änderung wird als kurze JSON-Zeile mit laufender Nummer an ein Journal angehängt.
+Von Zeit zu Zeit wird der ganze Zustand als Schnappschuss in die Sitzungsdatei geschrieben
+(atomar über eine temporäre Datei) und das Journal beginnt von vorn. Geschrieben wird in
+einem eigenen Thread, der GUI-Thread legt Einträge nur in eine Queue.
+
+Wiederherstellen: Schnappschuss laden und alle Journal-Einträge mit höherer Nummer als
+'journal_bis' nachspielen. Eine nach einem Absturz abgeschnittene letzte Zeile wird ignoriert;
+stürzt das Programm zwischen Schnappschuss und Leeren des Journals ab, überspringt die
+Nummer die schon enthaltenen Einträge.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+
+from dateien import schreibe_atomar
+
+logger = logging.getLogger(__name__)
+
+KOMPAKTIEREN_AB = 5000  # Änderungen (Prüflinge) im Journal, danach neuer Schnappschuss
+
+
+def anwenden(zustand: dict, eintrag: dict) -> None:
+    """Spielt einen Journal-Eintrag auf einen Sitzungszustand (Format der Sitzungsdatei) nach."""
+    art = eintrag["art"]
+    namen = zustand.setdefault("prueflinge", [])
+    if art == "kandidaten_einfuegen":
+        namen[eintrag["zeile"]:eintrag["zeile"]] = eintrag["namen"]
+    elif art == "kandidaten_entfernen":
+        del namen[eintrag["zeile"]:eintrag["zeile"] + eintrag["anzahl"]]
+    elif art == "kandidaten_aendern":
+        namen[eintrag["zeile"]:eintrag["zeile"] + len(eintrag["namen"])] = eintrag["namen"]
+    elif art in ("korrektoren", "datum1", "datum2"):
+        zustand[art] = eintrag["wert"]
+    else:
+        raise ValueError(f"unbekannter Journal-Eintrag '{art}'")
+
+
+def lese_sitzung(sitzungsdatei, journaldatei) -> tuple[dict | None, int]:
+    """
+    Schnappschuss mit nachgespieltem Journal (None ohne lesbaren Schnappschuss)
+    und Anzahl der nachgespielten Einträge.
+    """
+    try:
+        with open(sitzungsdatei, "r", encoding="utf-8") as f:
+            zustand = json.load(f)
+    except FileNotFoundError:
+        return None, 0
+
+    bis = zustand.get("journal_bis", 0)
+    nachgespielt = 0
+    try:
+        with open(journaldatei, "r", encoding="utf-8") as f:
+            for zeile in f:
+                try:
+                    eintrag = json.loads(zeile)
+                except json.JSONDecodeError:
+                    logger.warning("Journal endet mit unvollständigem Eintrag, Rest wird ignoriert")
+                    break
+                if eintrag["nr"] <= bis:
+                    continue
+                anwenden(zustand, eintrag)
+                zustand["journal_bis"] = bis = eintrag["nr"]
+                nachgespielt += 1
+    except FileNotFoundError:
+        pass
+    return zustand, nachgespielt
+
+
+def letzte_nummer(sitzungsdatei, journaldatei) -> int:
+    """Höchste vergebene Nummer aus Schnappschuss und Journal (neue Einträge zählen dort weiter)."""
+    nummer = 0
+    try:
+        with open(sitzungsdatei, "r", encoding="utf-8") as f:
+            nummer = json.load(f).get("journal_bis", 0)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(journaldatei, "r", encoding="utf-8") as f:
+            for zeile in f:
+                try:
+                    nummer = max(nummer, json.loads(zeile)["nr"])
+                except (ValueError, KeyError):
+                    break
+    except OSError:
+        pass
+    return nummer
+
+
+class SitzungsJournal:
+    def __init__(self, sitzungsdatei, journaldatei, nummer=0):
+        self.sitzungsdatei = sitzungsdatei
+        self.journaldatei = journaldatei
+        self.nummer = nummer        # Nummer des letzten Eintrags
+        self.unkompaktiert = 0      # Änderungen seit dem letzten Schnappschuss
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._schreiben, name="SitzungsJournal", daemon=True)
+        self._thread.start()
+
+    def aufzeichnen(self, art, umfang=1, **daten) -> bool:
+        """Hängt eine Änderung an; True, wenn ein neuer Schnappschuss fällig ist."""
+        self.nummer += 1
+        self.unkompaktiert += umfang
+        self._queue.put(("eintrag", {"nr": self.nummer, "art": art, **daten}))
+        return self.unkompaktiert >= KOMPAKTIEREN_AB
+
+    def schnappschuss(self, zustand: dict) -> None:
+        """Schreibt zustand als neue Sitzungsdatei; das Journal beginnt danach leer."""
+        self.unkompaktiert = 0
+        self._queue.put(("schnappschuss", {**zustand, "journal_bis": self.nummer}))
+
+    def beenden(self) -> None:
+        """Wartet, bis alles geschrieben ist."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _schreiben(self):
+        datei = open(self.journaldatei, "a", encoding="utf-8")
+        try:
+            while (auftrag := self._queue.get()) is not None:
+                art, daten = auftrag
+                try:
+                    if art == "eintrag":
+                        datei.write(json.dumps(daten, ensure_ascii=False) + "\n")
+                    else:
+                        schreibe_atomar(self.sitzungsdatei, json.dumps(daten, ensure_ascii=False).encode("utf-8"))
+                        datei.close()
+                        datei = open(self.journaldatei, "w", encoding="utf-8")
+                    # Erst wenn nichts mehr ansteht auf die Platte bringen
+                    if self._queue.empty():
+                        datei.flush()
+                        os.fsync(datei.fileno())
+                except Exception:
+                    logger.exception("Fehler beim automatischen Speichern der Sitzung")
+        finally:
+            datei.close()
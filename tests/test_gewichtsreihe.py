@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pytest
+
+from benchmark.generator import erzeuge_instanz
+from gewichtsreihe import VERHAELTNISSE, loese_abschnitt, pareto_front
+from modell import Instanz
+
+
+def _plan(anwesenheit, abweichung):
+    return SimpleNamespace(messung={"gewichtsreihe": {"anwesenheit": anwesenheit, "abweichung": abweichung}})
+
+
+def _werte(ergebnis):
+    werte = ergebnis.messung["gewichtsreihe"]
+    return werte["anwesenheit"], round(werte["abweichung"], 6)
+
+
+def _dominiert(a, b):
+    """a wird von b geschlagen."""
+    return b[0] <= a[0] and b[1] <= a[1] and b != a
+
+
+def test_pareto_front_behaelt_nicht_dominierte():
+    plaene = [_plan(10, 0.0), _plan(8, 8.0), _plan(6, 8.0), _plan(8, 2.0), _plan(6, 8.0)]
+    assert [_werte(p) for p in pareto_front(plaene)] == [(6, 8.0), (8, 2.0), (10, 0.0)]
+
+
+def test_gewichtsreihe_slots_front():
+    instanz = Instanz.aus_eingabedaten(erzeuge_instanz(16, 5, 2, "voll", 8, 1))
+    ergebnisse = loese_abschnitt(instanz, "slots", VERHAELTNISSE, zeitlimit=5)
+    assert ergebnisse
+
+    # Kennzahlen wie im Slot-Modell gezählt: ergeben zusammen dessen Zielwert
+    for ergebnis in ergebnisse:
+        werte = ergebnis.messung["gewichtsreihe"]
+        assert werte["abweichung"] + werte["verhaeltnis"] * werte["anwesenheit"] == pytest.approx(
+            ergebnis.messung["solver"]["zielwert"], abs=1e-6)
+
+    front = {_werte(e) for e in pareto_front(ergebnisse)}
+    alle = {_werte(e) for e in ergebnisse}
+    assert front == {a for a in alle if not any(_dominiert(a, b) for b in alle)}
+    assert len(front) > 1
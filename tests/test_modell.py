@@ -0,0 +1,46 @@
+from modell import Instanz, Kandidat, KandidatenIndex
+from validierung import pruefe_kandidaten
+
+ZEILEN = [
+    "Muster, Max (1001)",
+    "",
+    "Beispiel, Erika (1002)",
+    "ohne Nummer",
+    "Muster, Moritz (1001)",
+]
+
+
+def test_kandidat_aus_zeile():
+    assert Kandidat.aus_zeile("  Muster , Max (1001) ") == Kandidat("Muster , Max (1001)", "Muster", "Max", "1001")
+    assert Kandidat.aus_zeile("ohne Nummer").nummer is None
+
+
+def test_index_doppelte_nummer():
+    index = KandidatenIndex.aus_zeilen(ZEILEN)
+    # Leerzeilen zählen nicht, Zeilennummern beziehen sich auf die ganze Liste
+    assert index.zeilen == [1, 3, 4, 5]
+    assert index.nach_nummer == {"1001": 0, "1002": 1}
+    assert index.doppelt == {"1001": [1, 5]}
+    assert index.ohne_nummer == [4]
+    assert pruefe_kandidaten(index) == ["Prüflingsnummer 1001 mehrfach (Zeilen 1, 5)"]
+
+
+def test_index_ids_in_listenreihenfolge():
+    ids = KandidatenIndex.aus_zeilen(ZEILEN).ids()
+    assert ids == ["1001", "1002", "Zeile 4", "Zeile 5"]
+    assert len(set(ids)) == len(ids)
+
+
+def test_index_als_eingabedaten():
+    index = KandidatenIndex.aus_zeilen(ZEILEN)
+    kandidaten = index.als_eingabedaten()
+    assert list(kandidaten.values()) == [k.text for k in index.kandidaten]
+
+    instanz = Instanz.aus_eingabedaten({
+        "verfügbarkeiten": {"Korrektor": ["01.06.2026"]},
+        "kandidaten": kandidaten,
+        "pruefungstage": ["01.06.2026", "02.06.2026"],
+        "zeitslots": [["09:00"], ["09:00"]]
+    })
+    assert instanz.kandidaten_ids == tuple(index.ids())
+    assert instanz.als_eingabedaten()["kandidaten"] == kandidaten
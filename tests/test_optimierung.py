@@ -0,0 +1,80 @@
+from array import array
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from optimierung import ENGINES, _spuren_aus_ergebnis, erklaere_unloesbarkeit
+from validierung import MIN_ANWESEND, NichtLoesbar, bewerte_plan, pruefe_plan
+
+TAGE = ["01.06.2026", "02.06.2026"]
+
+
+def _eingabedaten(n_kandidaten, n_korrektoren=3, pro_klausur=2, nur_erster_tag=0):
+    return {
+        "verfügbarkeiten": {
+            f"Korrektor {p + 1}": TAGE[:1] if p >= n_korrektoren - nur_erster_tag else list(TAGE)
+            for p in range(n_korrektoren)
+        },
+        "kandidaten": {str(k + 1): f"Prüfling {k + 1}" for k in range(n_kandidaten)},
+        "pruefungstage": list(TAGE),
+        "anzahl_korrektoren_pro_klausur": pro_klausur,
+        "zeitslots": [["09:00", "10:00", "11:00"], ["09:00", "10:00", "11:00"]]
+    }
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("n_kandidaten", [1, 2, 3])
+def test_wenige_pruefungen_je_tag(engine, n_kandidaten):
+    # Je Tag höchstens 2 x 2 Korrektorplätze, aber MIN_ANWESEND Anwesende: wer keine Prüfung hat, ist trotzdem da
+    ergebnis = ENGINES[engine](_eingabedaten(n_kandidaten), zeitlimit=5)
+    assert pruefe_plan(ergebnis) == []
+    assert bewerte_plan(ergebnis) == pytest.approx(ergebnis.messung["solver"]["zielwert"], abs=1e-6)
+    assert MIN_ANWESEND > 2 * min(ergebnis.statistik["klausuren_pro_tag"])
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_erklaerung_loesbar(engine):
+    assert erklaere_unloesbarkeit(_eingabedaten(4), zeitlimit=5, engine=engine) == []
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_erklaerung_zu_wenige_anwesende(engine):
+    # Der letzte Korrektor kann nur am ersten Tag, am zweiten sind nur 2 da
+    gruende = erklaere_unloesbarkeit(_eingabedaten(4, nur_erster_tag=1), zeitlimit=5, engine=engine)
+    assert gruende == [f"Tag 2 ({TAGE[1]}): nur 2 Korrektoren verfügbar, mindestens {MIN_ANWESEND} nötig"]
+
+
+def test_erklaerung_slots_unbesetzte_plaetze():
+    # 4 Korrektoren je Prüfung, am zweiten Tag nur 3 verfügbar: je Slot bleibt ein Platz frei
+    eingabedaten = _eingabedaten(4, n_korrektoren=5, pro_klausur=4, nur_erster_tag=2)
+    assert erklaere_unloesbarkeit(eingabedaten, zeitlimit=5, engine="milp") == []
+    assert erklaere_unloesbarkeit(eingabedaten, zeitlimit=5, engine="slots") == [
+        f"Tag 2 ({TAGE[1]}): 2 Korrektorplätze in den Zeitslots unbesetzt "
+        f"(nur 3 Korrektoren verfügbar, je Prüfung 4 verschiedene nötig)"
+    ]
+
+
+def test_unloesbar_mit_gruenden():
+    with pytest.raises(NichtLoesbar) as fehler:
+        ENGINES["slots"](_eingabedaten(4, n_korrektoren=5, pro_klausur=4, nur_erster_tag=2), zeitlimit=5)
+    assert fehler.value.gruende
+    assert "Status" not in str(fehler.value)
+
+
+def test_startloesung_nur_aus_vollem_slot_plan():
+    eingabedaten = _eingabedaten(6, n_korrektoren=4)
+    slots = ENGINES["slots"](eingabedaten, zeitlimit=5)
+    milp = ENGINES["milp"](eingabedaten, zeitlimit=5)
+    tag_verfuegbarkeit = [slots.instanz.korrektoren_an_tag(t) for t in range(2)]
+    quoten = tuple(int(n) for n in slots.statistik["klausuren_pro_tag"])
+
+    werte = _spuren_aus_ergebnis(slots, tag_verfuegbarkeit, quoten)
+    assert sum(werte.values()) == slots.instanz.anzahl_korrektoren_pro_klausur * len(slots.instanz.kandidaten)
+    assert _spuren_aus_ergebnis(milp, tag_verfuegbarkeit, quoten) is None
+
+    # Letzter Slot des zweiten Tages nur mit einem Korrektor: Spur nicht voll
+    zuordnung = slots.matrix().copy()
+    zuordnung[-1, np.flatnonzero(zuordnung[-1])[0]] = 0
+    teilweise = replace(slots, zuordnung=array("B", zuordnung.tobytes()))
+    assert _spuren_aus_ergebnis(teilweise, tag_verfuegbarkeit, quoten) is None
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+import dateien
+from dateien import schreibe_atomar
+from sitzungsJournal import SitzungsJournal, lese_sitzung
+
+
+def _schreibe(pfad, zeilen):
+    pfad.write_text("".join(zeilen), encoding="utf-8")
+
+
+def _eintrag(nr, art, **daten):
+    return json.dumps({"nr": nr, "art": art, **daten}, ensure_ascii=False) + "\n"
+
+
+@pytest.fixture
+def dateipfade(tmp_path):
+    return tmp_path / "sitzung.json", tmp_path / "sitzung.journal"
+
+
+def test_abgeschnittene_letzte_zeile(dateipfade):
+    sitzung, journal = dateipfade
+    _schreibe(sitzung, [json.dumps({"prueflinge": ["A"], "journal_bis": 0})])
+    _schreibe(journal, [
+        _eintrag(1, "kandidaten_einfuegen", zeile=1, namen=["B", "C"]),
+        _eintrag(2, "datum1", wert="2026-06-01"),
+        _eintrag(3, "kandidaten_entfernen", zeile=0, anzahl=1)[:20],   # Absturz beim Schreiben
+    ])
+    zustand, nachgespielt = lese_sitzung(sitzung, journal)
+    assert nachgespielt == 2
+    assert zustand == {"prueflinge": ["A", "B", "C"], "datum1": "2026-06-01", "journal_bis": 2}
+
+
+def test_nachspielen_auf_schnappschuss(dateipfade):
+    sitzung, journal = dateipfade
+    # Absturz nach dem Schnappschuss, aber vor dem Leeren des Journals: 1 und 2 sind schon enthalten
+    _schreibe(sitzung, [json.dumps({"prueflinge": ["A", "X"], "korrektoren": [], "journal_bis": 2})])
+    _schreibe(journal, [
+        _eintrag(1, "kandidaten_einfuegen", zeile=0, namen=["A"]),
+        _eintrag(2, "kandidaten_einfuegen", zeile=1, namen=["B"]),
+        _eintrag(3, "kandidaten_aendern", zeile=1, namen=["B"]),
+        _eintrag(4, "korrektoren", wert=[{"name": "Korrektor 1"}]),
+    ])
+    zustand, nachgespielt = lese_sitzung(sitzung, journal)
+    assert nachgespielt == 2
+    assert zustand == {"prueflinge": ["A", "B"], "korrektoren": [{"name": "Korrektor 1"}], "journal_bis": 4}
+
+
+def test_ohne_schnappschuss(dateipfade):
+    sitzung, journal = dateipfade
+    _schreibe(journal, [_eintrag(1, "datum1", wert="2026-06-01")])
+    assert lese_sitzung(sitzung, journal) == (None, 0)
+
+
+def test_journal_schreiben_und_lesen(dateipfade):
+    sitzung, journal = dateipfade
+    aufzeichnung = SitzungsJournal(sitzung, journal)
+    aufzeichnung.aufzeichnen("kandidaten_einfuegen", zeile=0, namen=["A", "B"])
+    aufzeichnung.schnappschuss({"prueflinge": ["A", "B"]})
+    aufzeichnung.aufzeichnen("kandidaten_entfernen", zeile=0, anzahl=1)
+    aufzeichnung.beenden()
+
+    assert [json.loads(z)["nr"] for z in journal.read_text(encoding="utf-8").splitlines()] == [2]
+    assert lese_sitzung(sitzung, journal) == ({"prueflinge": ["B"], "journal_bis": 2}, 1)
+
+
+@pytest.mark.parametrize("wo", ["fsync", "replace"])
+def test_schreibe_atomar_unterbrochen(tmp_path, monkeypatch, wo):
+    pfad = tmp_path / "sitzung.json"
+    schreibe_atomar(pfad, b'{"prueflinge": ["A"]}')
+
+    def absturz(*args):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(dateien.os, wo, absturz)
+    with pytest.raises(KeyboardInterrupt):
+        schreibe_atomar(pfad, b'{"prueflinge": ["A", "B"]}')
+    monkeypatch.undo()
+
+    assert pfad.read_bytes() == b'{"prueflinge": ["A"]}'
+    assert os.listdir(tmp_path) == ["sitzung.json"]    # keine temporäre Datei übrig
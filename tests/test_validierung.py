@@ -0,0 +1,61 @@
+from modell import Instanz
+from validierung import MIN_ANWESEND, pruefe_instanz
+
+SLOTS = ("09:00", "10:00", "11:00", "12:00")
+
+
+def _instanz(n_kandidaten=4, n_korrektoren=4, tage=("01.06.2026", "02.06.2026"), verfuegbarkeit=None,
+             zeitslots=(SLOTS, SLOTS), pro_klausur=2):
+    return Instanz(
+        korrektoren=tuple(f"Korrektor {p + 1}" for p in range(n_korrektoren)),
+        kandidaten=tuple(f"Prüfling {k + 1}" for k in range(n_kandidaten)),
+        tage=tage,
+        verfuegbarkeit=verfuegbarkeit or (0b11,) * n_korrektoren,
+        zeitslots=zeitslots,
+        anzahl_korrektoren_pro_klausur=pro_klausur
+    )
+
+
+def test_gueltige_instanz():
+    assert pruefe_instanz(_instanz()) == []
+    assert pruefe_instanz(_instanz(), "slots") == []
+
+
+def test_keine_kandidaten():
+    assert pruefe_instanz(_instanz(n_kandidaten=0)) == ["Keine Prüflinge eingetragen"]
+
+
+def test_zu_wenige_korrektoren():
+    gruende = pruefe_instanz(_instanz(n_korrektoren=3, pro_klausur=4))
+    assert gruende == ["Nur 3 Korrektoren eingetragen, je Prüfung werden 4 gebraucht"]
+
+
+def test_gleiche_tage():
+    assert pruefe_instanz(_instanz(tage=("01.06.2026", "01.06.2026"))) == ["Die Prüfungstage müssen verschieden sein"]
+
+
+def test_zu_wenige_verfuegbar():
+    # Korrektor 3 und 4 nur am ersten Tag
+    gruende = pruefe_instanz(_instanz(verfuegbarkeit=(0b11, 0b11, 0b01, 0b01)))
+    assert gruende == [f"Tag 2 (02.06.2026): nur 2 Korrektoren verfügbar (Korrektor 1, Korrektor 2), "
+                       f"mindestens {MIN_ANWESEND} nötig"]
+
+
+def test_mehr_pruefungen_als_zeitslots():
+    gruende = pruefe_instanz(_instanz(n_kandidaten=7, zeitslots=(SLOTS[:3], SLOTS)))
+    assert gruende == ["Tag 1 (01.06.2026): 4 Prüfungen, aber nur 3 Zeitslots"]
+
+
+def test_doppelte_zeitslots():
+    gruende = pruefe_instanz(_instanz(zeitslots=(SLOTS, ("09:00", "09:00", "10:00"))))
+    assert gruende == ["Tag 2 (02.06.2026): Zeitslots doppelt vergeben"]
+
+
+def test_slots_braucht_verfuegbare_je_pruefung():
+    # 4 Korrektoren je Prüfung, am zweiten Tag sind aber nur 3 da: das MILP-Modell setzt
+    # dort auch nicht verfügbare Korrektoren ein, das Slot-Modell nicht
+    instanz = _instanz(n_korrektoren=5, pro_klausur=4, verfuegbarkeit=(0b11, 0b11, 0b11, 0b01, 0b01))
+    assert pruefe_instanz(instanz) == []
+    assert pruefe_instanz(instanz, "slots") == [
+        "Tag 2 (02.06.2026): nur 3 Korrektoren verfügbar, mit Zeitslot-Planung werden je Prüfung 4 gebraucht"
+    ]
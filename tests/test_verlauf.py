@@ -0,0 +1,140 @@
+from array import array
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import verlauf
+from modell import Ergebnis, Instanz, berechne_statistik
+from verlauf import PDF_AUFBEWAHREN_TAGE, PDF_MINDESTENS, Verlauf
+
+JETZT = datetime(2026, 6, 1, 12, 0, 0)
+
+
+class Uhr(datetime):
+    """Ersetzt verlauf.datetime, damit die Zeitpunkte der Einträge feststehen."""
+    jetzt = JETZT
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.jetzt
+
+
+def _ergebnis(nr=0, engine="milp", tage=("2026-06-08", "2026-06-09")):
+    instanz = Instanz(
+        korrektoren=("Müller, Jörg", "Schmidt, Anna", "Weber, Tom"),
+        kandidaten=(f"Kandidat, Erster ({1000 + nr})", "Kandidat, Zweiter (2000)"),
+        tage=tage,
+        verfuegbarkeit=(0b11, 0b11, 0b01),
+        zeitslots=(("09:00", "10:00"), ("09:00", "10:00")),
+        kandidaten_ids=(str(1000 + nr), "2000")
+    )
+    matrix = np.array([[1, 1, 0], [0, 1, 1]], dtype=np.uint8)
+    tag = np.array([0, 1], dtype=np.int8)
+    return Ergebnis(
+        instanz=instanz,
+        zuordnung=array("B", matrix.tobytes()),
+        tag=array("b", tag.tobytes()),
+        slot=array("h", [0, 0]),
+        status="Optimal",
+        dauer=1.5,
+        statistik=berechne_statistik(matrix, tag, 2),
+        messung={"gesamt": 2.0},
+        engine=engine
+    )
+
+
+@pytest.fixture
+def pfad(tmp_path, monkeypatch):
+    monkeypatch.setattr(verlauf, "datetime", Uhr)
+    Uhr.jetzt = JETZT
+    return tmp_path / "verlauf.sqlite"
+
+
+def test_speichern_und_laden(pfad):
+    ergebnis = _ergebnis(engine="slots")
+    schreiber = Verlauf(pfad)
+    schluessel = schreiber.speichern(ergebnis, ausschuss="Ausschuss 1")
+    schreiber.schliessen()
+
+    gelesen = Verlauf(pfad)
+    [lauf] = gelesen.suchen()
+    assert lauf["ausschuss"] == "Ausschuss 1"
+    assert lauf["pruefungstag"] == "2026-06-08"
+    assert lauf["engine"] == "slots"
+    assert not lauf["pdf"]
+
+    geladen = gelesen.laden(lauf["id"])
+    assert geladen.fingerprint() == schluessel == ergebnis.fingerprint()
+    assert geladen.instanz == ergebnis.instanz
+    assert geladen.plan() == ergebnis.plan()
+    assert (geladen.status, geladen.dauer, geladen.messung, geladen.engine) == ("Optimal", 1.5, {"gesamt": 2.0}, "slots")
+    assert all(np.array_equal(geladen.statistik[k], ergebnis.statistik[k]) for k in ergebnis.statistik)
+    with pytest.raises(KeyError):
+        gelesen.laden(lauf["id"] + 1)
+    gelesen.schliessen()
+
+
+def test_gleiches_ergebnis_nur_einmal(pfad):
+    schreiber = Verlauf(pfad)
+    schreiber.speichern(_ergebnis())
+    Uhr.jetzt = JETZT + timedelta(hours=1)
+    schreiber.speichern(_ergebnis())
+    schreiber.speichern(_ergebnis(nr=1))
+    schreiber.schliessen()
+
+    gelesen = Verlauf(pfad)
+    laeufe = gelesen.suchen()
+    # Über den Fingerprint erkannt: ein Eintrag je Ergebnis, mit dem Zeitpunkt des letzten Speicherns
+    assert [lauf["erstellt"] for lauf in laeufe] == [(JETZT + timedelta(hours=1)).isoformat()] * 2
+    assert {gelesen.laden(lauf["id"]).fingerprint() for lauf in laeufe} == {
+        _ergebnis().fingerprint(), _ergebnis(nr=1).fingerprint()
+    }
+    gelesen.schliessen()
+
+
+def test_suchen(pfad):
+    schreiber = Verlauf(pfad)
+    schreiber.speichern(_ergebnis(), ausschuss="A")
+    schreiber.speichern(_ergebnis(nr=1, tage=("2026-07-01", "2026-07-02")), ausschuss="B")
+    schreiber.schliessen()
+
+    gelesen = Verlauf(pfad)
+    assert len(gelesen.suchen("jörg müll")) == 2
+    assert len(gelesen.suchen("1001")) == 1
+    assert gelesen.suchen("meier") == []
+    assert [lauf["ausschuss"] for lauf in gelesen.suchen(ausschuss="B")] == ["B"]
+    assert [lauf["ausschuss"] for lauf in gelesen.suchen(von="2026-06-01", bis="2026-06-30")] == ["A"]
+    gelesen.schliessen()
+
+
+def test_pdf_aufbewahrung(pfad):
+    alt = JETZT - timedelta(days=PDF_AUFBEWAHREN_TAGE + 20)
+    anzahl_alt, anzahl_neu = PDF_MINDESTENS + 2, 3
+    schreiber = Verlauf(pfad)
+    for nr in range(anzahl_alt + anzahl_neu):
+        Uhr.jetzt = (alt if nr < anzahl_alt else JETZT) + timedelta(minutes=nr)
+        schluessel = schreiber.speichern(_ergebnis(nr))
+        schreiber.pdf_speichern(schluessel, f"PDF {nr}".encode())
+    schreiber.schliessen()
+
+    gelesen = Verlauf(pfad)
+    laeufe = gelesen.suchen()
+    assert len(laeufe) == anzahl_alt + anzahl_neu     # die Pläne bleiben
+    pdfs = [gelesen.pdf(lauf["id"]) for lauf in laeufe]
+    # Die neuesten PDF_MINDESTENS bleiben, obwohl die meisten älter als PDF_AUFBEWAHREN_TAGE sind
+    erwartet = [f"PDF {nr}".encode() for nr in reversed(range(anzahl_alt + anzahl_neu))][:PDF_MINDESTENS]
+    assert pdfs == erwartet + [None] * (anzahl_alt + anzahl_neu - PDF_MINDESTENS)
+    gelesen.schliessen()
+
+
+def test_pdf_innerhalb_der_frist_bleibt(pfad):
+    schreiber = Verlauf(pfad)
+    for nr in range(PDF_MINDESTENS + 5):
+        Uhr.jetzt = JETZT - timedelta(days=PDF_AUFBEWAHREN_TAGE - 1) + timedelta(minutes=nr)
+        schreiber.pdf_speichern(schreiber.speichern(_ergebnis(nr)), b"PDF")
+    schreiber.schliessen()
+
+    gelesen = Verlauf(pfad)
+    assert all(lauf["pdf"] for lauf in gelesen.suchen())
+    gelesen.schliessen()
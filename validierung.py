@@ -0,0 +1,175 @@
+"""
+Regeln des Modells außerhalb des Solvers:
+- pruefe_instanz: schnelle Vorprüfung der Eingabe auf strukturelle Unlösbarkeit
+- pruefe_kandidaten: doppelte Prüflingsnummern in der Prüflingsliste
+- pruefe_plan / bewerte_plan / kennzahlen: Prüfung und Bewertung eines fertigen Plans,
+  unabhängig davon, welche Engine ihn erzeugt hat
+"""
+import numpy as np
+
+from modell import Ergebnis, Instanz, KandidatenIndex, berechne_statistik
+
+MIN_ANWESEND = 3        # Korrektoren je Prüfungstag
+GEWICHT_ABWEICHUNG = 1.0
+GEWICHT_ANWESENHEIT = 0.1
+
+
+def tagesquoten(n_kandidaten: int) -> tuple[int, int]:
+    """Aufteilung der Prüflinge auf die beiden Tage (erster Tag bekommt den Rest)."""
+    tag1 = (n_kandidaten + 1) // 2
+    return tag1, n_kandidaten - tag1
+
+
+class NichtLoesbar(ValueError):
+    """Die Eingabe kann keinen gültigen Plan haben; gruende enthält die einzelnen Meldungen."""
+
+    def __init__(self, gruende):
+        self.gruende = list(gruende)
+        super().__init__("Eingaben nicht lösbar: " + "; ".join(self.gruende))
+
+    def __reduce__(self):
+        # Damit die Gründe aus einem Rechenprozess (Prozesspool) unverändert ankommen
+        return NichtLoesbar, (self.gruende,)
+
+
+def pruefe_instanz(instanz: Instanz, engine="milp") -> list[str]:
+    """
+    Findet in linearer Zeit Eingaben, für die das Modell der Engine (siehe optimierung.ENGINES)
+    sicher unlösbar ist (leere Liste = keine strukturellen Probleme gefunden).
+    """
+    gruende = []
+    n_kandidaten = len(instanz.kandidaten)
+    n_korrektoren = len(instanz.korrektoren)
+    pro_klausur = instanz.anzahl_korrektoren_pro_klausur
+
+    if n_kandidaten == 0:
+        gruende.append("Keine Prüflinge eingetragen")
+    if n_korrektoren < pro_klausur:
+        gruende.append(f"Nur {n_korrektoren} Korrektoren eingetragen, je Prüfung werden {pro_klausur} gebraucht")
+    if len(set(instanz.tage)) != len(instanz.tage):
+        gruende.append("Die Prüfungstage müssen verschieden sein")
+
+    quoten = tagesquoten(n_kandidaten) if len(instanz.tage) == 2 else (0,) * len(instanz.tage)
+    for t, datum in enumerate(instanz.tage):
+        verfuegbar = [instanz.korrektoren[p] for p in range(n_korrektoren) if instanz.verfuegbar(p, t)]
+        if len(verfuegbar) < MIN_ANWESEND:
+            wer = f" ({', '.join(verfuegbar)})" if verfuegbar else ""
+            gruende.append(f"Tag {t + 1} ({datum}): nur {len(verfuegbar)} Korrektoren verfügbar{wer}, "
+                           f"mindestens {MIN_ANWESEND} nötig")
+        elif engine == "slots" and quoten[t] and len(verfuegbar) < pro_klausur:
+            # Im Slot-Modell korrigieren nur an diesem Tag verfügbare Korrektoren, je Slot verschiedene
+            gruende.append(f"Tag {t + 1} ({datum}): nur {len(verfuegbar)} Korrektoren verfügbar, "
+                           f"mit Zeitslot-Planung werden je Prüfung {pro_klausur} gebraucht")
+        if quoten[t] > len(instanz.zeitslots[t]):
+            gruende.append(f"Tag {t + 1} ({datum}): {quoten[t]} Prüfungen, aber nur "
+                           f"{len(instanz.zeitslots[t])} Zeitslots")
+        if len(set(instanz.zeitslots[t])) != len(instanz.zeitslots[t]):
+            gruende.append(f"Tag {t + 1} ({datum}): Zeitslots doppelt vergeben")
+
+    return gruende
+
+
+def pruefe_kandidaten(index: KandidatenIndex) -> list[str]:
+    """Meldungen für Prüflingsnummern, die mehrfach in der Liste stehen (leere Liste = keine)."""
+    return [
+        f"Prüflingsnummer {nummer} mehrfach (Zeilen {', '.join(str(z) for z in zeilen)})"
+        for nummer, zeilen in index.doppelt.items()
+    ]
+
+
+def _verfuegbarkeit(instanz) -> np.ndarray:
+    """Korrektoren x Tage, True = verfügbar."""
+    masken = np.array(instanz.verfuegbarkeit, dtype=np.int64)
+    return (masken[:, None] >> np.arange(len(instanz.tage))) & 1 == 1
+
+
+def _anwesenheit(ergebnis: Ergebnis) -> np.ndarray:
+    """
+    Anwesenheit (Korrektoren x Tage) so, wie die Engine des Plans sie zählt:
+    - slots: an Tagen mit eigenem Block, also mit Arbeit an diesem Tag (statistik["anwesend"])
+    - milp:  wer überhaupt korrigiert, ist an allen verfügbaren Tagen da
+    Fehlen an einem Tag Anwesende für MIN_ANWESEND, kommen verfügbare Korrektoren ohne Arbeit dazu.
+    """
+    instanz = ergebnis.instanz
+    verfuegbar = _verfuegbarkeit(instanz)
+    if ergebnis.engine == "slots":
+        statistik = ergebnis.statistik or berechne_statistik(
+            ergebnis.matrix(), np.frombuffer(ergebnis.tag, dtype=np.int8), len(instanz.tage))
+        anwesend = verfuegbar & np.asarray(statistik["anwesend"], dtype=bool)
+    else:
+        belastung = ergebnis.matrix().sum(axis=0)
+        anwesend = verfuegbar & (belastung > 0)[:, None]
+    for t in range(len(instanz.tage)):
+        frei = np.flatnonzero(verfuegbar[:, t] & ~anwesend[:, t])
+        anwesend[frei[:max(0, MIN_ANWESEND - anwesend[:, t].sum())], t] = True
+    return anwesend
+
+
+def pruefe_plan(ergebnis: Ergebnis) -> list[str]:
+    """Liefert die Regelverstöße eines Plans (leere Liste = gültig)."""
+    instanz = ergebnis.instanz
+    n_kandidaten = len(instanz.kandidaten)
+    n_tage = len(instanz.tage)
+    x = ergebnis.matrix()
+    tag = np.frombuffer(ergebnis.tag, dtype=np.int8)
+    slot = np.frombuffer(ergebnis.slot, dtype=np.int16)
+    verfuegbar = _verfuegbarkeit(instanz)
+    fehler = []
+
+    # Je Prüfung genau anzahl_korrektoren_pro_klausur verschiedene Korrektoren
+    pro_klausur = x.sum(axis=1)
+    for k in np.flatnonzero(pro_klausur != instanz.anzahl_korrektoren_pro_klausur):
+        fehler.append(f"{instanz.kandidaten[k]}: {pro_klausur[k]} statt "
+                      f"{instanz.anzahl_korrektoren_pro_klausur} Korrektoren")
+
+    # Jede Prüfung an genau einem Tag, mit mindestens einem dort verfügbaren Korrektor
+    for k in np.flatnonzero((tag < 0) | (tag >= n_tage)):
+        fehler.append(f"{instanz.kandidaten[k]}: kein Prüfungstag")
+    for k in np.flatnonzero(tag >= 0):
+        if tag[k] < n_tage and not (x[k].astype(bool) & verfuegbar[:, tag[k]]).any():
+            fehler.append(f"{instanz.kandidaten[k]}: kein Korrektor am {instanz.tage[tag[k]]} verfügbar")
+
+    # Tagesquoten
+    if n_tage == 2:
+        for t, soll in enumerate(tagesquoten(n_kandidaten)):
+            ist = int((tag == t).sum())
+            if ist != soll:
+                fehler.append(f"{instanz.tage[t]}: {ist} statt {soll} Prüfungen")
+
+    # Mindestens MIN_ANWESEND Korrektoren je Tag
+    anwesend = _anwesenheit(ergebnis)
+    for t in range(n_tage):
+        if anwesend[:, t].sum() < MIN_ANWESEND:
+            fehler.append(f"{instanz.tage[t]}: nur {anwesend[:, t].sum()} Korrektoren anwesend "
+                          f"(mindestens {MIN_ANWESEND})")
+
+    # Zeitslots: gültiger Index, je Tag höchstens einmal belegt, belegt solange Slots frei sind
+    for t in range(n_tage):
+        am_tag = tag == t
+        belegt = slot[am_tag & (slot >= 0)]
+        if (belegt >= len(instanz.zeitslots[t])).any():
+            fehler.append(f"{instanz.tage[t]}: Slot-Index außerhalb der Zeitslots")
+        if len(np.unique(belegt)) != len(belegt):
+            fehler.append(f"{instanz.tage[t]}: Zeitslot mehrfach belegt")
+        ohne_slot = int((am_tag & (slot < 0)).sum())
+        if ohne_slot:
+            fehler.append(f"{instanz.tage[t]}: {ohne_slot} Prüfungen ohne Termin")
+
+    return fehler
+
+
+def kennzahlen(ergebnis: Ergebnis) -> tuple[float, int]:
+    """
+    Die beiden Teile der Zielfunktion: Abweichung von der mittleren Belastung (Summe) und
+    Anwesenheitstage, gezählt wie in der Engine des Plans (siehe _anwesenheit).
+    """
+    instanz = ergebnis.instanz
+    belastung = ergebnis.matrix().sum(axis=0)
+    mittel = instanz.anzahl_korrektoren_pro_klausur * len(instanz.kandidaten) / len(instanz.korrektoren)
+    return float(np.abs(belastung - mittel).sum()), int(_anwesenheit(ergebnis).sum())
+
+
+def bewerte_plan(ergebnis: Ergebnis, gewichte=(GEWICHT_ABWEICHUNG, GEWICHT_ANWESENHEIT)) -> float:
+    """Zielfunktion des Modells (Abweichung von der mittleren Belastung + Anwesenheit, gezählt wie in der Engine des Plans)."""
+    abweichung, anwesenheit = kennzahlen(ergebnis)
+    return float(gewichte[0] * abweichung + gewichte[1] * anwesenheit)
@@ -0,0 +1,223 @@
+"""
+Verlauf aller Läufe in einer lokalen SQLite-Datenbank (~/.pvihk_verlauf.sqlite):
+Eingabe, Plan, Kennzahlen und (sobald erzeugt) das PDF, damit ein alter Plan ohne
+erneutes Rechnen wieder geladen werden kann.
+
+- laeufe: ein Eintrag je Ergebnis (Ergebnis.fingerprint), indiziert nach Zeitpunkt,
+  Prüfungstag, Ausschuss und Eingabe-Fingerprint
+- namen:  Suchwörter (Korrektoren, Prüflinge) je Eingabe-Fingerprint, für die Suche nach Namen
+- pdfs:   PDF je Lauf; ältere werden nach PDF_AUFBEWAHREN_TAGE gelöscht,
+  die neuesten PDF_MINDESTENS bleiben immer (der Plan selbst bleibt, das PDF lässt sich neu erzeugen)
+
+Geschrieben wird in einem eigenen Thread mit eigener Verbindung, Lesen geht direkt (WAL-Modus).
+"""
+import json
+import logging
+import queue
+import re
+import sqlite3
+import threading
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from modell import Ergebnis, Instanz, berechne_statistik
+
+logger = logging.getLogger(__name__)
+
+VERLAUF_DATEI = Path.home() / ".pvihk_verlauf.sqlite"
+PDF_AUFBEWAHREN_TAGE = 180
+PDF_MINDESTENS = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS laeufe (
+    id INTEGER PRIMARY KEY,
+    schluessel TEXT NOT NULL UNIQUE,    -- Ergebnis.fingerprint()
+    fingerprint TEXT NOT NULL,          -- Instanz.fingerprint()
+    erstellt TEXT NOT NULL,
+    ausschuss TEXT NOT NULL,
+    pruefungstag TEXT NOT NULL,
+    status TEXT NOT NULL,
+    engine TEXT,
+    anzahl_kandidaten INTEGER NOT NULL,
+    anzahl_korrektoren INTEGER NOT NULL,
+    dauer REAL,
+    eingabe TEXT NOT NULL,
+    zuordnung BLOB NOT NULL,
+    tag BLOB NOT NULL,
+    slot BLOB NOT NULL,
+    messung TEXT
+);
+CREATE INDEX IF NOT EXISTS laeufe_erstellt ON laeufe(erstellt);
+CREATE INDEX IF NOT EXISTS laeufe_pruefungstag ON laeufe(pruefungstag);
+CREATE INDEX IF NOT EXISTS laeufe_ausschuss ON laeufe(ausschuss, erstellt);
+CREATE INDEX IF NOT EXISTS laeufe_fingerprint ON laeufe(fingerprint);
+
+CREATE TABLE IF NOT EXISTS namen (
+    fingerprint TEXT NOT NULL,
+    rolle INTEGER NOT NULL,             -- 0 = Korrektor, 1 = Prüfling
+    wort TEXT NOT NULL,
+    PRIMARY KEY (wort, rolle, fingerprint)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pdfs (
+    lauf INTEGER PRIMARY KEY REFERENCES laeufe(id) ON DELETE CASCADE,
+    erstellt TEXT NOT NULL,
+    daten BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pdfs_erstellt ON pdfs(erstellt);
+"""
+
+KORREKTOR, PRUEFLING = 0, 1
+
+
+def woerter(text: str) -> set[str]:
+    """Suchwörter eines Namens (klein, ohne Satzzeichen), z.B. 'Müller, Jörg (1000001)' -> müller, jörg, 1000001."""
+    return set(re.findall(r"\w+", text.casefold()))
+
+
+def _verbinden(pfad) -> sqlite3.Connection:
+    verbindung = sqlite3.connect(pfad, timeout=10)
+    verbindung.execute("PRAGMA journal_mode=WAL")
+    verbindung.execute("PRAGMA foreign_keys=ON")
+    return verbindung
+
+
+class Verlauf:
+    def __init__(self, pfad=VERLAUF_DATEI):
+        self.pfad = pfad
+        self._lesen = _verbinden(pfad)
+        self._lesen.row_factory = sqlite3.Row
+        self._lesen.executescript(SCHEMA)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._schreiben, name="Verlauf", daemon=True)
+        self._thread.start()
+
+    # --- Schreiben (im Verlauf-Thread) ---
+
+    def speichern(self, ergebnis: Ergebnis, ausschuss="", engine=None) -> str:
+        """Legt den Lauf ab (ein schon bekanntes Ergebnis bekommt nur den neuen Zeitpunkt); liefert den Schlüssel."""
+        schluessel = ergebnis.fingerprint()
+        self._queue.put((self._lauf_schreiben, (schluessel, ergebnis, ausschuss, engine or ergebnis.engine,
+                                                 datetime.now())))
+        return schluessel
+
+    def pdf_speichern(self, schluessel, pdf) -> None:
+        """PDF zum Lauf ablegen, pdf als Bytes oder Pfad einer PDF-Datei."""
+        self._queue.put((self._pdf_schreiben, (schluessel, pdf, datetime.now())))
+
+    def schliessen(self) -> None:
+        """Wartet, bis alles geschrieben ist."""
+        self._queue.put(None)
+        self._thread.join()
+        self._lesen.close()
+
+    def _schreiben(self):
+        verbindung = _verbinden(self.pfad)
+        try:
+            while (auftrag := self._queue.get()) is not None:
+                funktion, args = auftrag
+                try:
+                    with verbindung:
+                        funktion(verbindung, *args)
+                except Exception:
+                    logger.exception("Fehler beim Schreiben des Verlaufs")
+        finally:
+            verbindung.close()
+
+    @staticmethod
+    def _lauf_schreiben(verbindung, schluessel, ergebnis, ausschuss, engine, zeitpunkt):
+        instanz = ergebnis.instanz
+        erstellt = zeitpunkt.isoformat(timespec="seconds")
+        if verbindung.execute("UPDATE laeufe SET erstellt = ? WHERE schluessel = ?", (erstellt, schluessel)).rowcount:
+            return
+
+        fingerprint = instanz.fingerprint()
+        verbindung.execute(
+            "INSERT INTO laeufe (schluessel, fingerprint, erstellt, ausschuss, pruefungstag, status, engine,"
+            " anzahl_kandidaten, anzahl_korrektoren, dauer, eingabe, zuordnung, tag, slot, messung)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (schluessel, fingerprint, erstellt, ausschuss, min(instanz.tage, default=""), ergebnis.status, engine,
+             len(instanz.kandidaten), len(instanz.korrektoren), ergebnis.dauer,
+             json.dumps(instanz.als_eingabedaten(), ensure_ascii=False),
+             ergebnis.zuordnung.tobytes(), ergebnis.tag.tobytes(), ergebnis.slot.tobytes(),
+             json.dumps(ergebnis.messung, ensure_ascii=False, default=str))
+        )
+
+        # Suchwörter nur einmal je Eingabe
+        if verbindung.execute("SELECT 1 FROM namen WHERE fingerprint = ? LIMIT 1", (fingerprint,)).fetchone() is None:
+            zeilen = {(fingerprint, KORREKTOR, wort) for name in instanz.korrektoren for wort in woerter(name)}
+            zeilen |= {(fingerprint, PRUEFLING, wort) for name in instanz.kandidaten for wort in woerter(name)}
+            verbindung.executemany("INSERT OR IGNORE INTO namen VALUES (?, ?, ?)", zeilen)
+
+    @staticmethod
+    def _pdf_schreiben(verbindung, schluessel, pdf, zeitpunkt):
+        if not isinstance(pdf, bytes):
+            pdf = Path(pdf).read_bytes()
+        zeile = verbindung.execute("SELECT id FROM laeufe WHERE schluessel = ?", (schluessel,)).fetchone()
+        if zeile is None:
+            return
+        verbindung.execute("INSERT OR REPLACE INTO pdfs VALUES (?, ?, ?)",
+                           (zeile[0], zeitpunkt.isoformat(timespec="seconds"), pdf))
+
+        # Aufbewahrung: alte PDFs löschen, die neuesten bleiben immer
+        grenze = (zeitpunkt - timedelta(days=PDF_AUFBEWAHREN_TAGE)).isoformat(timespec="seconds")
+        verbindung.execute(
+            "DELETE FROM pdfs WHERE erstellt < ?"
+            " AND lauf NOT IN (SELECT lauf FROM pdfs ORDER BY erstellt DESC LIMIT ?)",
+            (grenze, PDF_MINDESTENS)
+        )
+
+    # --- Lesen ---
+
+    def suchen(self, text="", ausschuss=None, von=None, bis=None, grenze=500) -> list[dict]:
+        """
+        Läufe, neueste zuerst. text findet Korrektoren und Prüflinge über Wortanfänge
+        (alle Wörter müssen in derselben Eingabe vorkommen); von/bis grenzen den Prüfungstag ein.
+        """
+        bedingungen, parameter = [], []
+        for wort in sorted(woerter(text)):
+            bedingungen.append("fingerprint IN (SELECT fingerprint FROM namen WHERE wort >= ? AND wort < ?)")
+            parameter += [wort, wort + "\U0010ffff"]
+        if ausschuss is not None:
+            bedingungen.append("ausschuss = ?")
+            parameter.append(ausschuss)
+        if von:
+            bedingungen.append("pruefungstag >= ?")
+            parameter.append(von)
+        if bis:
+            bedingungen.append("pruefungstag <= ?")
+            parameter.append(bis)
+        sql = (
+            "SELECT id, erstellt, ausschuss, pruefungstag, status, engine, anzahl_kandidaten, anzahl_korrektoren,"
+            " EXISTS (SELECT 1 FROM pdfs WHERE lauf = laeufe.id) AS pdf FROM laeufe"
+            + (" WHERE " + " AND ".join(bedingungen) if bedingungen else "")
+            + " ORDER BY erstellt DESC LIMIT ?"
+        )
+        return [dict(zeile) for zeile in self._lesen.execute(sql, parameter + [grenze])]
+
+    def laden(self, lauf_id) -> Ergebnis:
+        """Baut das Ergebnis eines Laufs wieder auf (ohne Solver)."""
+        zeile = self._lesen.execute("SELECT * FROM laeufe WHERE id = ?", (lauf_id,)).fetchone()
+        if zeile is None:
+            raise KeyError(f"Lauf {lauf_id} nicht im Verlauf")
+        instanz = Instanz.aus_eingabedaten(json.loads(zeile["eingabe"]))
+        zuordnung, tag, slot = array("B", zeile["zuordnung"]), array("b", zeile["tag"]), array("h", zeile["slot"])
+        matrix = np.frombuffer(zuordnung, dtype=np.uint8).reshape(len(instanz.kandidaten), len(instanz.korrektoren))
+        return Ergebnis(
+            instanz=instanz,
+            zuordnung=zuordnung,
+            tag=tag,
+            slot=slot,
+            status=zeile["status"],
+            dauer=zeile["dauer"] or 0.0,
+            statistik=berechne_statistik(matrix, np.frombuffer(tag, dtype=np.int8), len(instanz.tage)),
+            messung=json.loads(zeile["messung"] or "{}"),
+            engine=zeile["engine"] or "milp"
+        )
+
+    def pdf(self, lauf_id) -> bytes | None:
+        zeile = self._lesen.execute("SELECT daten FROM pdfs WHERE lauf = ?", (lauf_id,)).fetchone()
+        return zeile[0] if zeile else None
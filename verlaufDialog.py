@@ -0,0 +1,83 @@
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView, QDialog, QDialogButtonBox, QHeaderView, QLineEdit, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+
+from verlauf import Verlauf
+
+SPALTEN = [("erstellt", "Erstellt"), ("ausschuss", "Ausschuss"), ("pruefungstag", "Prüfungstag"),
+           ("anzahl_kandidaten", "Prüflinge"), ("anzahl_korrektoren", "Korrektoren"),
+           ("status", "Status"), ("engine", "Engine"), ("pdf", "PDF")]
+
+
+class VerlaufDialog(QDialog):
+    """
+    Frühere Läufe aus dem Verlauf, durchsuchbar nach Korrektor oder Prüfling.
+    'Plan laden' zeigt den gespeicherten Plan ohne neue Optimierung, 'Eingaben übernehmen'
+    setzt zusätzlich Prüflinge, Korrektoren und Prüfungstage des Laufs.
+    """
+    plan_laden = Signal(int)
+    eingaben_laden = Signal(int)
+
+    def __init__(self, verlauf: Verlauf, parent=None):
+        super().__init__(parent)
+        self.verlauf = verlauf
+        self.setWindowTitle("Verlauf")
+        self.resize(820, 480)
+
+        self.suche = QLineEdit(self)
+        self.suche.setPlaceholderText("Korrektor oder Prüfling suchen (Wortanfänge, z.B. 'Müll Jö')")
+        self.suche.setClearButtonEnabled(True)
+
+        self.tabelle = QTableWidget(0, len(SPALTEN), self)
+        self.tabelle.setHorizontalHeaderLabels([titel for _, titel in SPALTEN])
+        self.tabelle.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tabelle.horizontalHeader().setStretchLastSection(True)
+        self.tabelle.verticalHeader().hide()
+        self.tabelle.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabelle.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tabelle.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabelle.doubleClicked.connect(lambda: self.ausgewaehlt(self.plan_laden))
+
+        knoepfe = QDialogButtonBox(QDialogButtonBox.Close, self)
+        plan = QPushButton("Plan laden")
+        eingaben = QPushButton("Eingaben übernehmen")
+        knoepfe.addButton(plan, QDialogButtonBox.ActionRole)
+        knoepfe.addButton(eingaben, QDialogButtonBox.ActionRole)
+        plan.clicked.connect(lambda: self.ausgewaehlt(self.plan_laden))
+        eingaben.clicked.connect(lambda: self.ausgewaehlt(self.eingaben_laden))
+        knoepfe.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.suche)
+        layout.addWidget(self.tabelle)
+        layout.addWidget(knoepfe)
+
+        # Suche entprellen
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(200)
+        self.timer.timeout.connect(self.aktualisieren)
+        self.suche.textChanged.connect(self.timer.start)
+        self.aktualisieren()
+
+    def aktualisieren(self):
+        laeufe = self.verlauf.suchen(self.suche.text())
+        self.tabelle.setRowCount(len(laeufe))
+        for zeile, lauf in enumerate(laeufe):
+            for spalte, (schluessel, _) in enumerate(SPALTEN):
+                wert = lauf[schluessel]
+                if schluessel == "pdf":
+                    wert = "ja" if wert else ""
+                elif schluessel == "ausschuss":
+                    wert = wert or "(Fenster)"
+                item = QTableWidgetItem("" if wert is None else str(wert))
+                item.setData(Qt.UserRole, lauf["id"])
+                self.tabelle.setItem(zeile, spalte, item)
+
+    def ausgewaehlt(self, signal):
+        item = self.tabelle.item(self.tabelle.currentRow(), 0)
+        if item is not None:
+            signal.emit(item.data(Qt.UserRole))
+            self.accept()